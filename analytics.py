@@ -0,0 +1,262 @@
+# analytics.py
+import heapq
+import json
+import math
+from persistence import atomic_write
+
+NO_TOPIC = "(주제 없음)"
+
+
+class QuantileSketch:
+    """풀이 시간 같은 양수 값의 분위수를 상대 오차 relative_accuracy 이내로 추정하는 로그 구간 스케치입니다.
+
+    값 x는 ceil(log_gamma(x)) 번 구간의 개수만 올리므로 추가는 O(1)이고, 구간 수는 값의 범위에
+    로그로만 늘어납니다 (1% 정확도로 0.01초 ~ 1시간이면 수백 개). 같은 정확도의 스케치끼리는
+    구간별 개수를 더하기만 하면 합쳐지므로 플레이어나 기간별 스케치를 나중에 합칠 수 있습니다.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value, count=1):
+        if value <= 0:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.count += count
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("정확도가 다른 스케치는 합칠 수 없습니다.")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q):
+        """q(0~1) 분위수의 추정값입니다. 값이 없으면 None입니다."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if rank < seen:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+    def to_dict(self):
+        return {"accuracy": self.relative_accuracy, "zero": self.zero_count,
+                "bins": {str(key): count for key, count in self.bins.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data.get("accuracy", 0.01))
+        sketch.zero_count = data.get("zero", 0)
+        sketch.bins = {int(key): count for key, count in data.get("bins", {}).items()}
+        sketch.count = sketch.zero_count + sum(sketch.bins.values())
+        return sketch
+
+
+class Tally:
+    """한 묶음(단어, 글자 수, 주제, 날짜)의 게임 수, 승리 수, 풀이 시간 합계입니다."""
+
+    __slots__ = ("games", "wins", "time_sum", "best_time", "sketch")
+
+    def __init__(self, with_sketch=False):
+        self.games = 0
+        self.wins = 0
+        self.time_sum = 0.0
+        self.best_time = None
+        self.sketch = QuantileSketch() if with_sketch else None
+
+    def add(self, won, elapsed):
+        self.games += 1
+        if not won:
+            return
+        self.wins += 1
+        if elapsed:
+            self.time_sum += elapsed
+            if self.best_time is None or elapsed < self.best_time:
+                self.best_time = elapsed
+            if self.sketch is not None:
+                self.sketch.add(elapsed)
+
+    def merge(self, other):
+        self.games += other.games
+        self.wins += other.wins
+        self.time_sum += other.time_sum
+        if other.best_time is not None and (self.best_time is None or other.best_time < self.best_time):
+            self.best_time = other.best_time
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games * 100 if self.games else 0.0
+
+    def to_list(self):
+        row = [self.games, self.wins, round(self.time_sum, 2), self.best_time]
+        if self.sketch is not None:
+            row.append(self.sketch.to_dict())
+        return row
+
+    @classmethod
+    def from_list(cls, row):
+        tally = cls(with_sketch=len(row) > 4)
+        tally.games, tally.wins, tally.time_sum, tally.best_time = row[:4]
+        if len(row) > 4:
+            tally.sketch = QuantileSketch.from_dict(row[4])
+        return tally
+
+
+class Analytics:
+    """전체 게임 기록을 한 줄씩 흘려 받아 단어별, 글자 수별, 주제별, 날짜별 집계를 유지합니다.
+
+    게임 한 판은 묶음 다섯 개(전체, 단어, 글자 수, 주제, 날짜)의 숫자만 고치므로 O(1)이고,
+    보고서는 이 집계만 읽으므로 기록을 다시 훑지 않습니다. 풀이 시간 분위수는 전체, 글자 수,
+    주제별로 QuantileSketch에 모읍니다. 단어는 수가 많으므로 단어별로는 숫자만 셉니다.
+    """
+
+    GROUPS = ("words", "lengths", "topics", "days")
+
+    def __init__(self):
+        self.overall = Tally(with_sketch=True)
+        self.words = {}
+        self.lengths = {}
+        self.topics = {}
+        self.days = {}
+
+    def _tally(self, group, key, with_sketch=False):
+        tally = group.get(key)
+        if tally is None:
+            tally = group[key] = Tally(with_sketch)
+        return tally
+
+    def add(self, log):
+        """저널의 게임 기록 한 줄(dict)을 반영합니다."""
+        word = log.get("word") or ""
+        won = log.get("result") == "승리"
+        elapsed = log.get("elapsed") if won else None
+        self.overall.add(won, elapsed)
+        self._tally(self.words, word).add(won, elapsed)
+        self._tally(self.lengths, len(word), True).add(won, elapsed)
+        self._tally(self.topics, log.get("topic") or NO_TOPIC, True).add(won, elapsed)
+        self._tally(self.days, (log.get("time") or "")[:10]).add(won, elapsed)
+
+    def merge(self, other):
+        self.overall.merge(other.overall)
+        for name in self.GROUPS:
+            group = getattr(self, name)
+            for key, tally in getattr(other, name).items():
+                with_sketch = tally.sketch is not None
+                self._tally(group, key, with_sketch).merge(tally)
+
+    def word(self, word):
+        return self.words.get(word)
+
+    def hardest_words(self, count=10, min_games=2):
+        """min_games판 이상 나온 단어 중 승률이 낮은 순으로 (단어, 집계)를 돌려줍니다."""
+        rows = ((word, tally) for word, tally in self.words.items() if tally.games >= min_games)
+        return heapq.nsmallest(count, rows, key=lambda row: (row[1].wins / row[1].games, -row[1].games))
+
+    def recent_days(self, count=7):
+        return [(day, self.days[day]) for day in sorted(self.days)[-count:]]
+
+    def time_quantiles(self, quantiles=(0.5, 0.9, 0.99), tally=None):
+        sketch = (tally or self.overall).sketch
+        return [sketch.quantile(q) for q in quantiles]
+
+    def to_dict(self):
+        data = {"overall": self.overall.to_list()}
+        for name in self.GROUPS:
+            data[name] = {str(key): tally.to_list() for key, tally in getattr(self, name).items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        analytics = cls()
+        if "overall" in data:
+            analytics.overall = Tally.from_list(data["overall"])
+        for name in cls.GROUPS:
+            group = getattr(analytics, name)
+            for key, row in data.get(name, {}).items():
+                group[int(key) if name == "lengths" else key] = Tally.from_list(row)
+        return analytics
+
+    def save(self, path, journal_offset, fsync=False):
+        data = dict(self.to_dict(), journal_offset=journal_offset)
+        atomic_write(path, json.dumps(data, ensure_ascii=False, separators=(',', ':')), fsync)
+
+    @classmethod
+    def load(cls, path):
+        """저장된 집계와 그 집계가 반영한 저널 위치를 돌려줍니다. 없으면 빈 집계와 0입니다."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(), 0
+        return cls.from_dict(data), data.get("journal_offset", 0)
+
+    # --- 보고서 ---
+
+    def _print_rows(self, rows):
+        for name, tally in rows:
+            line = f"{name}: {tally.games}판, 승률 {tally.win_rate:.1f}%"
+            if tally.sketch is not None and tally.sketch.count:
+                median, p90 = self.time_quantiles((0.5, 0.9), tally)
+                line += f", 풀이 시간 중앙값 {median:.1f}초 / 90% {p90:.1f}초"
+            elif tally.best_time is not None:
+                line += f", 최고 기록 {tally.best_time}초"
+            print(line)
+
+    def show_words(self, count=10):
+        print("\n--- 어려운 단어 (승률 낮은 순) ---")
+        rows = self.hardest_words(count)
+        if not rows:
+            print("두 번 이상 나온 단어가 아직 없습니다.")
+        self._print_rows(rows)
+
+    def show_lengths(self):
+        print("\n--- 글자 수별 ---")
+        self._print_rows((f"{length}글자", tally) for length, tally in sorted(self.lengths.items()))
+
+    def show_topics(self):
+        print("\n--- 주제별 ---")
+        self._print_rows(sorted(self.topics.items()))
+
+    def show_days(self, count=7):
+        print(f"\n--- 최근 {count}일 ---")
+        self._print_rows(self.recent_days(count))
+
+    def show_times(self):
+        print("\n--- 풀이 시간 분포 (성공한 게임) ---")
+        if not self.overall.sketch.count:
+            print("아직 성공한 게임이 없습니다.")
+            return
+        for q, value in zip((0.5, 0.75, 0.9, 0.99), self.time_quantiles((0.5, 0.75, 0.9, 0.99))):
+            print(f"{q * 100:g}%의 게임이 {value:.2f}초 안에 풀림")
+
+    REPORTS = {
+        "1": ("단어별", show_words),
+        "2": ("글자 수별", show_lengths),
+        "3": ("주제별", show_topics),
+        "4": ("일별", show_days),
+        "5": ("풀이 시간 분포", show_times),
+    }
+
+    def show(self, choice):
+        """보고서 번호에 해당하는 화면을 출력하고, 해당 번호가 있었는지를 돌려줍니다."""
+        report = self.REPORTS.get(choice)
+        if report is None:
+            return False
+        report[1](self)
+        return True
@@ -0,0 +1,295 @@
+# benchmark.py
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없어 최대 메모리를 재지 않습니다.
+    resource = None
+
+from lock_stress import alpha_name
+
+SIZES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def peak_rss_kb():
+    """지금까지 이 프로세스가 쓴 최대 메모리(KB)입니다. 잴 수 없으면 None입니다."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def generate_corpus(workdir, words, topics, meanings, history, seed=0):
+    """workdir 아래에 합성 단어 목록, 뜻 사전, 게임 기록을 만듭니다.
+
+    단어는 3~14글자의 무작위 알파벳이고 topics개의 주제 파일에 고르게 나눠 담습니다.
+    뜻은 앞쪽 meanings개 단어에만, 게임 기록은 history판을 저널과 체크포인트로 씁니다.
+    """
+    from meaning_store import MeaningStore
+
+    rng = random.Random(seed)
+    word_lists = os.path.join(workdir, "word_lists")
+    data = os.path.join(workdir, "data")
+    os.makedirs(word_lists, exist_ok=True)
+    os.makedirs(data, exist_ok=True)
+    topic_names = [f"topic{alpha_name(i)}" for i in range(topics)]
+    files = [open(os.path.join(word_lists, f"{name}.txt"), 'w', encoding='utf-8') for name in topic_names]
+    sample = []
+    try:
+        for i in range(words):
+            word = ''.join(rng.choices(LETTERS, k=rng.randint(3, 14)))
+            files[i % topics].write(word + "\n")
+            if len(sample) < meanings:
+                sample.append(word)
+    finally:
+        for f in files:
+            f.close()
+
+    store = MeaningStore(os.path.join(data, "word_meanings.db"), os.path.join(data, "word_meanings.json"))
+    store.upsert_many((word, f"{word}의 뜻", f"This is {word}.") for word in sample)
+    store.close()
+
+    totals = {"total_games": 0, "wins": 0, "best_time": None}
+    start = datetime(2024, 1, 1)
+    with open(os.path.join(data, "game_records.jsonl"), 'w', encoding='utf-8') as f:
+        for i in range(history):
+            won = rng.random() < 0.6
+            log = {
+                "word": sample[i % len(sample)] if sample else "apple",
+                "result": "승리" if won else "패배",
+                "time": (start + timedelta(minutes=7 * i)).strftime("%Y-%m-%d %H:%M:%S"),
+                "topic": topic_names[i % topics],
+            }
+            totals["total_games"] += 1
+            if won:
+                log["elapsed"] = round(rng.lognormvariate(3, 0.6), 2)
+                totals["wins"] += 1
+                if totals["best_time"] is None or log["elapsed"] < totals["best_time"]:
+                    totals["best_time"] = log["elapsed"]
+            f.write(json.dumps(log, ensure_ascii=False) + "\n")
+        offset = f.tell()
+    with open(os.path.join(data, "game_records.json"), 'w', encoding='utf-8') as f:
+        json.dump(dict(totals, journal_offset=offset), f, ensure_ascii=False, indent=4)
+    return topic_names, sample
+
+
+def measure(func, iterations, warmup=0):
+    """func(i)를 iterations번 불러 지연 시간(ms)의 분포와 처리량을 돌려줍니다."""
+    for i in range(warmup):
+        func(i)
+    samples = []
+    clock = time.perf_counter_ns
+    started = clock()
+    for i in range(iterations):
+        before = clock()
+        func(i)
+        samples.append(clock() - before)
+    elapsed = (clock() - started) / 1e9
+    samples.sort()
+
+    def percentile(q):
+        return samples[min(len(samples) - 1, int(q * len(samples)))] / 1e6
+
+    return {
+        "iterations": iterations,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "max_ms": samples[-1] / 1e6,
+        "mean_ms": sum(samples) / len(samples) / 1e6,
+        "ops_per_second": iterations / elapsed if elapsed > 0 else 0.0,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def measure_once(func):
+    """한 번만 하는 준비 작업(시작, 색인 만들기 등)의 시간을 잽니다."""
+    started = time.perf_counter()
+    result = func()
+    return result, {"seconds": time.perf_counter() - started, "peak_rss_kb": peak_rss_kb()}
+
+
+def _typo(word, rng):
+    i = rng.randrange(len(word))
+    return word[:i] + rng.choice(LETTERS) + word[i + 1:]
+
+
+def run_benchmarks(words, topics=50, iterations=1000, history=100_000, meanings=None, seed=0, workdir=None):
+    """합성 데이터를 만든 폴더에서 주요 경로를 차례로 재고, 결과를 JSON으로 쓸 수 있는 dict로 돌려줍니다."""
+    from game_session import GameSession
+    from persistence import default_writer
+    from solver import FALLBACK_ORDER
+
+    meanings = min(words, 200_000) if meanings is None else meanings
+    owned = workdir is None
+    workdir = workdir or tempfile.mkdtemp(prefix="hangman-bench-")
+    previous_dir = os.getcwd()
+    rng = random.Random(seed)
+    results = {}
+    report = {
+        "meta": {
+            "words": words,
+            "topics": topics,
+            "meanings": meanings,
+            "history": history,
+            "iterations": iterations,
+            "seed": seed,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "setup": {},
+        "results": results,
+    }
+    try:
+        (topic_names, sample), report["setup"]["generate"] = measure_once(
+            lambda: generate_corpus(workdir, words, topics, meanings, history, seed))
+        os.chdir(workdir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            from game_data import GameData
+            from word_manager import WordManager
+
+            word_manager, report["setup"]["word_manager_init"] = measure_once(WordManager)
+            _, report["setup"]["corpus_load"] = measure_once(word_manager._corpus)
+            game_data, report["setup"]["game_data_load"] = measure_once(lambda: GameData())
+            _, report["setup"]["history_sync"] = measure_once(game_data._sync)
+            _, report["setup"]["lookup_index_build"] = measure_once(word_manager.lookup_index)
+
+            levels = ['초급', '중급', '고급']
+            results["get_word_by_level"] = measure(
+                lambda i: word_manager.get_word_by_level(levels[i % 3]), iterations)
+            results["get_random_word"] = measure(lambda i: word_manager.get_random_word(), iterations)
+            results["get_word_by_topic"] = measure(
+                lambda i: word_manager.get_word_by_topic(topic_names[i % topics]), iterations)
+
+            added = [(topic_names[i % topics], f"benchword{alpha_name(i)}") for i in range(iterations)]
+            results["add_word"] = measure(
+                lambda i: word_manager.add_word(added[i][0], added[i][1], "뜻", "예문"), iterations)
+            results["delete_word"] = measure(lambda i: word_manager.delete_word(*added[i]), iterations)
+
+            queries = [sample[rng.randrange(len(sample))] if sample else "apple" for _ in range(iterations)]
+            queries = [word if i % 2 else _typo(word, rng) for i, word in enumerate(queries)]
+            results["show_word_meaning"] = measure(lambda i: word_manager.show_word_meaning(queries[i]), iterations)
+
+            results["record_game"] = measure(
+                lambda i: game_data.record_game(queries[i], i % 3 != 0, 10.0 + i % 50, topic_names[i % topics]),
+                iterations)
+
+            def game_round(i):
+                word = word_manager.get_random_word()
+                session = GameSession(word, 6, rng=rng)
+                for letter in FALLBACK_ORDER:
+                    if session.finished:
+                        break
+                    session.guess(letter)
+                game_data.record_game(word, session.won, session.elapsed() if session.won else None)
+
+            results["game_round"] = measure(game_round, iterations)
+            _, report["setup"]["flush"] = measure_once(default_writer().flush)
+        # 백그라운드 압축이 돌고 있다면 폴더를 떠나기 전에 끝나기를 기다립니다.
+        for thread in threading.enumerate():
+            if thread.name.startswith("compact-"):
+                thread.join()
+        report["peak_rss_kb"] = peak_rss_kb()
+        return report
+    finally:
+        os.chdir(previous_dir)
+        if owned:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare(current, baseline, threshold=0.2, min_ms=0.05):
+    """현재 결과를 기준 결과와 비교해 (이름, 지표, 기준값, 현재값, 퇴보 여부) 목록을 돌려줍니다.
+
+    지연 시간이 기준보다 threshold 비율 넘게 늘거나 처리량이 그만큼 줄면 퇴보로 봅니다.
+    아주 짧은 연산(min_ms 미만)은 측정 잡음이 크므로 지연 시간 비교에서 뺍니다.
+    """
+    rows = []
+    for name, result in current.get("results", {}).items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        for metric in ("p50_ms", "p99_ms"):
+            if base[metric] < min_ms and result[metric] < min_ms:
+                continue
+            regressed = result[metric] > base[metric] * (1 + threshold)
+            rows.append((name, metric, base[metric], result[metric], regressed))
+        regressed = result["ops_per_second"] < base["ops_per_second"] * (1 - threshold)
+        rows.append((name, "ops_per_second", base["ops_per_second"], result["ops_per_second"], regressed))
+    base_rss, rss = baseline.get("peak_rss_kb"), current.get("peak_rss_kb")
+    if base_rss and rss:
+        rows.append(("process", "peak_rss_kb", base_rss, rss, rss > base_rss * (1 + threshold)))
+    return rows
+
+
+def print_report(report):
+    meta = report["meta"]
+    print(f"\n[⏱️ 벤치마크] 단어 {meta['words']}개, 주제 {meta['topics']}개, 게임 기록 {meta['history']}판")
+    for name, setup in report["setup"].items():
+        print(f"- {name}: {setup['seconds']:.3f}초")
+    for name, result in report["results"].items():
+        print(f"{name}: p50 {result['p50_ms']:.3f}ms, p99 {result['p99_ms']:.3f}ms, {result['ops_per_second']:.0f}회/초")
+    if report.get("peak_rss_kb"):
+        print(f"최대 메모리: {report['peak_rss_kb'] / 1024:.1f} MB")
+
+
+def print_comparison(rows, threshold):
+    print(f"\n[📊 기준 결과와 비교] (허용 범위 {threshold * 100:.0f}%)")
+    for name, metric, base, value, regressed in rows:
+        mark = "⚠️" if regressed else "✅"
+        change = (value - base) / base * 100 if base else 0.0
+        print(f"{mark} {name} {metric}: {base:.3f} -> {value:.3f} ({change:+.1f}%)")
+    return sum(1 for row in rows if row[4])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 데이터로 단어 관리, 게임, 기록 저장의 주요 경로를 측정합니다.")
+    parser.add_argument("--size", choices=sorted(SIZES), default="10k", help="단어 수 (기본값: 10k)")
+    parser.add_argument("--words", type=int, help="단어 수를 직접 지정 (--size보다 우선)")
+    parser.add_argument("--topics", type=int, default=50, help="주제 수 (기본값: 50)")
+    parser.add_argument("--history", type=int, default=100_000, help="미리 쌓아 둘 게임 기록 수 (기본값: 100000)")
+    parser.add_argument("--meanings", type=int, help="뜻을 저장할 단어 수 (기본값: 단어 수와 200000 중 작은 값)")
+    parser.add_argument("--iterations", type=int, default=1000, help="측정마다 반복할 횟수 (기본값: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드 (기본값: 0)")
+    parser.add_argument("--workdir", help="합성 데이터를 만들 폴더 (기본값: 임시 폴더를 만들고 끝나면 지움)")
+    parser.add_argument("--output", default="benchmark.json", help="결과 JSON 파일 (기본값: benchmark.json)")
+    parser.add_argument("--compare", metavar="BASELINE", help="기준 결과 JSON과 비교해 퇴보가 있으면 실패로 끝냅니다")
+    parser.add_argument("--input", help="측정하지 않고 이 결과 JSON을 기준과 비교합니다 (--compare와 함께)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="퇴보로 볼 변화 비율 (기본값: 0.2)")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        if not args.compare:
+            parser.error("--input은 --compare와 함께 써야 합니다.")
+        with open(args.input, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    else:
+        words = args.words or SIZES[args.size]
+        report = run_benchmarks(words, args.topics, args.iterations, args.history, args.meanings,
+                                args.seed, args.workdir)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=4)
+        print_report(report)
+        print(f"\n✅ 결과를 '{args.output}'에 저장했습니다.")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if print_comparison(compare(report, baseline, args.threshold), args.threshold):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# file_lock.py
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없는 환경에서는 프로세스 간 잠금 없이 동작합니다.
+    fcntl = None
+
+
+class FileLock:
+    """데이터 파일 옆의 잠금 파일(<경로>.lock)에 fcntl.flock을 걸어 여러 프로세스의 읽기/쓰기를 조율합니다.
+
+    읽는 쪽은 shared()로 서로 동시에 들어가고, 쓰는 쪽은 exclusive()로 혼자 들어갑니다.
+    데이터 파일은 os.replace로 통째로 바뀌기도 하므로 잠금은 데이터 파일이 아닌 별도 파일에 겁니다.
+    flock은 같은 프로세스 안의 스레드끼리는 막아 주지 않으므로 스레드 잠금도 함께 잡습니다.
+    """
+
+    def __init__(self, path):
+        self.path = path + ".lock"
+        self._thread_lock = threading.RLock()
+        self._fd = None
+        self._depth = 0
+
+    @contextmanager
+    def _hold(self, mode):
+        with self._thread_lock:
+            if self._depth:
+                # 이미 잡고 있는 잠금 안에서 다시 잡으면 그대로 통과합니다.
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+            if fcntl is None:
+                self._depth = 1
+                try:
+                    yield
+                finally:
+                    self._depth = 0
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(self._fd, mode)
+                self._depth = 1
+                try:
+                    yield
+                finally:
+                    self._depth = 0
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+            finally:
+                os.close(self._fd)
+                self._fd = None
+
+    def shared(self):
+        return self._hold(fcntl.LOCK_SH if fcntl else None)
+
+    def exclusive(self):
+        return self._hold(fcntl.LOCK_EX if fcntl else None)
+
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def lock_for(path):
+    """같은 경로에는 같은 FileLock 객체를 돌려줍니다."""
+    path = os.path.abspath(path)
+    with _locks_guard:
+        lock = _locks.get(path)
+        if lock is None:
+            lock = _locks[path] = FileLock(path)
+        return lock
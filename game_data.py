@@ -1,65 +1,276 @@
 # game_data.py
 import json
 import os
+import threading
 from datetime import datetime
+from analytics import Analytics
+from file_lock import lock_for
+from instrumentation import count, timed
+from persistence import append_bytes, atomic_write, default_writer
+from players import default_leaderboard, player_path
+
+HISTORY_DISPLAY_COUNT = 20
 
 class GameData:
-    def __init__(self, filepath="data/game_records.json"):
+    """게임 기록을 추가 전용 저널(.jsonl)과 작은 체크포인트(.json)로 관리합니다."""
+
+    def __init__(self, filepath=None, checkpoint_interval=50, writer=None, player_id=None, leaderboard=None,
+                 analytics_interval=500):
+        self.player_id = player_id
+        # player_id가 있으면 그 플레이어의 폴더에 따로 저장하고, 결과는 전체 순위에도 증분으로 합칩니다.
+        if filepath is None:
+            filepath = player_path(player_id, "game_records.json") if player_id else "data/game_records.json"
         self.filepath = filepath
-        self._ensure_file_exists()
+        self.journal_path = os.path.splitext(filepath)[0] + ".jsonl"
+        self.analytics_path = os.path.splitext(filepath)[0] + "_analytics.json"
+        self.checkpoint_interval = checkpoint_interval
+        self.analytics_interval = analytics_interval
+        self.writer = writer or default_writer()
+        self.leaderboard = leaderboard or default_leaderboard()
+        self._totals = None
+        self._offset = 0            # 저널 파일에서 통계에 반영한 위치
+        self._pending = []          # 아직 저널에 쓰지 않은 줄 (통계에는 이미 반영됨)
+        self._since_checkpoint = 0
+        self._checkpoint_due = False
+        self.analytics = None
+        self._analytics_offset = 0  # 저장된 집계가 이미 반영한 저널 위치
+        self._since_analytics = 0
+        self._lock = threading.RLock()
+        self.file_lock = lock_for(self.journal_path)
+        with self.file_lock.exclusive():
+            self._ensure_file_exists()
+
+    def _empty_totals(self):
+        return {"total_games": 0, "wins": 0, "best_time": None}
 
     def _ensure_file_exists(self):
         """기록 파일이 없으면 기본 구조로 생성합니다."""
+        os.makedirs(os.path.dirname(self.filepath) or ".", exist_ok=True)
         if not os.path.exists(self.filepath):
-            # [수정] 폴더가 없을 경우를 대비해 폴더 생성 로직 추가
-            os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                initial_data = {"total_games": 0, "wins": 0, "best_time": None, "history": []}
-                json.dump(initial_data, f, indent=4)
-
-    def record_game(self, word, won, elapsed_time=None):
-        """게임 결과를 기록 파일에 저장합니다."""
-        with open(self.filepath, 'r+', encoding='utf-8') as f:
-            # [수정] 파일이 비어있거나 손상된 경우를 대비한 예외 처리 추가
-            try:
-                records = json.load(f)
-            except json.JSONDecodeError:
-                records = {"total_games": 0, "wins": 0, "best_time": None, "history": []}
-
-            records["total_games"] += 1
-            if won:
-                records["wins"] += 1
-                if elapsed_time and (records.get("best_time") is None or elapsed_time < records["best_time"]):
-                    records["best_time"] = round(elapsed_time, 2)
-
-            game_log = {
-                "word": word,
-                "result": "승리" if won else "패배",
-                "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            # 'history' 키가 없을 경우를 대비
-            if "history" not in records:
-                records["history"] = []
-                
-            records["history"].insert(0, game_log)
-            records["history"] = records["history"][:20]
-
-            f.seek(0) # 파일의 맨 앞으로 커서 이동
-            f.truncate() # [수정] 덮어쓰기 전, 기존 파일 내용을 모두 지워 데이터 꼬임 방지
-            json.dump(records, f, indent=4, ensure_ascii=False)
+            self._write_checkpoint(self._empty_totals(), 0)
+        if not os.path.exists(self.journal_path):
+            open(self.journal_path, 'a', encoding='utf-8').close()
 
-    def show_records(self):
-        """저장된 게임 기록을 화면에 표시합니다."""
-        # [수정] 파일이 비어있거나 손상된 경우를 대비한 예외 처리 추가
+    def _write_checkpoint(self, totals, offset, fsync=False):
+        """통계와 함께 저널의 어디까지 반영했는지(journal_offset)를 적어 둡니다."""
+        checkpoint = dict(totals, journal_offset=offset)
+        atomic_write(self.filepath, json.dumps(checkpoint, indent=4, ensure_ascii=False), fsync)
+
+    def _read_checkpoint(self):
         try:
             with open(self.filepath, 'r', encoding='utf-8') as f:
-                records = json.load(f)
+                checkpoint = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
-            print("\n[🏆 게임 기록]")
-            print("플레이 기록이 아직 없습니다.")
+            # 체크포인트가 손상되면 저널 전체를 다시 읽어 통계를 복원합니다.
+            return self._empty_totals(), 0
+        totals = {key: checkpoint.get(key, default) for key, default in self._empty_totals().items()}
+        if "journal_offset" not in checkpoint:
+            return totals, self._migrate_history(checkpoint.get("history", []), totals)
+        return totals, checkpoint["journal_offset"]
+
+    def _migrate_history(self, history, totals):
+        """예전 형식(최근 20판 history 포함)의 기록을 저널로 옮깁니다."""
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            for log in reversed(history):
+                f.write(json.dumps(log, ensure_ascii=False) + "\n")
+        offset = os.path.getsize(self.journal_path)
+        self._write_checkpoint(totals, offset)
+        return offset
+
+    def _load_analytics(self):
+        """저장된 집계를 읽고, 체크포인트보다 뒤처져 있으면 그 사이의 저널을 흘려 읽어 따라잡습니다.
+
+        집계는 저널 위치와 함께 저장되므로 그 위치 이후의 저널만 읽습니다. 집계 파일이 없으면 저널 전체를 읽어 만듭니다.
+        """
+        self.analytics, offset = Analytics.load(self.analytics_path)
+        if offset < self._offset:
+            try:
+                with open(self.journal_path, 'rb') as f:
+                    f.seek(offset)
+                    for line in f:
+                        if offset >= self._offset or not line.endswith(b"\n"):
+                            break
+                        offset += len(line)
+                        try:
+                            self.analytics.add(json.loads(line))
+                        except ValueError:
+                            continue
+                        self._since_analytics += 1
+            except FileNotFoundError:
+                pass
+        self._analytics_offset = offset
+
+    def _apply(self, totals, log):
+        self.analytics.add(log)
+        self._since_analytics += 1
+        self._apply_totals(totals, log)
+
+    def _apply_totals(self, totals, log):
+        totals["total_games"] += 1
+        if log.get("result") == "승리":
+            totals["wins"] += 1
+            elapsed_time = log.get("elapsed")
+            if elapsed_time and (totals["best_time"] is None or elapsed_time < totals["best_time"]):
+                totals["best_time"] = round(elapsed_time, 2)
+
+    @timed("game_data.sync")
+    def _sync(self):
+        """체크포인트 이후 저널에 쌓인 기록만 읽어 누적 통계에 반영합니다. 읽는 동안에는 공유 잠금을 잡습니다."""
+        with self._lock:
+            return self._sync_locked()
+
+    def _sync_locked(self):
+        if self._totals is None:
+            with self.file_lock.exclusive():
+                self._totals, self._offset = self._read_checkpoint()
+                self._load_analytics()
+        try:
+            with self.file_lock.shared(), open(self.journal_path, 'rb') as f:
+                f.seek(self._offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    start = self._offset
+                    self._offset += len(line)
+                    count("json.loads")
+                    count("json.bytes_parsed", len(line))
+                    try:
+                        log = json.loads(line)
+                    except ValueError:
+                        continue
+                    if start < self._analytics_offset:
+                        # 집계를 체크포인트보다 나중에 저장한 경우, 이미 집계에 들어간 줄입니다.
+                        self._apply_totals(self._totals, log)
+                    else:
+                        self._apply(self._totals, log)
+                    self._since_checkpoint += 1
+        except FileNotFoundError:
+            pass
+        return self._totals
+
+    def record_game(self, word, won, elapsed_time=None, topic=None):
+        """게임 결과를 저널 끝에 한 줄로 덧붙입니다. topic은 주제별 집계에 쓰입니다."""
+        self.record_games([(word, won, elapsed_time, topic)])
+
+    @timed("game_data.record")
+    def record_games(self, results):
+        """(단어, 승리 여부, 걸린 시간[, 주제]) 묶음을 통계에 반영하고 저널 쓰기는 WriteBehind에 맡깁니다.
+
+        결과는 메모리의 대기 줄(_pending)에 들어가고, checkpoint_interval 판마다 체크포인트도 다시 저장하도록
+        표시해 두므로 기록 비용은 이력 길이와 무관합니다.
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            # 다른 프로세스의 기록은 flush 때 반영하므로, 여기서는 처음 한 번만 디스크를 읽습니다.
+            totals = self._totals if self._totals is not None else self._sync_locked()
+            for word, won, elapsed_time, *topic in results:
+                game_log = {"word": word, "result": "승리" if won else "패배", "time": now}
+                if won and elapsed_time:
+                    game_log["elapsed"] = round(elapsed_time, 2)
+                if topic and topic[0]:
+                    game_log["topic"] = topic[0]
+                self._pending.append(json.dumps(game_log, ensure_ascii=False) + "\n")
+                count("json.dumps")
+                self._apply(totals, game_log)
+                self._since_checkpoint += 1
+            if not self._pending:
+                return
+            if self._since_checkpoint >= self.checkpoint_interval:
+                self._checkpoint_due = True
+            snapshot = dict(totals)
+        self.writer.mark(self.journal_path, self.flush)
+        wins = sum(1 for result in results if result[1])
+        self.leaderboard.record(self.player_id, len(results), wins, snapshot)
+
+    @timed("game_data.flush")
+    def flush(self, fsync=False):
+        """대기 중인 줄을 저널에 덧붙이고, 때가 되었으면 체크포인트도 다시 씁니다.
+
+        배타 잠금 안에서 다른 프로세스가 쓴 줄을 먼저 반영한 뒤 덧붙이므로, 체크포인트는 항상 저널 끝까지의
+        통계입니다. 체크포인트는 저널을 덧붙인 다음 임시 파일 + os.replace로 바꿔 씁니다.
+        집계는 analytics_interval 판마다 저장합니다.
+        """
+        with self._lock, self.file_lock.exclusive():
+            self._sync_locked()
+            if self._since_checkpoint >= self.checkpoint_interval:
+                self._checkpoint_due = True
+            if self._pending:
+                data = ''.join(self._pending).encode('utf-8')
+                append_bytes(self.journal_path, data, fsync)
+                self._pending = []
+                self._offset = os.path.getsize(self.journal_path)
+            if self._checkpoint_due:
+                self._write_checkpoint(self._totals, self._offset, fsync)
+                self._since_checkpoint = 0
+                self._checkpoint_due = False
+            if self._since_analytics >= self.analytics_interval:
+                self._save_analytics(fsync)
+
+    def _save_analytics(self, fsync=False):
+        self.analytics.save(self.analytics_path, self._offset, fsync)
+        self._analytics_offset = self._offset
+        self._since_analytics = 0
+
+    def checkpoint(self):
+        """현재까지의 누적 통계와 저널 위치를 체크포인트로 저장합니다."""
+        with self._lock:
+            self._sync_locked()
+            self._checkpoint_due = True
+            self.flush(self.writer.fsync)
+            with self.file_lock.exclusive():
+                self._save_analytics(self.writer.fsync)
+
+    def iter_recent(self, count=HISTORY_DISPLAY_COUNT, chunk_size=8192):
+        """저널 끝에서부터 거꾸로 읽어 최근 기록을 최신순으로 돌려줍니다. (아직 쓰지 않은 기록 포함)"""
+        # flush는 _lock 안에서 대기 줄을 저널로 옮기므로, 대기 줄과 저널 끝 위치를 같은 잠금 안에서 재야
+        # 그 사이에 옮겨진 줄이 두 번 나오지 않습니다.
+        with self._lock:
+            pending = list(self._pending)
+            try:
+                end = os.path.getsize(self.journal_path)
+            except FileNotFoundError:
+                end = 0
+        for line in reversed(pending[-count:]):
+            yield json.loads(line)
+        count -= min(len(pending), count)
+        if count <= 0:
+            return
+        try:
+            f = open(self.journal_path, 'rb')
+        except FileNotFoundError:
             return
+        with f:
+            position = end
+            buffer = b""
+            yielded = 0
+            while position > 0 and yielded < count:
+                read_size = min(chunk_size, position)
+                position -= read_size
+                f.seek(position)
+                buffer = f.read(read_size) + buffer
+                lines = buffer.split(b"\n")
+                buffer = lines.pop(0)
+                for line in reversed(lines):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+                    yielded += 1
+                    if yielded >= count:
+                        return
+            if buffer.strip() and yielded < count:
+                try:
+                    yield json.loads(buffer)
+                except ValueError:
+                    pass
+
+    def show_records(self):
+        """저장된 게임 기록을 화면에 표시합니다."""
+        records = self._sync()
 
-        print("\n[🏆 게임 기록]")
+        print("\n[🏆 게임 기록]" + (f" - {self.player_id}" if self.player_id else ""))
         wins = records.get("wins", 0)
         total = records.get("total_games", 0)
         win_rate = (wins / total * 100) if total > 0 else 0
@@ -74,9 +285,27 @@ class GameData:
             print("최고 기록: 아직 없음")
 
         print("\n--- 최근 플레이 이력 ---")
-        history = records.get("history", [])
+        history = list(self.iter_recent())
         if not history:
             print("플레이 기록이 없습니다.")
         else:
             for log in history:
-                print(f"[{log.get('time')}] 단어: {log.get('word')}, 결과: {log.get('result')}")
\ No newline at end of file
+                print(f"[{log.get('time')}] 단어: {log.get('word')}, 결과: {log.get('result')}")
+
+        self.leaderboard.show()
+        self.show_reports()
+
+    def show_reports(self):
+        """전체 기록의 집계로 만든 자세한 통계 화면을 고릅니다."""
+        with self._lock:
+            self._sync_locked()
+            analytics = self.analytics
+        menu = ", ".join(f"{key}. {name}" for key, (name, _) in analytics.REPORTS.items())
+        while True:
+            choice = input(f"\n자세한 통계 - {menu} (돌아가려면 Enter): ").strip()
+            if not choice:
+                return
+            with self._lock:
+                shown = analytics.show(choice)
+            if not shown:
+                print("⚠️ 잘못된 입력입니다. 다시 선택해주세요.")
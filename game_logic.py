@@ -1,16 +1,19 @@
 # game_logic.py
-import random
 import time
+from instrumentation import timer
+from game_session import GameSession, INVALID, REPEATED, HIT, MISS, REVEALED, NO_HINTS, ALL_REVEALED
 
 class Game:
     def __init__(self, word_manager, game_data, settings):
         self.word_manager = word_manager
         self.game_data = game_data
+        self.player_id = game_data.player_id
         self.max_attempts = settings["max_attempts"]
         self.hint_count = settings["hint_count"]
         self.target_word = ""
-        self.guessed_letters = []
-        self.attempts_left = 0
+        self.topic = None
+        self.strong_hints = True  # 초급에서는 후보를 적게 줄이는 약한 힌트를 줍니다.
+        self.session = None
 
     def _format_time(self, seconds):
         """초를 '분 초' 형태로 변환합니다."""
@@ -20,81 +23,92 @@ class Game:
         remaining_seconds = int(seconds % 60)
         return f"{minutes}분 {remaining_seconds}초"
 
-    def _play(self, challenge_mode=False, time_limit=60):
-        """핵심 게임 플레이 로직을 수행합니다."""
+    def _play(self, challenge_mode=False, time_limit=60, revealed=()):
+        """GameSession 위에서 입력과 출력만 담당하는 CLI 게임 루프입니다."""
         if not self.target_word:
             print("\n⚠️ 플레이할 단어가 없습니다. 단어를 먼저 추가해주세요.")
             return
 
-        self.guessed_letters = []
-        self.attempts_left = self.max_attempts
-        display_word = ['_'] * len(self.target_word)
-        start_time = time.time()
+        session = GameSession(
+            self.target_word,
+            self.max_attempts,
+            self.hint_count,
+            revealed=revealed,
+            time_limit=time_limit if challenge_mode else None,
+            hint_chooser=self.word_manager.hint_engine().chooser(self.strong_hints),
+        )
+        self.session = session
 
         print(f"\n✨ 새로운 게임을 시작합니다! 단어의 길이는 {len(self.target_word)}입니다.")
 
-        while '_' in display_word and self.attempts_left > 0:
+        while not session.finished:
             if challenge_mode:
-                remaining_time = time_limit - (time.time() - start_time)
-                if remaining_time <= 0:
-                    print("\n⏳ 시간 초과! 아쉽지만 실패입니다.")
-                    self.game_data.record_game(self.target_word, False)
-                    self.word_manager.add_to_my_wordbook(self.target_word)
-                    return
-                print(f"남은 시간: {int(remaining_time)}초")
-
-            print(f"\n현재 단어: {' '.join(display_word)}")
-            print(f"남은 시도: {self.attempts_left} | 추측한 알파벳: {', '.join(sorted(self.guessed_letters))}")
+                if session.expire():
+                    break
+                print(f"남은 시간: {int(session.remaining_time())}초")
+
+            state = session.state()
+            print(f"\n현재 단어: {' '.join(state.display)}")
+            print(f"남은 시도: {state.attempts_left} | 추측한 알파벳: {', '.join(state.guessed)}")
             guess = input(">> 알파벳을 추측하거나 '힌트'를 입력하세요: ").lower()
 
             if guess == '힌트':
-                if self.hint_count > 0:
-                    self.hint_count -= 1
-                    unrevealed_letters = [i for i, char in enumerate(self.target_word) if display_word[i] == '_']
-                    if unrevealed_letters:
-                        hint_index = random.choice(unrevealed_letters)
-                        display_word[hint_index] = self.target_word[hint_index]
-                        print(f"💡 힌트! 정답에 '{self.target_word[hint_index]}'가 포함되어 있습니다.")
-                    else:
-                        print("모든 글자를 이미 찾았습니다!")
-                else:
-                    print("⚠️ 더 이상 힌트를 사용할 수 없습니다.")
-                continue
-
-            if len(guess) != 1 or not guess.isalpha():
-                print("⚠️ 알파벳 한 글자만 입력해주세요.")
-                continue
-            if guess in self.guessed_letters:
-                print("⚠️ 이미 추측한 알파벳입니다.")
+                with timer("game.hint"):
+                    result = session.hint()
+                self._show_hint(result)
                 continue
-
-            self.guessed_letters.append(guess)
-
-            if guess in self.target_word:
-                print(f"👍 '{guess}'가 단어에 포함되어 있습니다!")
-                for i, char in enumerate(self.target_word):
-                    if char == guess:
-                        display_word[i] = char
-            else:
-                print(f"👎 아쉽네요! '{guess}'는 단어에 없습니다.")
-                self.attempts_left -= 1
-
-        if '_' not in display_word:
-            elapsed_time = time.time() - start_time
+            with timer("game.guess"):
+                result = session.guess(guess)
+            self._show_guess(result)
+
+        with timer("game.finish"):
+            self._finish(session)
+
+    def _show_hint(self, result):
+        if result.status == REVEALED:
+            print(f"💡 힌트! 정답에 '{result.letter}'가 포함되어 있습니다.")
+        elif result.status == ALL_REVEALED:
+            print("모든 글자를 이미 찾았습니다!")
+        elif result.status == NO_HINTS:
+            print("⚠️ 더 이상 힌트를 사용할 수 없습니다.")
+
+    def _show_guess(self, result):
+        if result.status == INVALID:
+            print("⚠️ 알파벳 한 글자만 입력해주세요.")
+        elif result.status == REPEATED:
+            print("⚠️ 이미 추측한 알파벳입니다.")
+        elif result.status == HIT:
+            print(f"👍 '{result.letter}'가 단어에 포함되어 있습니다!")
+        elif result.status == MISS:
+            print(f"👎 아쉽네요! '{result.letter}'는 단어에 없습니다.")
+
+    def _finish(self, session):
+        """끝난 게임의 결과를 출력하고 기록합니다."""
+        topic = self.topic or self.word_manager.topic_of(self.target_word)
+        if session.won:
+            elapsed_time = session.elapsed()
             formatted_time = self._format_time(elapsed_time)
             print(f"\n🎉 축하합니다! 정답 '{self.target_word}'을(를) 맞추셨습니다!")
             print(f"걸린 시간: {formatted_time}")
-            self.game_data.record_game(self.target_word, True, elapsed_time)
+            self.game_data.record_game(self.target_word, True, elapsed_time, topic)
         else:
-            print(f"\nGAME OVER. 정답은 '{self.target_word}'였습니다.")
-            self.game_data.record_game(self.target_word, False)
+            if session.timed_out:
+                print("\n⏳ 시간 초과! 아쉽지만 실패입니다.")
+            else:
+                print(f"\nGAME OVER. 정답은 '{self.target_word}'였습니다.")
+            self.game_data.record_game(self.target_word, False, topic=topic)
             self.word_manager.add_to_my_wordbook(self.target_word)
 
-    def start_game_by_level(self, level):
+    def start_game_by_level(self, level, length_range=None):
         level_map = {'1': '초급', '2': '중급', '3': '고급'}
         if level in level_map:
+            self.strong_hints = level != '1'
             self.target_word = self.word_manager.get_word_by_level(level_map[level])
             self._play()
+        elif level == '4' and length_range:
+            min_len, max_len = length_range
+            self.target_word = self.word_manager.get_word_by_length(min_len, max_len)
+            self._play()
         else:
             print("⚠️ 잘못된 난이도 선택입니다.")
 
@@ -104,6 +118,7 @@ class Game:
             index = int(topic_choice) - 1
             if 0 <= index < len(topics):
                 chosen_topic = topics[index]
+                self.topic = chosen_topic
                 self.target_word = self.word_manager.get_word_by_topic(chosen_topic)
                 self._play()
             else:
@@ -125,6 +140,7 @@ class Game:
             index = int(topic_choice) - 1
             if 0 <= index < len(topics):
                 chosen_topic = topics[index]
+                self.topic = chosen_topic
                 self.target_word = self.word_manager.get_word_by_topic(chosen_topic)
             else:
                 print("⚠️ 잘못된 번호입니다.")
@@ -137,15 +153,11 @@ class Game:
             print("\n⚠️ 단어를 불러오지 못했습니다.")
             return
 
-        display_word = ['_'] * len(self.target_word)
         hint_count = len(self.target_word) // 3
-        hint_indices = random.sample(range(len(self.target_word)), hint_count)
-
-        for i in hint_indices:
-            display_word[i] = self.target_word[i]
+        hint_indices = self.word_manager.hint_engine().prefill(self.target_word, hint_count)
 
         print("✨ [힌트 모드] 일부 글자가 미리 채워진 상태로 시작합니다!")
-        self._play_with_initial_state(display_word)
+        self._play(revealed=hint_indices)
 
 
     def start_challenge_mode(self):
@@ -153,63 +165,28 @@ class Game:
         print("⏱️ [챌린지 모드] 60초 안에 단어를 맞춰보세요!")
         self._play(challenge_mode=True, time_limit=60)
 
-    def _play_with_initial_state(self, initial_display):
-        if not self.target_word:
-            return
-
-        self.guessed_letters = [c for c in initial_display if c != '_']
-        self.attempts_left = self.max_attempts
-        display_word = initial_display
-        start_time = time.time()
+    def start_review_mode(self):
+        """나만의 단어장에서 복습할 차례가 된 단어를 순서대로 게임으로 냅니다.
 
-        print(f"\n✨ 새로운 게임을 시작합니다! 단어의 길이는 {len(self.target_word)}입니다.")
+        게임 결과(승패, 틀린 횟수, 사용한 힌트)를 점수로 바꿔 다음 복습 일정을 정합니다.
+        """
+        from srs import grade, describe_due
 
-        while '_' in display_word and self.attempts_left > 0:
-            print(f"\n현재 단어: {' '.join(display_word)}")
-            print(f"남은 시도: {self.attempts_left} | 추측한 알파벳: {', '.join(sorted(self.guessed_letters))}")
-            # [수정] 입력 안내 문구 변경
-            guess = input(">> 알파벳을 추측하거나 '힌트'를 입력하세요: ").lower()
-
-            # [수정] '힌트' 입력 처리 로직 추가
-            if guess == '힌트':
-                if self.hint_count > 0:
-                    self.hint_count -= 1
-                    unrevealed_letters = [i for i, char in enumerate(self.target_word) if display_word[i] == '_']
-                    if unrevealed_letters:
-                        hint_index = random.choice(unrevealed_letters)
-                        display_word[hint_index] = self.target_word[hint_index]
-                        print(f"💡 힌트! 정답에 '{self.target_word[hint_index]}'가 포함되어 있습니다.")
-                    else:
-                        print("모든 글자를 이미 찾았습니다!")
+        print("📚 [복습 모드] 나만의 단어장에서 복습할 단어를 차례로 출제합니다!")
+        while True:
+            word = self.word_manager.next_review_word()
+            if word is None:
+                head = self.word_manager.review_queue().peek()
+                if head is None:
+                    print("\n⚠️ 단어장이 비어 있습니다. 게임에서 단어를 틀리면 자동으로 추가됩니다.")
                 else:
-                    print("⚠️ 더 이상 힌트를 사용할 수 없습니다.")
-                continue
-
-            if len(guess) != 1 or not guess.isalpha():
-                print("⚠️ 알파벳 한 글자만 입력해주세요.")
-                continue
-            if guess in self.guessed_letters:
-                print("⚠️ 이미 추측한 알파벳입니다.")
-                continue
-
-            self.guessed_letters.append(guess)
-
-            if guess in self.target_word:
-                print(f"👍 '{guess}'가 단어에 포함되어 있습니다!")
-                for i, char in enumerate(self.target_word):
-                    if char == guess:
-                        display_word[i] = char
-            else:
-                print(f"👎 아쉽네요! '{guess}'는 단어에 없습니다.")
-                self.attempts_left -= 1
-        
-        if '_' not in display_word:
-            elapsed_time = time.time() - start_time
-            formatted_time = self._format_time(elapsed_time)
-            print(f"\n🎉 축하합니다! 정답 '{self.target_word}'을(를) 맞추셨습니다!")
-            print(f"걸린 시간: {formatted_time}")
-            self.game_data.record_game(self.target_word, True, elapsed_time)
-        else:
-            print(f"\nGAME OVER. 정답은 '{self.target_word}'였습니다.")
-            self.game_data.record_game(self.target_word, False)
-            self.word_manager.add_to_my_wordbook(self.target_word)
\ No newline at end of file
+                    print(f"\n✅ 지금 복습할 단어를 모두 마쳤습니다. 다음 복습: {describe_due(head[0], time.time())}")
+                return
+            self.target_word = word
+            self._play()
+            session = self.session
+            quality = grade(session.won, self.max_attempts - session.attempts_left, self.hint_count - session.hints_left)
+            card = self.word_manager.record_review(word, quality)
+            print(f"🗓️ '{word}'의 다음 복습: {describe_due(card.due, time.time())}")
+            if input(">> 계속 복습하시겠습니까? (y/n): ").lower() != 'y':
+                return
@@ -0,0 +1,164 @@
+# game_session.py
+import random
+import time
+from collections import namedtuple
+from string import ascii_lowercase
+
+# guess() 결과 상태
+INVALID = "invalid"      # 알파벳 한 글자가 아님
+REPEATED = "repeated"    # 이미 추측한 알파벳
+HIT = "hit"              # 단어에 포함된 알파벳
+MISS = "miss"            # 단어에 없는 알파벳
+TIMEOUT = "timeout"      # 제한 시간 초과
+FINISHED = "finished"    # 이미 끝난 게임
+
+# hint() 결과 상태
+REVEALED = "revealed"
+NO_HINTS = "no_hints"
+ALL_REVEALED = "all_revealed"
+
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ascii_lowercase)}
+
+GuessResult = namedtuple("GuessResult", ["status", "letter", "positions", "attempts_left", "finished", "won"])
+HintResult = namedtuple("HintResult", ["status", "position", "letter", "hints_left"])
+SessionState = namedtuple(
+    "SessionState",
+    ["display", "attempts_left", "guessed", "hints_left", "finished", "won", "elapsed"],
+)
+
+
+class GameSession:
+    """입출력 없이 한 판의 행맨 게임 상태만 관리하는 상태 기계입니다.
+
+    guess(), hint(), state()는 화면에 아무것도 출력하지 않고 결과 객체만 돌려주므로
+    CLI, 서버, 시뮬레이터가 같은 규칙으로 게임을 진행할 수 있습니다.
+
+    알파벳별 위치 표(letter -> positions)를 미리 만들어 두고, 추측한 알파벳은 26비트 마스크로,
+    남은 빈칸은 개수로만 관리하므로 추측 한 번은 해당 알파벳의 위치 수만큼만 일합니다.
+
+    hint_chooser(session)를 주면 힌트로 공개할 칸을 그 함수가 고르고, None을 돌려주면 무작위로 고릅니다.
+    """
+
+    def __init__(self, target_word, max_attempts, hint_count=0, revealed=(),
+                 time_limit=None, clock=time.time, rng=random, hint_chooser=None):
+        self.target_word = target_word
+        self.attempts_left = max_attempts
+        self.hints_left = hint_count
+        self.time_limit = time_limit
+        self.clock = clock
+        self.rng = rng
+        self.hint_chooser = hint_chooser
+        positions = {}
+        for i, char in enumerate(target_word):
+            positions.setdefault(char, []).append(i)
+        self.positions = {char: tuple(indices) for char, indices in positions.items()}
+        self.guessed_mask = 0
+        self.guessed_other = set()  # a~z 밖의 알파벳 문자
+        self.display = ['_'] * len(target_word)
+        self.remaining = len(target_word)
+        for i in revealed:
+            self._reveal(i)
+        self.start_time = clock()
+        self.end_time = None
+        self.won = False
+        self.timed_out = False
+        self._check_finished()
+
+    @property
+    def finished(self):
+        return self.end_time is not None
+
+    def _reveal(self, position):
+        if self.display[position] == '_':
+            self.display[position] = self.target_word[position]
+            self.remaining -= 1
+
+    def _check_finished(self):
+        if self.remaining == 0:
+            self.won = True
+            self.end_time = self.clock()
+        elif self.attempts_left <= 0:
+            self.end_time = self.clock()
+
+    def elapsed(self):
+        return (self.end_time if self.finished else self.clock()) - self.start_time
+
+    def remaining_time(self):
+        """제한 시간이 있는 게임에서 남은 초를 돌려줍니다. 시간 제한이 없으면 None입니다."""
+        if self.time_limit is None:
+            return None
+        return self.time_limit - (self.clock() - self.start_time)
+
+    def expire(self):
+        """제한 시간이 지났으면 게임을 패배로 끝내고 True를 돌려줍니다."""
+        if self.finished or self.time_limit is None:
+            return False
+        if self.remaining_time() > 0:
+            return False
+        self.timed_out = True
+        self.end_time = self.clock()
+        return True
+
+    def _result(self, status, letter, positions=()):
+        return GuessResult(status, letter, positions, self.attempts_left, self.finished, self.won)
+
+    def guess(self, letter):
+        if self.finished:
+            return self._result(FINISHED, letter)
+        if self.expire():
+            return self._result(TIMEOUT, letter)
+        if len(letter) != 1 or not letter.isalpha():
+            return self._result(INVALID, letter)
+        letter = letter.lower()
+        bit = LETTER_BITS.get(letter)
+        if bit is None:
+            if letter in self.guessed_other:
+                return self._result(REPEATED, letter)
+            self.guessed_other.add(letter)
+        elif self.guessed_mask & bit:
+            return self._result(REPEATED, letter)
+        else:
+            self.guessed_mask |= bit
+
+        positions = self.positions.get(letter, ())
+        if positions:
+            for i in positions:
+                self._reveal(i)
+            status = HIT
+        else:
+            self.attempts_left -= 1
+            status = MISS
+        self._check_finished()
+        return self._result(status, letter, positions)
+
+    def hint(self):
+        """아직 드러나지 않은 칸 하나를 공개합니다. hint_chooser가 없으면 무작위로 고릅니다."""
+        if self.finished:
+            return HintResult(FINISHED, None, None, self.hints_left)
+        if self.hints_left <= 0:
+            return HintResult(NO_HINTS, None, None, self.hints_left)
+        if self.remaining == 0:
+            return HintResult(ALL_REVEALED, None, None, self.hints_left)
+        self.hints_left -= 1
+        position = self.hint_chooser(self) if self.hint_chooser is not None else None
+        if position is None or self.display[position] != '_':
+            position = self.rng.choice([i for i, char in enumerate(self.display) if char == '_'])
+        self._reveal(position)
+        self._check_finished()
+        return HintResult(REVEALED, position, self.target_word[position], self.hints_left)
+
+    def guessed(self):
+        """추측한 알파벳을 사전순으로 돌려줍니다."""
+        letters = [letter for letter, bit in LETTER_BITS.items() if self.guessed_mask & bit]
+        return tuple(sorted(letters + list(self.guessed_other)))
+
+    def state(self):
+        return SessionState(
+            ''.join(self.display),
+            self.attempts_left,
+            self.guessed(),
+            self.hints_left,
+            self.finished,
+            self.won,
+            self.elapsed(),
+        )
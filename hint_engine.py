@@ -0,0 +1,164 @@
+# hint_engine.py
+import random
+from instrumentation import count, timer
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# _MASK_TABLES[c][j]: 알파벳 c는 1 << j로, 나머지 바이트는 0으로 바꾸는 bytes.translate 표
+_MASK_TABLES = [
+    [bytes((1 << j) if b == ord(letter) else 0 for b in range(256)) for j in range(8)]
+    for letter in ALPHABET
+]
+
+
+class LengthTable:
+    """같은 길이 단어들의 (위치, 알파벳) -> 비트셋 표와 위치별 알파벳 빈도표입니다.
+
+    i번째 단어가 p번째 글자로 c를 가지면 bits[p][c]의 i번째 비트가 켜집니다. 비트셋은 파이썬 정수라서
+    후보 거르기(AND)와 개수 세기(bit_count)가 C에서 워드 단위로 돌아갑니다.
+    단어들을 고정 폭 bytes 하나로 이어 붙인 뒤 위치별 열을 슬라이스로 떼어 내고, 8칸씩 건너뛴 조각을
+    translate로 비트 하나씩에 대응시켜 합치므로 단어마다 파이썬 코드를 돌지 않습니다.
+    """
+
+    def __init__(self, words, length):
+        self.length = length
+        self.size = len(words)
+        # a~z 밖의 문자는 '?' 한 바이트가 되므로 단어마다 폭이 같게 유지됩니다.
+        blob = ''.join(words).encode('ascii', 'replace')
+        self.bits = []
+        self.freq = []
+        for position in range(length):
+            column = blob[position::length]
+            parts = [column[j::8] for j in range(8)]
+            bits = {}
+            freq = {}
+            for c, letter in enumerate(ALPHABET):
+                occurrences = column.count(ord(letter))
+                if not occurrences:
+                    continue
+                mask = 0
+                for j, tables in enumerate(_MASK_TABLES[c]):
+                    mask |= int.from_bytes(parts[j].translate(tables), 'little')
+                bits[letter] = mask
+                freq[letter] = occurrences
+            self.bits.append(bits)
+            self.freq.append(freq)
+        self.all = (1 << self.size) - 1
+
+    def letter_bits(self, position, char):
+        """position 칸이 char인 단어들의 비트셋입니다. a~z 밖의 문자는 표에 없으므로 모든 단어로 봅니다."""
+        if char not in ALPHABET:
+            return self.all
+        return self.bits[position].get(char, 0)
+
+    def letter_count(self, position, char):
+        if char not in ALPHABET:
+            return self.size
+        return self.freq[position].get(char, 0)
+
+    def candidates(self, display, excluded):
+        """드러난 글자와 맞고, 가려진 칸에 excluded의 알파벳이 없는 단어들의 비트셋입니다."""
+        mask = self.all
+        banned = 0
+        for position, char in enumerate(display):
+            if char != '_':
+                mask &= self.letter_bits(position, char)
+            elif excluded:
+                bits = self.bits[position]
+                for letter in excluded:
+                    banned |= bits.get(letter, 0)
+        return mask & ~banned if banned else mask
+
+
+class HintEngine:
+    """힌트로 공개할 칸을 후보 단어 수를 기준으로 고릅니다.
+
+    지금 화면(드러난 글자와 추측한 알파벳)에 맞는 같은 길이의 단어를 후보로 보고, 가려진 칸마다
+    그 칸을 공개했을 때 남는 후보 수를 셉니다. 강한 힌트는 후보를 가장 많이 줄이는 칸(가장 흔하지 않은
+    글자)을, 약한 힌트는 가장 적게 줄이는 칸을 공개합니다.
+
+    길이별 표(LengthTable)는 그 길이의 힌트를 처음 요청할 때 만들고, 색인이 바뀌면 해당 길이만 버립니다.
+    패턴 -> 후보 수는 max_patterns개까지 기억하므로 같은 상태에서 다시 물으면 비트 연산도 하지 않습니다.
+    """
+
+    def __init__(self, index, max_patterns=4096, rng=random):
+        self.index = index
+        self.max_patterns = max_patterns
+        self.rng = rng
+        self._tables = {}
+        self._counts = {}  # (길이, 패턴, 제외 알파벳) -> 후보 수
+
+    def table(self, length):
+        table = self._tables.get(length)
+        if table is None:
+            with timer("hint.build_table"):
+                table = self._tables[length] = LengthTable(self.index.words_in_lengths(length, length), length)
+        return table
+
+    def invalidate(self, length=None):
+        """색인이 바뀐 길이(또는 전체)의 표와 기억해 둔 후보 수를 버립니다."""
+        if length is None:
+            self._tables.clear()
+            self._counts.clear()
+            return
+        if self._tables.pop(length, None) is not None:
+            self._counts = {key: value for key, value in self._counts.items() if key[0] != length}
+
+    def _remember(self, key, value):
+        if len(self._counts) >= self.max_patterns:
+            del self._counts[next(iter(self._counts))]
+        self._counts[key] = value
+
+    def scores(self, word, display, guessed=()):
+        """가려진 칸마다 (그 칸을 공개한 뒤 남는 후보 수, 위치)를 돌려줍니다."""
+        table = self.table(len(word))
+        display = ''.join(display)
+        hidden = [i for i, char in enumerate(display) if char == '_']
+        excluded = frozenset(guessed)
+        if not table.size:
+            return []
+        if len(hidden) == len(display) and not excluded:
+            # 아무것도 드러나지 않았으면 위치별 빈도표가 곧 후보 수입니다.
+            return [(table.letter_count(i, word[i]), i) for i in hidden]
+        candidates = None
+        scores = []
+        for i in hidden:
+            revealed = display[:i] + word[i] + display[i + 1:]
+            key = (len(display), revealed, excluded)
+            value = self._counts.get(key)
+            if value is None:
+                count("hint.pattern_miss")
+                if candidates is None:
+                    candidates = table.candidates(display, excluded)
+                value = (candidates & table.letter_bits(i, word[i])).bit_count()
+                self._remember(key, value)
+            else:
+                count("hint.pattern_hit")
+            scores.append((value, i))
+        return scores
+
+    def choose(self, word, display, guessed=(), strong=True):
+        """공개할 위치를 고릅니다. 가려진 칸이 없으면 None입니다. 점수가 같은 칸 중에서는 무작위로 고릅니다."""
+        with timer("hint.choose"):
+            scores = self.scores(word, display, guessed)
+            if not scores:
+                hidden = [i for i, char in enumerate(display) if char == '_']
+                return self.rng.choice(hidden) if hidden else None
+            best = min(scores)[0] if strong else max(scores)[0]
+            return self.rng.choice([i for value, i in scores if value == best])
+
+    def prefill(self, word, hint_count, strong=True):
+        """게임을 시작하기 전에 미리 채울 위치 hint_count개를 하나씩 골라 돌려줍니다."""
+        display = ['_'] * len(word)
+        positions = []
+        for _ in range(min(hint_count, len(word))):
+            position = self.choose(word, display, (), strong)
+            display[position] = word[position]
+            positions.append(position)
+        return positions
+
+    def chooser(self, strong=True):
+        """GameSession의 hint_chooser로 넘길 함수를 돌려줍니다."""
+        def choose(session):
+            return self.choose(session.target_word, session.display, session.guessed(), strong)
+        return choose
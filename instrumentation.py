@@ -0,0 +1,193 @@
+# instrumentation.py
+import functools
+import json
+import os
+import threading
+import time
+
+# 계측은 기본으로 꺼져 있습니다. 꺼져 있을 때 count()와 timed 함수는 전역 플래그 하나만 확인하고,
+# timer()는 아무 일도 하지 않는 공용 객체를 돌려주므로 핫 경로에 거의 비용을 더하지 않습니다.
+ENABLED = os.environ.get("HANGMAN_INSTRUMENT") == "1"
+
+_counters = {}
+_timers = {}  # 이름 -> [횟수, 합계(ns), 최대(ns)]
+_lock = threading.Lock()
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+
+
+def count(name, amount=1):
+    """카운터 name을 amount만큼 올립니다. (디스크 읽기 횟수, 읽은 바이트 수, 캐시 적중 등)"""
+    if ENABLED:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + amount
+
+
+def _record(name, elapsed_ns):
+    with _lock:
+        entry = _timers.get(name)
+        if entry is None:
+            _timers[name] = [1, elapsed_ns, elapsed_ns]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed_ns
+            if elapsed_ns > entry[2]:
+                entry[2] = elapsed_ns
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(name):
+    """with timer("이름"): 블록의 실행 시간을 잽니다."""
+    return _Timer(name) if ENABLED else _NULL_TIMER
+
+
+def timed(name):
+    """함수 전체의 실행 시간을 name 타이머에 더하는 데코레이터입니다."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, time.perf_counter_ns() - start)
+        return wrapper
+    return decorate
+
+
+def snapshot():
+    """지금까지 모은 카운터와 타이머를 JSON으로 쓸 수 있는 dict로 돌려줍니다."""
+    with _lock:
+        counters = dict(_counters)
+        timers = {name: list(entry) for name, entry in _timers.items()}
+    return {
+        "enabled": ENABLED,
+        "counters": counters,
+        "timers": {
+            name: {
+                "count": calls,
+                "total_ms": total / 1e6,
+                "mean_ms": total / calls / 1e6,
+                "max_ms": longest / 1e6,
+            }
+            for name, (calls, total, longest) in timers.items()
+        },
+    }
+
+
+def report():
+    """시간을 많이 쓴 타이머 순서로 통계를 출력합니다."""
+    stats = snapshot()
+    print(f"\n[📈 성능 통계] 계측: {'켜짐' if stats['enabled'] else '꺼짐'}")
+    if not stats["timers"] and not stats["counters"]:
+        print("아직 모인 통계가 없습니다. 계측을 켜고 게임을 몇 판 해 보세요.")
+        return
+    if stats["timers"]:
+        print("--- 타이머 (합계 시간 순) ---")
+        for name, entry in sorted(stats["timers"].items(), key=lambda item: -item[1]["total_ms"]):
+            print(f"{name}: {entry['count']}회, 합계 {entry['total_ms']:.2f}ms, "
+                  f"평균 {entry['mean_ms']:.3f}ms, 최대 {entry['max_ms']:.2f}ms")
+    if stats["counters"]:
+        print("--- 카운터 ---")
+        for name, value in sorted(stats["counters"].items()):
+            print(f"{name}: {value}")
+
+
+def dump(path="data/instrumentation.json"):
+    """통계를 JSON 파일로 저장하고 경로를 돌려줍니다."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot(), f, ensure_ascii=False, indent=4)
+    return path
+
+
+class Profiler:
+    """한 세션 동안 cProfile과 tracemalloc을 켜 두었다가, 끝날 때 결과를 파일로 남기고 요약을 출력합니다.
+
+    <prefix>.prof는 pstats/snakeviz로 열 수 있는 cProfile 결과이고,
+    <prefix>_alloc.txt는 할당한 메모리가 많은 코드 줄 목록입니다.
+    """
+
+    def __init__(self, prefix="data/profile", top=15):
+        self.prefix = prefix
+        self.top = top
+        self._profile = None
+
+    def start(self):
+        import cProfile
+        import tracemalloc
+
+        tracemalloc.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self):
+        import io
+        import pstats
+        import tracemalloc
+
+        if self._profile is None:
+            return
+        self._profile.disable()
+        allocations = tracemalloc.take_snapshot().statistics("lineno")
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        os.makedirs(os.path.dirname(self.prefix) or ".", exist_ok=True)
+        self._profile.dump_stats(self.prefix + ".prof")
+        with open(self.prefix + "_alloc.txt", 'w', encoding='utf-8') as f:
+            f.write(f"current {current} bytes, peak {peak} bytes\n")
+            for stat in allocations[:100]:
+                f.write(f"{stat}\n")
+
+        out = io.StringIO()
+        pstats.Stats(self._profile, stream=out).sort_stats("cumulative").print_stats(self.top)
+        print(f"\n[🔬 프로파일] 누적 시간 상위 {self.top}개 함수")
+        print(out.getvalue())
+        print(f"[🔬 메모리] 현재 {current / 1024:.1f} KB, 최대 {peak / 1024:.1f} KB")
+        for stat in allocations[:10]:
+            print(stat)
+        print(f"✅ 자세한 결과를 '{self.prefix}.prof', '{self.prefix}_alloc.txt'에 저장했습니다.")
+        self._profile = None
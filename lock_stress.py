@@ -0,0 +1,122 @@
+# lock_stress.py
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+STRESS_TOPIC = "stress"
+
+
+def _worker(worker_id, games, workdir, policy):
+    """같은 data 폴더에서 게임 기록, 단어장 추가, 단어 추가를 동시에 수행합니다."""
+    os.chdir(workdir)
+    os.environ["HANGMAN_DURABILITY"] = policy
+    from game_data import GameData
+    from persistence import default_writer
+    from word_manager import WordManager
+
+    game_data = GameData()
+    word_manager = WordManager()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(games):
+            game_data.record_game(f"w{worker_id}x{i}", i % 2 == 0, 1.0 + i % 7)
+            if i % 10 == 0:
+                word_manager.add_to_my_wordbook(f"book{worker_id}x{i}")
+            if i % 50 == 0:
+                word_manager.add_word(STRESS_TOPIC, f"word{alpha_name(worker_id)}x{alpha_name(i)}", "", "")
+        default_writer().flush()
+    return time.perf_counter() - started
+
+
+def alpha_name(number):
+    """숫자를 알파벳 이름으로 바꿉니다. (주제와 단어는 알파벳으로만 되어 있어야 합니다)"""
+    text = ""
+    while True:
+        number, rest = divmod(number, 26)
+        text = chr(ord('a') + rest) + text
+        if not number:
+            return text
+
+
+def run_stress(processes, games, policy="async", workdir=None):
+    """processes개의 프로세스가 각각 games판을 기록한 뒤, 잃어버린 갱신이 없는지 확인합니다."""
+    owned = workdir is None
+    workdir = workdir or tempfile.mkdtemp(prefix="hangman-stress-")
+    os.makedirs(os.path.join(workdir, "word_lists"), exist_ok=True)
+    os.makedirs(os.path.join(workdir, "data"), exist_ok=True)
+    open(os.path.join(workdir, "word_lists", f"{STRESS_TOPIC}.txt"), 'a', encoding='utf-8').close()
+    try:
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(_worker, i, games, workdir, policy) for i in range(processes)]
+            worker_times = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        from game_data import GameData
+        from persistence import WriteBehind
+
+        game_data = GameData(os.path.join(workdir, "data", "game_records.json"), writer=WriteBehind("sync"))
+        totals = game_data._sync()
+        with open(game_data.journal_path, 'rb') as f:
+            journal_lines = sum(1 for _ in f)
+        with open(os.path.join(workdir, "data", "my_wordbook.json"), 'r', encoding='utf-8') as f:
+            wordbook = json.load(f)
+        with open(os.path.join(workdir, "word_lists", f"{STRESS_TOPIC}.txt"), 'r', encoding='utf-8') as f:
+            topic_words = [line.strip() for line in f if line.strip()]
+
+        expected_games = processes * games
+        return {
+            "processes": processes,
+            "games": expected_games,
+            "recorded_games": totals["total_games"],
+            "journal_lines": journal_lines,
+            "wins": totals["wins"],
+            "expected_wins": processes * ((games + 1) // 2),
+            "wordbook": len(wordbook),
+            "expected_wordbook": processes * len(range(0, games, 10)),
+            "topic_words": len(set(topic_words)),
+            "expected_topic_words": processes * len(range(0, games, 50)),
+            "elapsed": elapsed,
+            "games_per_second": expected_games / elapsed if elapsed > 0 else 0.0,
+            "slowest_worker": max(worker_times),
+        }
+    finally:
+        if owned:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 프로세스가 같은 data 폴더에 동시에 기록할 때 잃어버리는 갱신이 없는지 확인합니다.")
+    parser.add_argument("--processes", type=int, default=8, help="동시에 실행할 프로세스 수 (기본값: 8)")
+    parser.add_argument("--games", type=int, default=500, help="프로세스마다 기록할 게임 수 (기본값: 500)")
+    parser.add_argument("--durability", choices=["async", "fsync", "sync"], default="async", help="내구성 정책 (기본값: async)")
+    parser.add_argument("--workdir", help="사용할 폴더 (기본값: 임시 폴더를 만들고 끝나면 지움)")
+    args = parser.parse_args(argv)
+
+    report = run_stress(args.processes, args.games, args.durability, args.workdir)
+    print(f"\n[🔒 동시 기록 스트레스 테스트] 프로세스 {report['processes']}개, 정책 {args.durability}")
+    checks = [
+        ("게임 기록", report["recorded_games"], report["games"]),
+        ("저널 줄 수", report["journal_lines"], report["games"]),
+        ("승리 횟수", report["wins"], report["expected_wins"]),
+        ("단어장", report["wordbook"], report["expected_wordbook"]),
+        ("주제 단어", report["topic_words"], report["expected_topic_words"]),
+    ]
+    ok = True
+    for name, actual, expected in checks:
+        mark = "✅" if actual == expected else "⚠️"
+        ok = ok and actual == expected
+        print(f"{mark} {name}: {actual} / {expected}")
+    print(f"처리량: {report['games_per_second']:.0f}판/초 (전체 {report['elapsed']:.2f}초, 가장 느린 프로세스 {report['slowest_worker']:.2f}초)")
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
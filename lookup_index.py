@@ -0,0 +1,270 @@
+# lookup_index.py
+import itertools
+import marshal
+import os
+from array import array
+from bisect import bisect_left, insort
+from zlib import crc32
+from word_index import WordStore
+
+SNAPSHOT_VERSION = 1
+
+
+def edit_distance(a, b, max_distance):
+    """인접 글자 바꿈을 한 번의 편집으로 치는 편집 거리입니다. max_distance를 넘으면 max_distance + 1을 돌려줍니다.
+
+    앞뒤의 같은 부분을 먼저 잘라 내므로, 오타 한두 개짜리 비교는 아주 짧은 문자열만 계산합니다.
+    """
+    limit = max_distance + 1
+    if abs(len(a) - len(b)) > max_distance:
+        return limit
+    i, j = len(a), len(b)
+    while i and j and a[i - 1] == b[j - 1]:
+        i -= 1
+        j -= 1
+    k = 0
+    while k < i and k < j and a[k] == b[k]:
+        k += 1
+    a, b = a[k:i], b[k:j]
+    if not a or not b:
+        return min(len(a) + len(b), limit)
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        ca = a[i - 1]
+        current = [i]
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cb = b[j - 1]
+            value = previous[j - 1] if ca == cb else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if previous2 is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb and previous2[j - 2] + 1 < value:
+                value = previous2[j - 2] + 1
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min >= limit:
+            return limit
+        previous2, previous = previous, current
+    return min(previous[-1], limit)
+
+
+def deletes(word, max_distance):
+    """word에서 글자를 max_distance개까지 지워 만들 수 있는 모든 문자열 (word 자신 포함)."""
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {item[:i] + item[i + 1:] for item in frontier for i in range(len(item))} - result
+        result |= frontier
+    return result
+
+
+def _sorted_entries(entries, bucket_bits=12):
+    """(해시 << 32 | 번호) 값들을 해시 윗자리로 나눠 정렬합니다. 전체를 한 번에 list로 만들지 않아 메모리가 덜 듭니다."""
+    shift = 64 - bucket_bits
+    buckets = [array('Q') for _ in range(1 << bucket_bits)]
+    for entry in entries:
+        buckets[entry >> shift].append(entry)
+    result = array('Q')
+    for bucket in buckets:
+        result.extend(sorted(bucket))
+    return result
+
+
+class LookupIndex:
+    """단어 뜻 사전의 접두어 자동 완성과 오타 교정 제안을 위한 색인입니다.
+
+    접두어 검색은 정렬된 단어 목록을 트라이처럼 씁니다. 접두어로 시작하는 단어는 정렬 순서에서
+    한 구간에 모여 있으므로 이진 탐색 두 번으로 찾습니다.
+    오타 교정은 SymSpell 방식입니다. 각 단어의 앞 prefix_length 글자에서 max_distance개까지 지운
+    문자열의 crc32와 단어 번호를 (해시 << 32 | 번호) 형태로 정렬된 array('Q')에 담아 두고,
+    질의도 같은 방식으로 지운 문자열을 찾아 후보를 모은 뒤 실제 편집 거리로 확인합니다.
+    crc32는 프로세스가 달라도 같으므로 만든 색인을 save()로 저장해 두었다가 load()로 바로 씁니다.
+
+    단어는 WordStore에 한 번만 저장합니다. 추가된 단어의 삭제 문자열은 작은 사전(_recent)에 따로
+    쌓였다가 merge_threshold개가 넘으면 정렬된 배열에 합쳐지고, 삭제된 단어는 살아 있는 표시만 지웁니다.
+    """
+
+    def __init__(self, words=(), max_distance=2, prefix_length=10, merge_threshold=50000, max_checks=48):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.merge_threshold = merge_threshold
+        self.max_checks = max_checks  # 질의 한 번에 편집 거리를 계산할 후보 수의 상한
+        self.store = WordStore()
+        self.alive = bytearray()
+        self._sorted = []
+        self._base = array('Q')
+        self._recent = {}   # 삭제 문자열 해시 -> 단어 번호 목록
+        self._recent_count = 0
+        self._key_cache = None
+        self.build(words)
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def __contains__(self, word):
+        word_id = self.store.find(word.lower())
+        return word_id is not None and bool(self.alive[word_id])
+
+    def _keys(self, word):
+        prefix = word[:self.prefix_length]
+        keys = self._key_cache.get(prefix) if self._key_cache is not None else None
+        if keys is None:
+            keys = {crc32(item.encode('utf-8')) for item in deletes(prefix, self.max_distance)}
+            if self._key_cache is not None:
+                self._key_cache[prefix] = keys
+        return keys
+
+    def build(self, words):
+        """단어들로 색인을 처음부터 만듭니다."""
+        self.store = WordStore()
+        self.alive = bytearray()
+        self._recent, self._recent_count = {}, 0
+        # 같은 접두어를 가진 단어가 많으므로, 만드는 동안에는 접두어별 삭제 문자열 해시를 기억해 둡니다.
+        self._key_cache = {}
+
+        def entries():
+            for word in dict.fromkeys(word.lower() for word in words):
+                word_id = self.store.intern(word)
+                self.alive.append(1)
+                for key in self._keys(word):
+                    yield key << 32 | word_id
+
+        self._base = _sorted_entries(entries())
+        self._key_cache = None
+        self._sorted = sorted(self.store.word(i) for i in range(len(self.store)))
+
+    def add(self, word):
+        word = word.lower()
+        word_id = self.store.find(word)
+        if word_id is not None:
+            if not self.alive[word_id]:
+                self.alive[word_id] = 1
+                insort(self._sorted, word)
+            return
+        word_id = self.store.intern(word)
+        self.alive.append(1)
+        insort(self._sorted, word)
+        for key in self._keys(word):
+            self._recent.setdefault(key, []).append(word_id)
+            self._recent_count += 1
+        if self._recent_count >= self.merge_threshold:
+            self._merge()
+
+    def remove(self, word):
+        word = word.lower()
+        word_id = self.store.find(word)
+        if word_id is None or not self.alive[word_id]:
+            return
+        self.alive[word_id] = 0
+        i = bisect_left(self._sorted, word)
+        if i < len(self._sorted) and self._sorted[i] == word:
+            del self._sorted[i]
+
+    def _merge(self):
+        recent = (key << 32 | word_id for key, ids in self._recent.items() for word_id in ids)
+        self._base = _sorted_entries(itertools.chain(self._base, recent))
+        self._recent, self._recent_count = {}, 0
+
+    def complete(self, prefix, limit=10):
+        """prefix로 시작하는 단어를 사전 순으로 limit개까지 돌려줍니다."""
+        prefix = prefix.lower()
+        start = bisect_left(self._sorted, prefix)
+        result = []
+        for word in self._sorted[start:start + limit]:
+            if not word.startswith(prefix):
+                break
+            result.append(word)
+        return result
+
+    def _candidates(self, key):
+        base = self._base
+        i = bisect_left(base, key << 32)
+        while i < len(base) and base[i] >> 32 == key:
+            yield base[i] & 0xFFFFFFFF
+            i += 1
+        yield from self._recent.get(key, ())
+
+    def suggest(self, word, limit=5):
+        """편집 거리 max_distance 이내의 단어를 (거리, 단어) 순으로 limit개까지 돌려줍니다.
+
+        지운 글자 수가 적은 질의 문자열부터 찾습니다. 거리 d 이내의 단어는 d글자 이하를 지운 문자열로
+        모두 찾아지므로, 거리 L 이내에서 이미 limit개를 찾았다면 더 지운 문자열은 볼 필요가 없습니다.
+        짧은 삭제 문자열은 후보가 아주 많을 수 있으므로, 편집 거리 계산은 max_checks번에서 멈춥니다.
+        가까운 후보가 먼저 확인되므로 멈추더라도 빠지는 것은 먼 후보들입니다.
+        """
+        word = word.lower()
+        prefix = word[:self.prefix_length]
+        offsets = self.store.offsets
+        seen = set()
+        found = []
+        level_keys = [{prefix}]
+        for level in range(self.max_distance):
+            level_keys.append({item[:i] + item[i + 1:] for item in level_keys[-1] for i in range(len(item))})
+        searched = set()
+        checks = self.max_checks
+        for level, items in enumerate(level_keys):
+            for item in items - searched:
+                if not checks:
+                    break
+                for word_id in self._candidates(crc32(item.encode('utf-8'))):
+                    if word_id in seen or not self.alive[word_id]:
+                        continue
+                    seen.add(word_id)
+                    if abs(offsets[word_id + 1] - offsets[word_id] - 1 - len(word)) > self.max_distance:
+                        continue
+                    if not checks:
+                        break
+                    checks -= 1
+                    candidate = self.store.word(word_id)
+                    distance = edit_distance(word, candidate, self.max_distance)
+                    if distance <= self.max_distance:
+                        found.append((distance, candidate))
+            searched |= items
+            if not checks or sum(1 for distance, _ in found if distance <= level) >= limit:
+                break
+        found.sort()
+        return [candidate for _, candidate in found[:limit]]
+
+    def save(self, path, source):
+        """색인을 marshal 파일로 저장합니다. source는 색인을 만든 뜻 사전의 서명으로, load()에서 비교합니다."""
+        if self._recent:
+            self._merge()
+        data = marshal.dumps({
+            "version": SNAPSHOT_VERSION,
+            "source": tuple(source),
+            "max_distance": self.max_distance,
+            "prefix_length": self.prefix_length,
+            "blob": bytes(self.store.blob),
+            "offsets": self.store.offsets.tobytes(),
+            "alive": bytes(self.alive),
+            "base": self._base.tobytes(),
+            "sorted": "\n".join(self._sorted),
+        })
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, source, max_distance=2, prefix_length=10):
+        """save()로 저장한 색인을 읽습니다. 파일이 없거나 source가 다르면 None을 돌려줍니다."""
+        try:
+            with open(path, 'rb') as f:
+                data = marshal.load(f)
+        except (FileNotFoundError, EOFError, ValueError, TypeError):
+            return None
+        if (not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION
+                or data.get("source") != tuple(source) or data.get("max_distance") != max_distance
+                or data.get("prefix_length") != prefix_length):
+            return None
+        index = cls(max_distance=max_distance, prefix_length=prefix_length)
+        index.store.load(data["blob"], memoryview(data["offsets"]).cast('I'))
+        index.alive = bytearray(data["alive"])
+        index._base = array('Q')
+        index._base.frombytes(data["base"])
+        index._sorted = data["sorted"].split("\n") if data["sorted"] else []
+        return index
@@ -1,25 +1,110 @@
 # main.py
+import time
+
+_STARTED = time.perf_counter()  # --timings에서 모듈 불러오기 시간을 재기 위해 다른 import보다 먼저 기록합니다.
+
+import argparse
+import importlib
 import os
+import sys
+import instrumentation
 from game_logic import Game
 from word_manager import WordManager
 from ui import UI
 from game_data import GameData
 
-def main():
+_IMPORTED = time.perf_counter()
+
+# 'python main.py <명령> ...' 형태로 실행할 수 있는 보조 명령 (모듈 이름, 함수 이름)
+COMMANDS = {
+    "solve": ("solver", "main"),
+    "simulate": ("simulation", "main"),
+    "serve": ("server", "main"),
+    "import": ("word_import", "main"),
+    "compile-pack": ("word_pack", "main"),
+    "memory-report": ("word_index", "main"),
+    "compact": ("tombstones", "main"),
+    "stress": ("lock_stress", "main"),
+    "benchmark": ("benchmark", "main"),
+}
+
+def run_command(argv):
+    module_name, func_name = COMMANDS[argv[0]]
+    module = importlib.import_module(module_name)
+    getattr(module, func_name)(argv[1:])
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        run_command(argv)
+        return
+    parser = argparse.ArgumentParser(description="영어 단어 행맨 게임")
+    parser.add_argument("--player", help="플레이어 이름 (기록과 단어장을 플레이어별로 따로 저장합니다)")
+    parser.add_argument("--profile", action="store_true",
+                        help="이번 실행 동안 계측과 cProfile/tracemalloc을 켜고, 끝날 때 결과를 data/에 저장합니다")
+    parser.add_argument("--timings", action="store_true",
+                        help="시작 단계별 소요 시간(모듈 불러오기, 초기화, 첫 메뉴, 첫 단어)을 출력합니다")
+    args = parser.parse_args(argv)
+
+    profiler = None
+    if args.profile:
+        instrumentation.enable()
+        profiler = instrumentation.Profiler()
+        profiler.start()
+    try:
+        run_menu(args)
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            instrumentation.report()
+            print(f"✅ 계측 통계를 '{instrumentation.dump()}'에 저장했습니다.")
+
+
+def run_menu(args):
     if not os.path.exists('word_lists'):
         os.makedirs('word_lists')
     if not os.path.exists('data'):
         os.makedirs('data')
 
-    word_manager = WordManager()
-    game_data = GameData()
+    phases = [("모듈 불러오기", _IMPORTED - _STARTED)]
+    started = time.perf_counter()
+    word_manager = WordManager(args.player)
+    phases.append(("WordManager 초기화", time.perf_counter() - started))
+    started = time.perf_counter()
+    game_data = GameData(player_id=args.player)
+    phases.append(("GameData 초기화", time.perf_counter() - started))
     ui = UI()
+    phases.append(("첫 메뉴까지", time.perf_counter() - _STARTED))
+    if args.timings:
+        show_timings(word_manager, phases)
 
     settings = {
         "max_attempts": 6,
         "hint_count": 2
     }
 
+    try:
+        main_loop(word_manager, game_data, settings, ui)
+    finally:
+        # 다음 시작 때 단어 목록과 검색 색인을 다시 만들지 않도록 바뀐 스냅샷을 저장합니다.
+        word_manager.save_snapshots()
+        # 통계와 집계도 저널 끝까지 저장해 두면 다음 시작 때 저널을 다시 읽지 않습니다.
+        game_data.checkpoint()
+
+
+def show_timings(word_manager, phases):
+    """시작 단계별 소요 시간과, 첫 단어를 뽑을 수 있을 때까지(단어 목록 불러오기 포함) 걸린 시간을 출력합니다."""
+    started = time.perf_counter()
+    word = word_manager._corpus().sample()
+    phases.append(("첫 단어 준비", time.perf_counter() - started))
+    print("\n[⏱️ 시작 시간]")
+    for name, seconds in phases:
+        print(f"{name}: {seconds * 1000:.1f}ms")
+    if word is None:
+        print("⚠️ 단어 목록이 비어 있습니다.")
+
+
+def main_loop(word_manager, game_data, settings, ui):
     while True:
         ui.display_main_menu()
         choice = input(">> 메뉴를 선택하세요: ")
@@ -46,7 +131,12 @@ def game_mode_menu(word_manager, game_data, settings, ui):
         if choice == '1':
             ui.display_difficulty_menu()
             level_choice = input(">> 난이도를 선택하세요: ")
-            game.start_game_by_level(level_choice)
+            length_range = None
+            if level_choice == '4':
+                length_range = ask_length_range()
+                if not length_range:
+                    continue
+            game.start_game_by_level(level_choice, length_range)
         elif choice == '2':
             ui.display_topic_menu(word_manager.get_available_topics())
             topic_choice = input(">> 주제를 선택하세요: ")
@@ -56,17 +146,31 @@ def game_mode_menu(word_manager, game_data, settings, ui):
         elif choice == '4':
             game.start_challenge_mode()
         elif choice == '5':
+            game.start_review_mode()
+        elif choice == '6':
             break
         else:
             print("\n⚠️ 잘못된 입력입니다. 다시 선택해주세요.")
 
+def ask_length_range():
+    try:
+        min_len = int(input(">> 최소 글자 수를 입력하세요: "))
+        max_len = int(input(">> 최대 글자 수를 입력하세요: "))
+    except ValueError:
+        print("⚠️ 숫자로만 입력해주세요.")
+        return None
+    if min_len < 1 or max_len < min_len:
+        print("⚠️ 올바른 글자 수 범위를 입력해주세요.")
+        return None
+    return (min_len, max_len)
+
 def learning_menu(word_manager):
     ui = UI()
     while True:
         ui.display_learning_menu()
         choice = input(">> 학습 메뉴를 선택하세요: ")
         if choice == '1':
-            word = input(">> 뜻을 찾아볼 단어를 입력하세요: ")
+            word = input(">> 뜻을 찾아볼 단어를 입력하세요 (끝에 * 를 붙이면 그 글자로 시작하는 단어를 찾습니다): ")
             word_manager.show_word_meaning(word)
         elif choice == '2':
             word_manager.manage_my_wordbook()
@@ -88,6 +192,31 @@ def management_menu(word_manager, game_data, settings):
             game_data.show_records()
         elif choice == '4':
             configure_settings(settings)
+        elif choice == '5':
+            stats_menu(ui)
+        elif choice == '6':
+            break
+        else:
+            print("\n⚠️ 잘못된 입력입니다. 다시 선택해주세요.")
+
+def stats_menu(ui):
+    while True:
+        ui.display_stats_menu(instrumentation.ENABLED)
+        choice = input(">> 선택: ")
+        if choice == '1':
+            instrumentation.report()
+        elif choice == '2':
+            if instrumentation.ENABLED:
+                instrumentation.disable()
+                print("계측을 껐습니다.")
+            else:
+                instrumentation.enable()
+                print("계측을 켰습니다. 이제부터 게임과 단어 관리의 시간과 횟수를 모읍니다.")
+        elif choice == '3':
+            instrumentation.reset()
+            print("✨ 통계를 초기화했습니다.")
+        elif choice == '4':
+            print(f"✅ 통계를 '{instrumentation.dump()}'에 저장했습니다.")
         elif choice == '5':
             break
         else:
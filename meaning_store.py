@@ -0,0 +1,101 @@
+# meaning_store.py
+import json
+import os
+import sqlite3
+from persistence import atomic_write
+
+
+class MeaningStore:
+    """단어의 뜻과 예문을 sqlite3 테이블에 단어 단위로 저장합니다.
+
+    조회·추가·삭제가 모두 한 행만 건드리므로 전체 파일을 다시 쓰지 않습니다.
+    데이터베이스가 처음 만들어질 때 기존 word_meanings.json을 한 번 옮겨 옵니다.
+    """
+
+    def __init__(self, db_path="data/word_meanings.db", json_path="data/word_meanings.json"):
+        self.db_path = db_path
+        self.json_path = json_path
+        is_new = not os.path.exists(db_path)
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS meanings ("
+            "word TEXT PRIMARY KEY, meaning TEXT NOT NULL, example TEXT NOT NULL)"
+        )
+        self.conn.commit()
+        if is_new:
+            self.migrate_from_json(json_path)
+
+    def migrate_from_json(self, json_path=None):
+        """word_meanings.json의 내용을 테이블로 옮기고, 옮긴 단어 수를 돌려줍니다."""
+        json_path = json_path or self.json_path
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                meanings = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return 0
+        rows = [
+            (word.lower(), info.get("meaning", ""), info.get("example", ""))
+            for word, info in meanings.items() if isinstance(info, dict)
+        ]
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO meanings VALUES (?, ?, ?)", rows)
+        return len(rows)
+
+    def export_json(self, json_path=None):
+        """테이블 전체를 예전과 같은 형식의 JSON 파일로 내보냅니다."""
+        json_path = json_path or self.json_path
+        meanings = {word: {"meaning": meaning, "example": example} for word, meaning, example in self.items()}
+        # 내보내다 중단되어도 예전 파일이 그대로 남도록 임시 파일에 쓴 뒤 바꿔치기합니다.
+        atomic_write(json_path, json.dumps(meanings, ensure_ascii=False, indent=4))
+        return len(meanings)
+
+    def get(self, word):
+        row = self.conn.execute(
+            "SELECT meaning, example FROM meanings WHERE word = ?", (word.lower(),)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"meaning": row[0], "example": row[1]}
+
+    def __contains__(self, word):
+        return self.conn.execute(
+            "SELECT 1 FROM meanings WHERE word = ?", (word.lower(),)
+        ).fetchone() is not None
+
+    def upsert(self, word, meaning, example):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meanings VALUES (?, ?, ?)", (word.lower(), meaning, example)
+            )
+
+    def upsert_many(self, rows):
+        """(단어, 뜻, 예문) 여러 개를 한 트랜잭션으로 저장합니다."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO meanings VALUES (?, ?, ?)",
+                ((word.lower(), meaning, example) for word, meaning, example in rows),
+            )
+
+    def delete(self, word):
+        """단어 정보를 지우고, 실제로 지워졌는지 여부를 돌려줍니다."""
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM meanings WHERE word = ?", (word.lower(),))
+        return cursor.rowcount > 0
+
+    def complete(self, prefix, limit=10):
+        """prefix로 시작하는 단어를 사전 순으로 limit개까지 돌려줍니다. 기본 키 색인의 구간 검색입니다."""
+        rows = self.conn.execute(
+            "SELECT word FROM meanings WHERE word >= ? AND word < ? ORDER BY word LIMIT ?",
+            (prefix, prefix + "\U0010ffff", limit),
+        )
+        return [row[0] for row in rows]
+
+    def words(self):
+        return [row[0] for row in self.conn.execute("SELECT word FROM meanings")]
+
+    def items(self):
+        return self.conn.execute("SELECT word, meaning, example FROM meanings ORDER BY word")
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,145 @@
+# persistence.py
+import atexit
+import os
+import threading
+from instrumentation import count, timed
+
+# 내구성 정책
+#   async  변경을 모아 두었다가 백그라운드에서 씁니다. fsync는 하지 않습니다. (기본값)
+#   fsync  async와 같되, 쓸 때마다 fsync로 디스크까지 내려보냅니다.
+#   sync   변경이 생기는 즉시 쓰고 fsync합니다. 게임이 끝날 때 디스크를 기다립니다.
+POLICIES = ("async", "fsync", "sync")
+
+
+@timed("disk.atomic_write")
+def atomic_write(path, data, fsync=False):
+    """임시 파일에 모두 쓴 뒤 os.replace로 바꿔치기하므로, 도중에 죽어도 예전 파일이 그대로 남습니다."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    count("disk.writes")
+    count("disk.bytes_written", len(data))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    if fsync:
+        _fsync_dir(path)
+
+
+@timed("disk.append")
+def append_bytes(path, data, fsync=False):
+    """data를 파일 끝에 한 번의 쓰기로 덧붙입니다."""
+    count("disk.writes")
+    count("disk.bytes_written", len(data))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'ab') as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _fsync_dir(path):
+    try:
+        fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class WriteBehind:
+    """여러 저장소의 변경 사항을 메모리에 모아 두었다가 간격이나 개수 기준으로 한꺼번에 씁니다.
+
+    저장소는 mark(이름, 쓰기 함수)로 '쓸 것이 있음'만 알리고, 실제 쓰기는 백그라운드 스레드가
+    flush_interval초마다 또는 표시가 flush_count개 쌓였을 때 writer(fsync)를 불러 처리합니다.
+    같은 이름은 한 번만 쓰이므로 그 사이의 여러 변경은 한 번의 쓰기로 합쳐집니다.
+    프로그램이 끝날 때(atexit)도 남은 변경을 모두 씁니다.
+    """
+
+    def __init__(self, policy="async", flush_interval=2.0, flush_count=50):
+        if policy not in POLICIES:
+            raise ValueError(f"알 수 없는 내구성 정책입니다: {policy}")
+        self.policy = policy
+        self.fsync = policy != "async"
+        self.flush_interval = flush_interval
+        self.flush_count = flush_count
+        self._writers = {}  # 이름 -> 쓰기 함수 (넣은 순서대로 씁니다)
+        self._marks = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = None
+        atexit.register(self.close)
+
+    def _start(self):
+        # 스레드가 어떤 이유로든 멈췄다면 다음 mark()에서 다시 띄웁니다.
+        if (self._thread is None or not self._thread.is_alive()) and self.policy != "sync":
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def mark(self, name, writer):
+        """name 저장소에 쓸 변경이 있음을 알립니다. writer는 fsync 여부를 받아 실제로 씁니다."""
+        with self._lock:
+            self._writers[name] = writer
+            self._marks += 1
+            marks = self._marks
+        if self.policy == "sync" or self._closed:
+            self.flush()
+            return
+        self._start()
+        if marks >= self.flush_count:
+            self._wake.set()
+
+    def flush(self):
+        """모아 둔 변경을 지금 모두 씁니다."""
+        with self._flush_lock:
+            with self._lock:
+                writers = list(self._writers.items())
+                self._writers.clear()
+                self._marks = 0
+            for name, writer in writers:
+                try:
+                    writer(self.fsync)
+                except OSError as e:
+                    # 디스크가 가득 찬 경우처럼 나중에 다시 하면 될 수 있는 오류는 다음 flush에서 다시 씁니다.
+                    count("writebehind.errors")
+                    print(f"⚠️ '{name}'을(를) 저장하는 중 오류가 발생했습니다: {e}")
+                    with self._lock:
+                        self._writers.setdefault(name, writer)
+                except Exception as e:
+                    # 그 밖의 오류(직렬화 실패, sqlite 오류 등)는 다시 해도 같으므로 알리기만 하고,
+                    # 나머지 저장소와 백그라운드 스레드는 계속 동작하게 합니다.
+                    count("writebehind.errors")
+                    print(f"⚠️ '{name}'을(를) 저장하지 못했습니다: {type(e).__name__}: {e}")
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        self.flush()
+
+
+_default = None
+
+
+def default_writer():
+    """프로그램 전체가 함께 쓰는 WriteBehind입니다. 정책은 HANGMAN_DURABILITY 환경 변수로 정합니다."""
+    global _default
+    if _default is None:
+        _default = WriteBehind(os.environ.get("HANGMAN_DURABILITY", "async"))
+    return _default
@@ -0,0 +1,142 @@
+# players.py
+import hashlib
+import json
+import os
+import threading
+from file_lock import lock_for
+from persistence import atomic_write, default_writer
+
+PLAYERS_ROOT = "data/players"
+LEADERBOARD_PATH = "data/leaderboard.json"
+
+
+def player_dir(player_id, root=PLAYERS_ROOT):
+    """플레이어별 폴더입니다. 이름의 sha1 앞 두 글자로 나눠 한 폴더에 너무 많이 모이지 않게 합니다."""
+    shard = hashlib.sha1(player_id.encode('utf-8')).hexdigest()[:2]
+    safe_name = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in player_id)
+    return os.path.join(root, shard, safe_name)
+
+
+def player_path(player_id, filename, root=PLAYERS_ROOT):
+    return os.path.join(player_dir(player_id, root), filename)
+
+
+class Leaderboard:
+    """전체 플레이어 순위를 플레이어를 훑지 않고 증분으로 합쳐 유지합니다.
+
+    파일에는 전체 누적 합계(총 게임 수, 승리 수)와 순위표마다 상위 top_k명만 저장합니다.
+    게임이 끝나면 합계의 증가분과 그 플레이어의 최신 통계만 메모리에 쌓아 두고,
+    WriteBehind가 파일을 배타 잠금 안에서 다시 읽어 합친 뒤 바꿔 씁니다.
+    그래서 쓰기 비용은 top_k에만 비례하고 플레이어 수와는 무관합니다.
+    """
+
+    BOARDS = {
+        # 순위표 이름 -> (정렬 키, 순위표에 오를 조건)
+        "wins": (lambda entry: (-entry["wins"], entry["games"]), lambda entry: entry["wins"] > 0),
+        "best_time": (lambda entry: entry["best_time"], lambda entry: entry.get("best_time") is not None),
+    }
+
+    def __init__(self, path=LEADERBOARD_PATH, top_k=100, writer=None):
+        self.path = path
+        self.top_k = top_k
+        self.writer = writer or default_writer()
+        self.file_lock = lock_for(path)
+        self._lock = threading.Lock()
+        self._delta = {"games": 0, "wins": 0}
+        self._players = {}  # 플레이어 -> 최신 통계
+
+    def _empty(self):
+        return {"games": 0, "wins": 0, "boards": {name: [] for name in self.BOARDS}}
+
+    def _read(self):
+        try:
+            with self.file_lock.shared(), open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return self._empty()
+        for name in self.BOARDS:
+            data.setdefault("boards", {}).setdefault(name, [])
+        return data
+
+    def record(self, player_id, games, wins, totals):
+        """게임 games판(그중 승리 wins판)의 증가분과, 플레이어의 누적 통계(totals)를 반영합니다."""
+        with self._lock:
+            self._delta["games"] += games
+            self._delta["wins"] += wins
+            if player_id:
+                self._players[player_id] = {
+                    "player": player_id,
+                    "games": totals["total_games"],
+                    "wins": totals["wins"],
+                    "best_time": totals["best_time"],
+                }
+        self.writer.mark(self.path, self.flush)
+
+    def _merge(self, data, delta, players):
+        data["games"] += delta["games"]
+        data["wins"] += delta["wins"]
+        for name, (key, eligible) in self.BOARDS.items():
+            entries = {entry["player"]: entry for entry in data["boards"][name]}
+            for player_id, entry in players.items():
+                current = entries.get(player_id)
+                # 같은 플레이어라면 게임 수가 더 많은(더 최근) 통계를 남깁니다.
+                if current is None or entry["games"] >= current["games"]:
+                    if eligible(entry):
+                        entries[player_id] = entry
+                    else:
+                        entries.pop(player_id, None)
+            data["boards"][name] = sorted(entries.values(), key=key)[:self.top_k]
+        return data
+
+    def flush(self, fsync=False):
+        with self._lock:
+            delta, players = self._delta, self._players
+            self._delta, self._players = {"games": 0, "wins": 0}, {}
+        if not delta["games"] and not players:
+            return
+        try:
+            with self.file_lock.exclusive():
+                data = self._merge(self._read(), delta, players)
+                atomic_write(self.path, json.dumps(data, ensure_ascii=False, indent=4), fsync)
+        except OSError:
+            # 쓰지 못한 증가분은 다음 flush에서 다시 합칩니다.
+            with self._lock:
+                self._delta["games"] += delta["games"]
+                self._delta["wins"] += delta["wins"]
+                for player_id, entry in players.items():
+                    self._players.setdefault(player_id, entry)
+            raise
+
+    def snapshot(self):
+        """파일의 내용에 아직 쓰지 않은 증가분까지 합친 순위를 돌려줍니다."""
+        with self._lock:
+            delta, players = dict(self._delta), dict(self._players)
+        return self._merge(self._read(), delta, players)
+
+    def show(self, count=5):
+        data = self.snapshot()
+        games = data["games"]
+        rate = data["wins"] / games * 100 if games else 0
+        print(f"\n--- 전체 순위 (전체 {games}판, 승률 {rate:.2f}%) ---")
+        wins_board = data["boards"]["wins"][:count]
+        if not wins_board:
+            print("아직 순위에 오른 플레이어가 없습니다.")
+            return
+        print("[승리 횟수]")
+        for rank, entry in enumerate(wins_board, 1):
+            print(f"{rank}. {entry['player']} - {entry['wins']}승 / {entry['games']}판")
+        time_board = data["boards"]["best_time"][:count]
+        if time_board:
+            print("[최고 기록]")
+            for rank, entry in enumerate(time_board, 1):
+                print(f"{rank}. {entry['player']} - {entry['best_time']}초")
+
+
+_default = None
+
+
+def default_leaderboard():
+    global _default
+    if _default is None:
+        _default = Leaderboard()
+    return _default
@@ -0,0 +1,212 @@
+# server.py
+import argparse
+import asyncio
+import time
+
+from game_session import GameSession, HIT, MISS, REPEATED, INVALID, REVEALED, TIMEOUT
+
+MAX_WORD_LENGTH = 32  # length 명령으로 받을 수 있는 가장 긴 글자 수
+
+HELP_TEXT = "COMMANDS NEW [level <초급|중급|고급> | topic <name> | length <min> <max>] | GUESS <letter> | HINT | STATE | QUIT"
+
+
+class ResultWriter:
+    """여러 세션의 게임 결과를 모아 GameData에 묶음으로 기록하는 단일 작성 태스크입니다.
+
+    큐의 크기가 제한되어 있어 기록이 밀리면 결과를 넣으려는 연결이 기다리게 됩니다.
+    """
+
+    def __init__(self, game_data, batch_size=256, flush_interval=1.0, max_pending=10000):
+        self.game_data = game_data
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        self.task = None
+
+    def start(self):
+        self.task = asyncio.create_task(self._run())
+
+    async def put(self, word, won, elapsed_time, topic=None):
+        await self.queue.put((word, won, elapsed_time, topic))
+
+    async def _run(self):
+        while True:
+            batch = [await self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await asyncio.to_thread(self.game_data.record_games, batch)
+            except Exception as e:
+                # 기록 하나가 실패해도 작성 태스크는 계속 돌아야 close()의 queue.join()이 끝납니다.
+                print(f"⚠️ 게임 결과 {len(batch)}개를 기록하지 못했습니다: {type(e).__name__}: {e}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def close(self):
+        await self.queue.join()
+        if self.task:
+            self.task.cancel()
+
+
+class HangmanServer:
+    """한 줄 단위 텍스트 프로토콜로 여러 명의 행맨 게임을 동시에 진행하는 asyncio TCP 서버입니다.
+
+    모든 세션은 하나의 WordManager 색인을 공유하고, 게임 결과는 ResultWriter가 모아서 기록합니다.
+    """
+
+    def __init__(self, word_manager, game_data, settings, idle_timeout=300, max_sessions=10000, backlog=4096):
+        self.word_manager = word_manager
+        self.writer = ResultWriter(game_data)
+        self.max_attempts = settings["max_attempts"]
+        self.hint_count = settings["hint_count"]
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.backlog = backlog
+        self.active = 0
+
+    async def start(self, host="127.0.0.1", port=7777):
+        self.writer.start()
+        return await asyncio.start_server(self.handle, host, port, limit=1024, backlog=self.backlog)
+
+    async def close(self):
+        await self.writer.close()
+
+    async def _send(self, writer, line):
+        writer.write((line + "\n").encode('utf-8'))
+        # 클라이언트가 읽지 않으면 여기서 기다리므로 연결별 송신 버퍼가 무한히 커지지 않습니다.
+        await writer.drain()
+
+    async def handle(self, reader, writer):
+        if self.active >= self.max_sessions:
+            await self._send(writer, "ERR busy")
+            writer.close()
+            return
+        self.active += 1
+        session = None
+        try:
+            await self._send(writer, "OK hangman ready")
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    await self._send(writer, "BYE idle")
+                    break
+                except (asyncio.LimitOverrunError, ValueError):
+                    await self._send(writer, "ERR line too long")
+                    break
+                if not line:
+                    break
+                parts = line.decode('utf-8', 'replace').split()
+                if not parts:
+                    continue
+                command, args = parts[0].upper(), parts[1:]
+                if command == "QUIT":
+                    await self._send(writer, "BYE")
+                    break
+                if command == "NEW":
+                    session = self._new_session(args)
+                    if session is None:
+                        await self._send(writer, "ERR no word")
+                    else:
+                        await self._send(writer, f"GAME {len(session.target_word)} {self._status(session)}")
+                elif command in ("GUESS", "HINT", "STATE") and session is None:
+                    await self._send(writer, "ERR no game")
+                elif command == "GUESS" and len(args) == 1:
+                    result = session.guess(args[0])
+                    await self._send(writer, f"{self._guess_token(result.status)} {self._status(session)}")
+                    if result.finished:
+                        await self._finish(writer, session)
+                        session = None
+                elif command == "HINT":
+                    result = session.hint()
+                    if result.status == REVEALED:
+                        await self._send(writer, f"HINT {result.position} {result.letter} {self._status(session)}")
+                        if session.finished:
+                            await self._finish(writer, session)
+                            session = None
+                    else:
+                        await self._send(writer, "NOHINT")
+                elif command == "STATE":
+                    state = session.state()
+                    guessed = ''.join(state.guessed) or '-'
+                    await self._send(writer, f"STATE {self._status(session)} {guessed} {state.hints_left}")
+                else:
+                    await self._send(writer, f"ERR {HELP_TEXT}")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active -= 1
+            writer.close()
+
+    def _new_session(self, args):
+        word = None
+        strong_hints = True
+        if not args:
+            word = self.word_manager.get_random_word()
+        elif args[0] == "level" and len(args) == 2:
+            word = self.word_manager.get_word_by_level(args[1])
+            strong_hints = args[1] != '초급'
+        elif args[0] == "topic" and len(args) == 2:
+            # 클라이언트가 보낸 값이므로 있는 주제와 정해진 길이 범위만 받습니다.
+            if self.word_manager.has_topic(args[1]):
+                word = self.word_manager.get_word_by_topic(args[1])
+        elif args[0] == "length" and len(args) == 3 and args[1].isdigit() and args[2].isdigit():
+            min_len, max_len = max(int(args[1]), 1), min(int(args[2]), MAX_WORD_LENGTH)
+            if min_len <= max_len:
+                word = self.word_manager.get_word_by_length(min_len, max_len)
+        if not word:
+            return None
+        hint_chooser = self.word_manager.hint_engine().chooser(strong_hints)
+        return GameSession(word, self.max_attempts, self.hint_count, hint_chooser=hint_chooser)
+
+    def _status(self, session):
+        return f"{''.join(session.display)} {session.attempts_left}"
+
+    def _guess_token(self, status):
+        return {HIT: "HIT", MISS: "MISS", REPEATED: "REPEATED", INVALID: "INVALID", TIMEOUT: "TIMEOUT"}.get(status, "ERR")
+
+    async def _finish(self, writer, session):
+        if session.won:
+            await self._send(writer, f"WIN {session.target_word} {session.elapsed():.2f}")
+        else:
+            await self._send(writer, f"LOSE {session.target_word}")
+        topic = self.word_manager.topic_of(session.target_word)
+        await self.writer.put(session.target_word, session.won, session.elapsed() if session.won else None, topic)
+
+
+async def serve(host, port, idle_timeout):
+    from game_data import GameData
+    from word_manager import WordManager
+
+    server = HangmanServer(WordManager(), GameData(), {"max_attempts": 6, "hint_count": 2}, idle_timeout)
+    tcp_server = await server.start(host, port)
+    print(f"🌐 행맨 서버가 {host}:{port}에서 실행 중입니다. (종료: Ctrl+C)")
+    try:
+        async with tcp_server:
+            await tcp_server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 명이 동시에 접속하는 행맨 게임 서버를 실행합니다.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--idle-timeout", type=float, default=300, help="입력이 없는 세션을 끊기까지의 초")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.idle_timeout))
+    except KeyboardInterrupt:
+        print("\n👋 서버를 종료합니다.")
+
+
+if __name__ == "__main__":
+    main()
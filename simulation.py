@@ -0,0 +1,143 @@
+# simulation.py
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from game_session import GameSession
+from solver import FALLBACK_ORDER, Solver
+
+_solver = None
+
+
+def _init_worker(dictionary):
+    """작업 프로세스마다 한 번만 풀이기를 만들어 둡니다."""
+    global _solver
+    _solver = Solver(dictionary)
+
+
+def _play_scripted(session):
+    """정해진 빈도 순서대로 알파벳을 추측하는 대본 플레이어입니다."""
+    for letter in FALLBACK_ORDER:
+        if session.finished:
+            break
+        session.guess(letter)
+    return session
+
+
+def _run_shard(name, words, games, max_attempts, strategy, seed):
+    """샤드 하나의 게임을 모두 플레이하고 집계값만 돌려줍니다."""
+    rng = random.Random(seed)
+    if games is None:
+        targets = words
+    else:
+        targets = [words[i % len(words)] for i in range(games)]
+        rng.shuffle(targets)
+    wins = misses = 0
+    start = time.perf_counter()
+    for word in targets:
+        session = GameSession(word, max_attempts, rng=rng)
+        if strategy == "solver":
+            _solver.play(session)
+        else:
+            _play_scripted(session)
+        wins += session.won
+        misses += max_attempts - session.attempts_left
+    return {
+        "shard": name,
+        "games": len(targets),
+        "wins": wins,
+        "misses": misses,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def make_shards(index, shard_by="topic", shard_count=None):
+    """주제별, 또는 정렬된 전체 단어를 shard_count개 구간으로 나눈 샤드 목록을 만듭니다."""
+    if shard_by == "topic":
+        shards = []
+        for topic in index.topics():
+            words = list(dict.fromkeys(index.words_of(topic)))
+            if words:
+                shards.append((topic, words))
+        return shards
+    words = sorted(index.all_words())
+    if not words:
+        return []
+    shard_count = max(1, min(shard_count or os.cpu_count() or 1, len(words)))
+    size = -(-len(words) // shard_count)
+    return [
+        (f"{words[i]}..{words[min(i + size, len(words)) - 1]}", words[i:i + size])
+        for i in range(0, len(words), size)
+    ]
+
+
+def merge(results):
+    """샤드별 집계값을 하나로 합칩니다."""
+    total = {"games": 0, "wins": 0, "misses": 0}
+    for result in results:
+        for key in total:
+            total[key] += result[key]
+    return total
+
+
+def run_simulation(index, games=None, shard_by="topic", shard_count=None, workers=None,
+                   max_attempts=6, strategy="solver", seed=None):
+    """샤드를 ProcessPoolExecutor에 나눠 실행하고 (샤드별 결과, 합계, 전체 소요 시간)을 돌려줍니다.
+
+    작업 프로세스는 게임 기록 파일에 손대지 않고 집계값만 돌려주며, 부모가 마지막에 한 번 합칩니다.
+    """
+    shards = make_shards(index, shard_by, shard_count)
+    if not shards:
+        return [], merge([]), 0.0
+    per_shard = None
+    if games is not None:
+        per_shard = [games // len(shards) + (i < games % len(shards)) for i in range(len(shards))]
+    seeds = random.Random(seed)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(index.all_words(),)) as executor:
+        futures = [
+            executor.submit(_run_shard, name, words, per_shard[i] if per_shard else None,
+                            max_attempts, strategy, seeds.random())
+            for i, (name, words) in enumerate(shards)
+        ]
+        results = [future.result() for future in futures]
+    return results, merge(results), time.perf_counter() - start
+
+
+def main(argv=None):
+    from word_manager import WordManager
+
+    parser = argparse.ArgumentParser(description="여러 프로세스로 대량의 행맨 게임을 시뮬레이션합니다.")
+    parser.add_argument("--games", type=int, help="전체 게임 수 (기본값: 모든 단어를 한 번씩)")
+    parser.add_argument("--shard", choices=["topic", "range"], default="topic", help="샤드 기준")
+    parser.add_argument("--shards", type=int, help="range 샤드 개수 (기본값: CPU 수)")
+    parser.add_argument("--workers", type=int, help="작업 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--strategy", choices=["solver", "scripted"], default="solver", help="플레이 방식")
+    parser.add_argument("--max-attempts", type=int, default=6, help="최대 시도 횟수 (기본값: 6)")
+    parser.add_argument("--seed", type=int, help="재현용 난수 시드")
+    args = parser.parse_args(argv)
+
+    index = WordManager()._corpus()
+    results, total, elapsed = run_simulation(
+        index, args.games, args.shard, args.shards, args.workers,
+        args.max_attempts, args.strategy, args.seed,
+    )
+    print(f"\n[🧪 대량 시뮬레이션] 전략: {args.strategy}, 최대 시도 {args.max_attempts}회")
+    for result in results:
+        rate = result["games"] / result["elapsed"] if result["elapsed"] > 0 else 0.0
+        print(f"- {result['shard']}: {result['games']}게임, 승리 {result['wins']}회, {rate:.0f} 게임/초")
+    games = total["games"]
+    if not games:
+        print("플레이할 단어가 없습니다.")
+        return
+    print(f"\n총 게임 수: {games}회")
+    print(f"승률: {total['wins'] / games * 100:.2f}%")
+    print(f"평균 오답 수: {total['misses'] / games:.2f}")
+    print(f"전체 처리 속도: {games / elapsed:.0f} 게임/초 ({elapsed:.2f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# solver.py
+import argparse
+import time
+from string import ascii_lowercase
+
+from game_session import GameSession, HIT
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 같은 규칙의 순수 파이썬 구현을 사용합니다.
+    np = None
+
+FALLBACK_ORDER = "etaoinshrdlucmfwypvbgkqjxz"
+
+
+class WordMatrix:
+    """같은 길이의 단어들을 (단어 수 × 글자 위치) uint8 행렬로 인코딩합니다.
+
+    presence는 (단어 수 × 26) 불리언 행렬로, 각 단어에 어떤 알파벳이 들어 있는지를 담습니다.
+    """
+
+    def __init__(self, words, length):
+        self.words = words
+        self.length = length
+        blob = ''.join(words).encode('ascii')
+        self.codes = np.frombuffer(blob, dtype=np.uint8).reshape(len(words), length) - ord('a')
+        self.presence = np.zeros((len(words), 26), dtype=bool)
+        rows = np.repeat(np.arange(len(words)), length)
+        self.presence[rows, self.codes.ravel()] = True
+
+
+class _MatrixCandidates:
+    """numpy 행렬 위에서 남은 후보 단어를 불리언 마스크로 걸러냅니다."""
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.rows = np.arange(len(matrix.words))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def letter_counts(self):
+        return self.matrix.presence[self.rows].sum(axis=0)
+
+    def apply(self, code, positions):
+        if positions:
+            expected = np.zeros(self.matrix.length, dtype=bool)
+            expected[list(positions)] = True
+            keep = np.all((self.matrix.codes[self.rows] == code) == expected, axis=1)
+        else:
+            keep = ~self.matrix.presence[self.rows, code]
+        self.rows = self.rows[keep]
+
+
+class _ListCandidates:
+    """numpy가 없을 때 쓰는 목록 기반 후보 필터입니다."""
+
+    def __init__(self, words):
+        self.words = words
+
+    def __len__(self):
+        return len(self.words)
+
+    def letter_counts(self):
+        counts = [0] * 26
+        for word in self.words:
+            for char in set(word):
+                counts[ord(char) - 97] += 1
+        return counts
+
+    def apply(self, code, positions):
+        letter = chr(code + 97)
+        if positions:
+            positions = set(positions)
+            self.words = [
+                word for word in self.words
+                if all((char == letter) == (i in positions) for i, char in enumerate(word))
+            ]
+        else:
+            self.words = [word for word in self.words if letter not in word]
+
+
+class Solver:
+    """남은 후보 단어 중 가장 많은 단어에 들어 있는 알파벳을 골라 행맨을 푸는 자동 풀이기입니다."""
+
+    def __init__(self, words):
+        by_length = {}
+        for word in words:
+            if word.isascii() and word.isalpha() and word.islower():
+                by_length.setdefault(len(word), []).append(word)
+        if np is not None:
+            self.tables = {length: WordMatrix(group, length) for length, group in by_length.items()}
+        else:
+            self.tables = by_length
+
+    def _candidates(self, length):
+        table = self.tables.get(length)
+        if table is None:
+            return None
+        if np is not None:
+            return _MatrixCandidates(table)
+        return _ListCandidates(table)
+
+    def next_letter(self, candidates, guessed):
+        """아직 추측하지 않은 알파벳 중 후보 단어를 가장 많이 덮는 것을 고릅니다."""
+        if candidates is not None and len(candidates):
+            counts = candidates.letter_counts()
+            best_code, best_count = None, 0
+            for code in range(26):
+                if code not in guessed and counts[code] > best_count:
+                    best_code, best_count = code, counts[code]
+            if best_code is not None:
+                return best_code
+        for letter in FALLBACK_ORDER:
+            code = ord(letter) - 97
+            if code not in guessed:
+                return code
+        return None
+
+    def play(self, session):
+        """GameSession이 끝날 때까지 알파벳을 추측하고, 끝난 세션을 돌려줍니다."""
+        candidates = self._candidates(len(session.target_word))
+        guessed = set()
+        while not session.finished:
+            code = self.next_letter(candidates, guessed)
+            if code is None:
+                break
+            guessed.add(code)
+            result = session.guess(ascii_lowercase[code])
+            if candidates is not None:
+                candidates.apply(code, result.positions if result.status == HIT else ())
+        return session
+
+
+def simulate(word_manager, topic=None, level=None, max_attempts=6, batch_size=1000, report=None):
+    """주제나 난이도의 모든 단어를 풀이기로 플레이하고 승률, 평균 오답 수, 초당 단어 수를 돌려줍니다."""
+    from word_manager import LEVEL_LENGTHS
+
+    index = word_manager._corpus()
+    if topic:
+        targets = list(dict.fromkeys(index.words_of(topic)))
+    elif level:
+        targets = index.words_in_lengths(*LEVEL_LENGTHS[level])
+    else:
+        targets = index.all_words()
+    solver = Solver(index.all_words())
+
+    games = wins = misses = 0
+    start = time.perf_counter()
+    for batch_start in range(0, len(targets), batch_size):
+        for word in targets[batch_start:batch_start + batch_size]:
+            session = solver.play(GameSession(word, max_attempts))
+            games += 1
+            wins += session.won
+            misses += max_attempts - session.attempts_left
+        if report:
+            report(games, len(targets), time.perf_counter() - start)
+    elapsed = time.perf_counter() - start
+    return {
+        "games": games,
+        "wins": wins,
+        "win_rate": wins / games if games else 0.0,
+        "avg_misses": misses / games if games else 0.0,
+        "words_per_sec": games / elapsed if elapsed > 0 else 0.0,
+        "elapsed": elapsed,
+    }
+
+
+def main(argv=None):
+    from word_manager import LEVEL_LENGTHS, WordManager
+
+    parser = argparse.ArgumentParser(description="자동 풀이기로 단어 목록 전체를 플레이해 난이도를 점검합니다.")
+    parser.add_argument("--topic", help="시뮬레이션할 주제 이름")
+    parser.add_argument("--level", choices=list(LEVEL_LENGTHS), help="시뮬레이션할 난이도")
+    parser.add_argument("--max-attempts", type=int, default=6, help="최대 시도 횟수 (기본값: 6)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="진행 상황을 보고할 단어 묶음 크기")
+    args = parser.parse_args(argv)
+
+    def report(done, total, elapsed):
+        print(f"  {done}/{total} 단어 완료 ({elapsed:.2f}초)")
+
+    result = simulate(WordManager(), args.topic, args.level, args.max_attempts, args.batch_size, report)
+    print(f"\n[🤖 자동 풀이 시뮬레이션] 최대 시도 {args.max_attempts}회")
+    print(f"게임 수: {result['games']}회")
+    print(f"승률: {result['win_rate'] * 100:.2f}%")
+    print(f"평균 오답 수: {result['avg_misses']:.2f}")
+    print(f"처리 속도: {result['words_per_sec']:.0f} 단어/초")
+
+
+if __name__ == "__main__":
+    main()
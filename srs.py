@@ -0,0 +1,165 @@
+# srs.py
+import heapq
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+DAY = 24 * 60 * 60
+MIN_EASE = 1.3
+
+Card = namedtuple("Card", ["word", "ease", "interval", "reps", "lapses", "due"])
+
+
+def new_card(word, now):
+    return Card(word, 2.5, 0, 0, 0, now)
+
+
+def schedule(card, quality, now):
+    """SM-2 방식으로 다음 복습 시각을 정합니다. quality는 0(전혀 모름) ~ 5(완벽)입니다.
+
+    3 미만이면 처음부터 다시 외우도록 간격을 하루로 되돌리고, 3 이상이면 1일, 6일, 그 뒤로는
+    이전 간격에 쉬움 정도(ease)를 곱한 만큼 늘립니다. ease는 답한 품질에 따라 조금씩 오르내립니다.
+    """
+    quality = max(0, min(5, quality))
+    ease = max(MIN_EASE, card.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    if quality < 3:
+        reps, interval, lapses = 0, 1, card.lapses + 1
+    else:
+        reps, lapses = card.reps + 1, card.lapses
+        if reps == 1:
+            interval = 1
+        elif reps == 2:
+            interval = 6
+        else:
+            interval = max(1, round(card.interval * card.ease))
+    return Card(card.word, ease, interval, reps, lapses, now + interval * DAY)
+
+
+def grade(won, misses, hints_used):
+    """게임 결과를 SM-2 품질 점수로 바꿉니다."""
+    if not won:
+        return 1
+    if misses == 0 and hints_used == 0:
+        return 5
+    if misses <= 2:
+        return 4
+    return 3
+
+
+class ReviewQueue:
+    """나만의 단어장 단어들의 복습 일정을 관리합니다.
+
+    카드는 sqlite3 테이블에 단어 단위로 저장하고 복습 시각(due)에 색인을 걸어 둡니다.
+    메모리에는 (복습 시각, 단어) 최소 힙을 두어 다음에 복습할 단어는 힙의 맨 앞에서 바로 꺼냅니다.
+    복습 결과로 일정이 바뀌면 새 항목을 힙에 넣기만 하고 예전 항목은 꺼낼 때 버리므로,
+    다음 단어 찾기와 복습 갱신이 모두 O(log n)입니다.
+    """
+
+    def __init__(self, db_path="data/reviews.db", clock=time.time):
+        self.db_path = db_path
+        self.clock = clock
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cards ("
+            "word TEXT PRIMARY KEY, ease REAL NOT NULL, interval INTEGER NOT NULL, "
+            "reps INTEGER NOT NULL, lapses INTEGER NOT NULL, due REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS cards_due ON cards (due)")
+        self.conn.commit()
+        self._due = {}   # 단어 -> 현재 복습 시각
+        self._heap = []  # (복습 시각, 단어). _due와 맞지 않는 항목은 지난 일정입니다.
+        for word, due in self.conn.execute("SELECT word, due FROM cards"):
+            self._due[word] = due
+            self._heap.append((due, word))
+        heapq.heapify(self._heap)
+
+    def __len__(self):
+        return len(self._due)
+
+    def __contains__(self, word):
+        return word in self._due
+
+    def _push(self, word, due):
+        self._due[word] = due
+        heapq.heappush(self._heap, (due, word))
+        # 지난 항목이 너무 많이 쌓이면 힙을 새로 만듭니다.
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(due, word) for word, due in self._due.items()]
+            heapq.heapify(self._heap)
+
+    def add_many(self, words):
+        """새 단어들을 지금 바로 복습할 카드로 넣습니다. 이미 있는 단어의 일정은 건드리지 않습니다."""
+        now = self.clock()
+        cards = [new_card(word, now) for word in dict.fromkeys(words) if word not in self._due]
+        if not cards:
+            return 0
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO cards VALUES (?, ?, ?, ?, ?, ?)", cards)
+        for card in cards:
+            self._push(card.word, card.due)
+        return len(cards)
+
+    def add(self, word):
+        return self.add_many([word]) > 0
+
+    def remove(self, word):
+        if self._due.pop(word, None) is None:
+            return False
+        with self.conn:
+            self.conn.execute("DELETE FROM cards WHERE word = ?", (word,))
+        return True
+
+    def card(self, word):
+        row = self.conn.execute(
+            "SELECT word, ease, interval, reps, lapses, due FROM cards WHERE word = ?", (word,)
+        ).fetchone()
+        return Card(*row) if row else None
+
+    def peek(self):
+        """가장 먼저 복습할 (복습 시각, 단어)를 돌려줍니다. 카드가 없으면 None입니다."""
+        heap = self._heap
+        while heap and self._due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def next_due(self, now=None):
+        """지금 복습할 차례가 된 단어 중 가장 오래 기다린 단어입니다. 없으면 None입니다."""
+        head = self.peek()
+        now = self.clock() if now is None else now
+        if head is None or head[0] > now:
+            return None
+        return head[1]
+
+    def due_count(self, now=None):
+        now = self.clock() if now is None else now
+        return self.conn.execute("SELECT COUNT(*) FROM cards WHERE due <= ?", (now,)).fetchone()[0]
+
+    def review(self, word, quality, now=None):
+        """복습 결과(quality)를 반영해 다음 일정을 정하고, 새 카드를 돌려줍니다."""
+        now = self.clock() if now is None else now
+        card = self.card(word) or new_card(word, now)
+        card = schedule(card, quality, now)
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO cards VALUES (?, ?, ?, ?, ?, ?)", card)
+        self._push(word, card.due)
+        return card
+
+    def upcoming(self):
+        """모든 카드를 복습 시각 순으로 돌려줍니다. (due 색인을 따라 읽으므로 따로 정렬하지 않습니다)"""
+        return self.conn.execute("SELECT word, due FROM cards ORDER BY due")
+
+    def close(self):
+        self.conn.close()
+
+
+def describe_due(due, now):
+    """복습 시각을 '지금', 'n일 뒤' 같은 짧은 말로 바꿉니다."""
+    remaining = due - now
+    if remaining <= 0:
+        return "지금"
+    if remaining < DAY:
+        hours = int(remaining // 3600)
+        return f"{hours}시간 뒤" if hours else "1시간 안"
+    return f"{int(remaining // DAY)}일 뒤"
@@ -0,0 +1,50 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TOPICS = {
+    "animals": ["lion", "tiger", "zebra", "monkey"],
+    "foods": ["apple", "bread", "cheese"],
+    "car": ["wheel", "engine"],
+}
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """word_lists/와 data/가 있는 빈 작업 폴더로 옮겨 갑니다. 게임 모듈은 상대 경로를 씁니다."""
+    word_lists = tmp_path / "word_lists"
+    word_lists.mkdir()
+    (tmp_path / "data").mkdir()
+    for topic, words in TOPICS.items():
+        (word_lists / f"{topic}.txt").write_text("\n".join(words), encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    # 공용 WriteBehind에 남은 쓰기는 상대 경로이므로 작업 폴더를 떠나기 전에 비웁니다.
+    from persistence import default_writer
+
+    default_writer().flush()
+
+
+def run_with_timeout(func, timeout=10):
+    """func를 다른 스레드에서 실행하고, timeout초 안에 끝나지 않으면 테스트를 실패시킵니다. (교착 상태 확인용)"""
+    import threading
+
+    errors = []
+
+    def target():
+        try:
+            func()
+        except BaseException as error:  # 스레드 안의 실패를 테스트 스레드로 넘깁니다.
+            errors.append(error)
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        pytest.fail(f"{timeout}초 안에 끝나지 않았습니다 (교착 상태).")
+    if errors:
+        raise errors[0]
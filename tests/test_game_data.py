@@ -0,0 +1,102 @@
+# tests/test_game_data.py
+import json
+import os
+
+from game_data import GameData
+from persistence import WriteBehind
+from players import Leaderboard
+
+
+def make_game_data(checkpoint_interval=50):
+    writer = WriteBehind("sync")
+    return GameData(checkpoint_interval=checkpoint_interval, writer=writer,
+                    leaderboard=Leaderboard(writer=writer))
+
+
+def read_checkpoint(game_data):
+    with open(game_data.filepath, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_checkpoint_saves_totals_up_to_the_journal_end(workdir):
+    game_data = make_game_data()
+    game_data.record_games([("lion", True, 3.0, "animals"), ("apple", False, None, "foods")])
+    assert read_checkpoint(game_data)["journal_offset"] == 0
+
+    game_data.checkpoint()
+
+    checkpoint = read_checkpoint(game_data)
+    with open(game_data.journal_path, 'rb') as f:
+        assert checkpoint["journal_offset"] == len(f.read())
+    assert (checkpoint["total_games"], checkpoint["wins"], checkpoint["best_time"]) == (2, 1, 3.0)
+
+
+GAMES = [
+    ("lion", True, 5.0, "animals"),
+    ("apple", False, None, "foods"),
+    ("wheel", True, 2.5, "car"),
+    ("tiger", True, 8.0, "animals"),
+    ("bread", False, None, "foods"),
+]
+
+
+def totals_and_analytics(game_data):
+    totals = game_data._sync()
+    return dict(totals), game_data.analytics.to_dict()
+
+
+def test_journal_replay_without_checkpoint(workdir):
+    game_data = make_game_data(checkpoint_interval=1000)
+    game_data.record_games(GAMES)
+    assert read_checkpoint(game_data)["journal_offset"] == 0
+
+    expected = totals_and_analytics(game_data)
+    assert expected[0] == {"total_games": 5, "wins": 3, "best_time": 2.5}
+    assert totals_and_analytics(make_game_data()) == expected
+
+
+def test_journal_replay_resumes_after_checkpoint(workdir):
+    game_data = make_game_data(checkpoint_interval=1000)
+    game_data.record_games(GAMES[:3])
+    game_data.checkpoint()
+    game_data.record_games(GAMES[3:])
+
+    replayed = make_game_data()
+    assert totals_and_analytics(replayed) == totals_and_analytics(game_data)
+    assert replayed._totals["total_games"] == 5
+
+
+def test_journal_replay_after_corrupt_checkpoint(workdir):
+    game_data = make_game_data()
+    game_data.record_games(GAMES)
+    game_data.checkpoint()
+    with open(game_data.filepath, 'w', encoding='utf-8') as f:
+        f.write("{")
+    os.remove(game_data.analytics_path)
+
+    assert totals_and_analytics(make_game_data()) == totals_and_analytics(game_data)
+
+
+def test_sync_picks_up_games_recorded_by_another_instance(workdir):
+    first = make_game_data()
+    first.record_game("lion", True, 5.0, "animals")
+    second = make_game_data()
+    second.record_games(GAMES[1:])
+    # 덧붙이다 만 줄은 끝날 때까지 읽지 않습니다.
+    with open(first.journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"word": "zeb')
+
+    assert first._sync() == {"total_games": 5, "wins": 3, "best_time": 2.5}
+    assert [log["word"] for log in first.iter_recent(2)] == ["bread", "tiger"]
+
+
+def test_recent_history_has_no_duplicates_when_flush_runs_midway(workdir):
+    writer = WriteBehind("async", flush_interval=3600)
+    game_data = GameData(writer=writer, leaderboard=Leaderboard(writer=WriteBehind("sync")))
+    game_data.record_games([("lion", True, 1.0), ("apple", False, None)])
+    recent = game_data.iter_recent()
+    assert next(recent)["word"] == "apple"
+    # 대기 줄을 복사한 뒤 저널로 옮겨져도 같은 기록이 다시 나오지 않아야 합니다.
+    writer.flush()
+    assert [log["word"] for log in recent] == ["lion"]
+    writer.close()
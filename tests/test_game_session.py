@@ -0,0 +1,84 @@
+# tests/test_game_session.py
+import random
+
+from game_session import (
+    FINISHED, HIT, INVALID, MISS, NO_HINTS, REPEATED, REVEALED, TIMEOUT, GameSession,
+)
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_hit_reveals_every_position_of_the_letter():
+    session = GameSession("apple", max_attempts=3)
+    result = session.guess("P")
+    assert (result.status, result.letter, result.positions) == (HIT, "p", (1, 2))
+    assert session.state().display == "_pp__"
+    assert session.attempts_left == 3
+
+
+def test_miss_repeat_and_invalid_guesses():
+    session = GameSession("apple", max_attempts=3)
+    assert session.guess("z").status == MISS
+    assert session.attempts_left == 2
+    # 같은 알파벳이나 알파벳 한 글자가 아닌 입력은 기회를 쓰지 않습니다.
+    assert session.guess("z").status == REPEATED
+    assert session.guess("ab").status == INVALID
+    assert session.guess("1").status == INVALID
+    assert session.attempts_left == 2
+    assert session.guessed() == ("z",)
+
+
+def test_win_and_lose():
+    clock = FakeClock()
+    won = GameSession("ab", max_attempts=1, clock=clock)
+    won.guess("a")
+    clock.now += 4
+    result = won.guess("b")
+    assert result.finished and result.won
+    assert won.elapsed() == 4
+    assert won.guess("c").status == FINISHED
+
+    lost = GameSession("ab", max_attempts=1)
+    result = lost.guess("z")
+    assert result.finished and not result.won
+    assert lost.guess("a").status == FINISHED
+
+
+def test_hint_uses_chooser_and_counts_down():
+    session = GameSession("apple", max_attempts=3, hint_count=1, hint_chooser=lambda s: 4)
+    result = session.hint()
+    assert (result.status, result.position, result.letter, result.hints_left) == (REVEALED, 4, "e", 0)
+    assert session.hint().status == NO_HINTS
+
+
+def test_hint_falls_back_to_random_when_chooser_picks_a_revealed_cell():
+    session = GameSession("apple", max_attempts=3, hint_count=2, revealed=(0,),
+                          rng=random.Random(1), hint_chooser=lambda s: 0)
+    result = session.hint()
+    assert result.status == REVEALED and result.position != 0
+    assert session.display[result.position] == "apple"[result.position]
+
+
+def test_hint_reveals_last_cell_and_wins():
+    session = GameSession("ab", max_attempts=3, hint_count=5, revealed=(0,))
+    assert session.hint().position == 1
+    assert session.won
+    assert session.hint().status == FINISHED
+
+
+def test_time_limit_expires_with_fake_clock():
+    clock = FakeClock()
+    session = GameSession("apple", max_attempts=3, time_limit=10, clock=clock)
+    clock.now += 9
+    assert not session.expire()
+    assert session.remaining_time() == 1
+    clock.now += 1
+    result = session.guess("a")
+    assert result.status == TIMEOUT
+    assert session.timed_out and session.finished and not session.won
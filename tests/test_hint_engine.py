@@ -0,0 +1,53 @@
+# tests/test_hint_engine.py
+import os
+
+from game_session import GameSession, REVEALED
+from word_manager import WordManager
+
+CARDS = ["cart", "card", "care", "core", "bore"]
+
+
+def make_word_manager():
+    with open(os.path.join("word_lists", "cards.txt"), 'w', encoding='utf-8') as f:
+        f.write("\n".join(CARDS))
+    return WordManager()
+
+
+def test_scores_count_remaining_candidates(workdir):
+    engine = make_word_manager().hint_engine()
+    # 4글자 단어는 CARDS와 lion입니다. care의 각 칸을 공개하면 c는 4개, a는 3개, r은 5개, e는 3개가 남습니다.
+    assert sorted(engine.scores("care", "____")) == [(3, 1), (3, 3), (4, 0), (5, 2)]
+    assert engine.choose("care", "____", strong=True) in (1, 3)
+    assert engine.choose("care", "____", strong=False) == 2
+
+
+def test_guessed_letters_exclude_candidates(workdir):
+    engine = make_word_manager().hint_engine()
+    # a가 드러났고 t는 틀렸으므로 후보는 card와 care뿐입니다.
+    assert sorted(engine.scores("care", "_a__", ("a", "t"))) == [(1, 3), (2, 0), (2, 2)]
+    assert engine.choose("care", "_a__", ("a", "t"), strong=True) == 3
+    assert engine.choose("care", "care", ("a", "t")) is None
+
+
+def test_prefill_picks_distinct_positions(workdir):
+    engine = make_word_manager().hint_engine()
+    assert sorted(engine.prefill("care", 4)) == [0, 1, 2, 3]
+    # 약한 힌트는 r(5개 남음)을 먼저, 그다음 c(4개 남음)를 공개합니다.
+    assert engine.prefill("care", 2, strong=False) == [2, 0]
+
+
+def test_added_word_invalidates_table(workdir, capsys):
+    word_manager = make_word_manager()
+    engine = word_manager.hint_engine()
+    assert dict((i, value) for value, i in engine.scores("care", "____"))[1] == 3
+
+    word_manager.add_word("cards", "dare", "", "")
+    assert "dare" in capsys.readouterr().out
+    assert sorted(engine.scores("care", "____")) == [(4, 0), (4, 1), (4, 3), (6, 2)]
+
+
+def test_session_hint_uses_engine(workdir):
+    engine = make_word_manager().hint_engine()
+    session = GameSession("care", 6, 1, hint_chooser=engine.chooser(strong=False))
+    result = session.hint()
+    assert result.status == REVEALED and result.position == 2 and result.letter == "r"
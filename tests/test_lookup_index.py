@@ -0,0 +1,107 @@
+# tests/test_lookup_index.py
+from lookup_index import LookupIndex, edit_distance
+from word_manager import WordManager
+
+WORDS = ["apple", "apply", "ample", "maple", "banana", "bandana", "cherry"]
+
+
+def test_edit_distance_counts_transposition_as_one():
+    assert edit_distance("apple", "apple", 2) == 0
+    assert edit_distance("apple", "paple", 2) == 1
+    assert edit_distance("apple", "banana", 2) == 3
+
+
+def test_suggest_and_complete():
+    index = LookupIndex(WORDS)
+    assert index.suggest("appel") == ["apple", "ample", "apply"]
+    assert index.complete("ban") == ["banana", "bandana"]
+    index.remove("apple")
+    index.add("applet")
+    assert "apple" not in index.suggest("appel")
+    assert index.complete("app") == ["applet", "apply"]
+
+
+def test_suggest_checks_at_most_max_checks_candidates(monkeypatch):
+    import lookup_index
+
+    index = LookupIndex([f"word{i:03d}" for i in range(500)], max_checks=10)
+    calls = []
+    real = lookup_index.edit_distance
+    monkeypatch.setattr(lookup_index, "edit_distance", lambda *args: calls.append(args) or real(*args))
+    index.suggest("word")
+    assert len(calls) <= 10
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "lookup")
+    index = LookupIndex(WORDS)
+    index.add("grape")
+    index.save(path, [1, 2])
+    loaded = LookupIndex.load(path, [1, 2])
+    assert loaded.suggest("grap") == index.suggest("grap")
+    assert loaded.complete("") == index.complete("")
+    assert LookupIndex.load(path, [1, 3]) is None
+
+
+def test_lookup_is_built_in_background_and_keeps_pending_changes(workdir, monkeypatch, capsys):
+    import threading
+
+    release = threading.Event()
+    build = WordManager._build_lookup
+
+    def slow_build(self, source):
+        release.wait(10)
+        build(self, source)
+
+    monkeypatch.setattr(WordManager, "_build_lookup", slow_build)
+    manager = WordManager()
+    manager.meanings.upsert_many([(word, "뜻", "예문") for word in WORDS])
+    assert manager.lookup_index(wait=False) is None
+
+    # 색인을 만드는 동안에는 sqlite로 접두어만 찾아 줍니다.
+    capsys.readouterr()
+    manager.show_word_meaning("appl")
+    out = capsys.readouterr().out
+    assert "준비하고 있습니다" in out
+    assert "'appl'(으)로 시작하는 단어: apple, apply" in out
+
+    manager.meanings.upsert("grape", "포도", "A grape.")
+    manager.index_meanings(["grape"])
+    release.set()
+    lookup = manager.lookup_index()
+    assert "grape" in lookup
+    assert lookup.suggest("appel") == ["apple", "ample", "apply"]
+
+
+def test_lookup_snapshot_save_failure_keeps_the_index(workdir, monkeypatch):
+    def fail(self, path, source):
+        raise OSError("읽기 전용")
+
+    monkeypatch.setattr(LookupIndex, "save", fail)
+    manager = WordManager()
+    manager.meanings.upsert_many([(word, "뜻", "예문") for word in WORDS])
+    lookup = manager.lookup_index()
+    assert lookup is not None and "apple" in lookup
+    assert manager._lookup_dirty
+    manager.save_snapshots()
+
+
+def test_lookup_build_failure_falls_back_and_retries(workdir, monkeypatch, capsys):
+    import sqlite3
+
+    from meaning_store import MeaningStore
+
+    manager = WordManager()
+    manager.meanings.upsert_many([(word, "뜻", "예문") for word in WORDS])
+
+    def broken(self):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(MeaningStore, "words", broken)
+    assert manager.lookup_index() is None
+    capsys.readouterr()
+    manager.show_word_meaning("ban")
+    assert "'ban'(으)로 시작하는 단어: banana, bandana" in capsys.readouterr().out
+
+    monkeypatch.undo()
+    assert "apple" in manager.lookup_index()
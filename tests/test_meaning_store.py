@@ -0,0 +1,28 @@
+# tests/test_meaning_store.py
+import json
+
+import pytest
+
+import persistence
+from meaning_store import MeaningStore
+
+
+def test_export_round_trip_and_interrupted_export_keeps_old_file(workdir, monkeypatch):
+    store = MeaningStore("data/meanings.db", "data/meanings.json")
+    store.upsert("Apple", "사과", "An apple.")
+    assert store.export_json() == 1
+    with open("data/meanings.json", encoding='utf-8') as f:
+        exported = f.read()
+    assert json.loads(exported) == {"apple": {"meaning": "사과", "example": "An apple."}}
+
+    store.upsert("pear", "배", "A pear.")
+
+    def interrupted(src, dst):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(persistence.os, "replace", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        store.export_json()
+    with open("data/meanings.json", encoding='utf-8') as f:
+        assert f.read() == exported
+    store.close()
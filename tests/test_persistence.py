@@ -0,0 +1,38 @@
+# tests/test_persistence.py
+from persistence import WriteBehind
+
+
+def test_failing_writer_does_not_stop_other_writers(capsys):
+    writer = WriteBehind("async", flush_interval=60)
+    written = []
+
+    def broken(fsync):
+        raise TypeError("직렬화 실패")
+
+    writer.mark("broken", broken)
+    writer.mark("good", lambda fsync: written.append("good"))
+    writer.flush()
+    assert written == ["good"]
+    assert "broken" in capsys.readouterr().out
+
+    writer.mark("good", lambda fsync: written.append("again"))
+    writer.flush()
+    assert written == ["good", "again"]
+    assert writer._thread.is_alive()
+    writer.close()
+
+
+def test_os_error_is_retried_on_next_flush():
+    writer = WriteBehind("async", flush_interval=60)
+    attempts = []
+
+    def flaky(fsync):
+        attempts.append(fsync)
+        if len(attempts) == 1:
+            raise OSError("디스크 가득 참")
+
+    writer.mark("flaky", flaky)
+    writer.flush()
+    writer.flush()
+    assert len(attempts) == 2
+    writer.close()
@@ -0,0 +1,61 @@
+# tests/test_players.py
+import json
+import os
+
+from game_data import GameData
+from persistence import WriteBehind
+from players import PLAYERS_ROOT, Leaderboard, player_dir
+
+
+def read_leaderboard(leaderboard):
+    with open(leaderboard.path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_player_dir_is_sharded_and_safe():
+    path = player_dir("../kim/lee")
+    shard, name = os.path.relpath(path, PLAYERS_ROOT).split(os.sep)
+    assert len(shard) == 2 and name == "___kim_lee"
+    assert player_dir("../kim/lee") == path
+
+
+def test_players_keep_separate_records(workdir):
+    writer = WriteBehind("sync")
+    leaderboard = Leaderboard(writer=writer)
+    kim = GameData(writer=writer, player_id="kim", leaderboard=leaderboard)
+    lee = GameData(writer=writer, player_id="lee", leaderboard=leaderboard)
+    kim.record_games([("lion", True, 4.0, "animals"), ("apple", True, 2.5, "foods")])
+    lee.record_games([("tiger", False, None, "animals")])
+
+    assert os.path.dirname(kim.journal_path) == player_dir("kim")
+    assert [game["word"] for game in kim.iter_recent()] == ["apple", "lion"]
+    assert [game["word"] for game in lee.iter_recent()] == ["tiger"]
+    assert not os.path.exists(os.path.join("data", "game_records.jsonl"))
+
+    data = read_leaderboard(leaderboard)
+    assert (data["games"], data["wins"]) == (3, 2)
+    assert [entry["player"] for entry in data["boards"]["wins"]] == ["kim"]
+    assert data["boards"]["best_time"][0]["best_time"] == 2.5
+
+
+def test_leaderboards_merge_deltas_from_other_processes(workdir):
+    # 두 프로세스의 Leaderboard처럼, 같은 파일을 서로 다른 인스턴스가 증분으로 합칩니다.
+    first = Leaderboard(writer=WriteBehind("sync"))
+    second = Leaderboard(writer=WriteBehind("sync"))
+    first.record("kim", 2, 2, {"total_games": 2, "wins": 2, "best_time": 3.0})
+    second.record("lee", 3, 1, {"total_games": 3, "wins": 1, "best_time": None})
+    # 더 적은 게임 수의 오래된 통계는 최신 통계를 덮어쓰지 않습니다.
+    second.record("kim", 0, 0, {"total_games": 1, "wins": 1, "best_time": 5.0})
+
+    data = read_leaderboard(first)
+    assert (data["games"], data["wins"]) == (5, 3)
+    assert [(entry["player"], entry["wins"]) for entry in data["boards"]["wins"]] == [("kim", 2), ("lee", 1)]
+    assert [entry["player"] for entry in data["boards"]["best_time"]] == ["kim"]
+    assert data["boards"]["best_time"][0]["best_time"] == 3.0
+
+
+def test_boards_keep_only_top_k(workdir):
+    leaderboard = Leaderboard(top_k=2, writer=WriteBehind("sync"))
+    for wins, player in enumerate(["a", "b", "c"], 1):
+        leaderboard.record(player, wins, wins, {"total_games": wins, "wins": wins, "best_time": None})
+    assert [entry["player"] for entry in leaderboard.snapshot()["boards"]["wins"]] == ["c", "b"]
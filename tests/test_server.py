@@ -0,0 +1,81 @@
+# tests/test_server.py
+import asyncio
+
+from game_data import GameData
+from persistence import WriteBehind
+from players import Leaderboard
+from server import HangmanServer
+from word_manager import WordManager
+
+
+def make_game_data():
+    writer = WriteBehind("sync")
+    return GameData(writer=writer, leaderboard=Leaderboard(writer=writer))
+
+
+async def talk(server, lines):
+    """서버를 띄우고 lines를 한 줄씩 보내 받은 응답을 돌려줍니다. None은 보내지 않고 한 줄만 더 읽습니다."""
+    tcp_server = await server.start("127.0.0.1", 0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    replies = [(await reader.readline()).decode().strip()]
+    for line in lines:
+        if line is not None:
+            writer.write((line + "\n").encode())
+            await writer.drain()
+        replies.append((await reader.readline()).decode().strip())
+    writer.close()
+    tcp_server.close()
+    await tcp_server.wait_closed()
+    await server.close()
+    return replies
+
+
+def test_new_game_rejects_unknown_topics_and_clamps_lengths(workdir):
+    manager = WordManager()
+    server = HangmanServer(manager, make_game_data(), {"max_attempts": 6, "hint_count": 0})
+    replies = asyncio.run(talk(server, [
+        "NEW topic nothing",
+        "NEW length 99 99999999999999999999",
+        "NEW length 5 1",
+        "NEW topic car",
+    ]))
+    assert replies[:4] == ["OK hangman ready", "ERR no word", "ERR no word", "ERR no word"]
+    assert replies[4].startswith("GAME ")
+    assert list(manager.dealers) == [] and set(manager._sampled) == {"topic:car"}
+
+
+def test_finished_games_are_recorded(workdir):
+    manager = WordManager()
+    game_data = make_game_data()
+    server = HangmanServer(manager, game_data, {"max_attempts": 1, "hint_count": 0})
+    replies = asyncio.run(talk(server, ["NEW topic car", "GUESS q", None]))
+    assert replies[2].startswith("MISS ")
+    assert replies[3].startswith("LOSE ")
+    assert game_data._sync()["total_games"] == 1
+
+
+def test_result_writer_survives_a_failed_batch(workdir):
+    from server import ResultWriter
+
+    class FlakyGameData:
+        def __init__(self):
+            self.recorded = []
+
+        def record_games(self, batch):
+            if not self.recorded:
+                self.recorded.append(None)
+                raise OSError("디스크가 가득 찼습니다")
+            self.recorded.extend(batch)
+
+    async def run():
+        game_data = FlakyGameData()
+        writer = ResultWriter(game_data, flush_interval=0.01)
+        writer.start()
+        await writer.put("lion", True, 1.0)
+        await asyncio.wait_for(writer.queue.join(), 5)
+        await writer.put("apple", False, None)
+        await asyncio.wait_for(writer.close(), 5)
+        return game_data.recorded
+
+    assert asyncio.run(run()) == [None, ("apple", False, None, None)]
@@ -0,0 +1,31 @@
+# tests/test_simulation.py
+import os
+
+import simulation
+from word_index import CorpusIndex
+
+
+def make_index():
+    index = CorpusIndex("word_lists")
+    index.refresh()
+    return index
+
+
+def test_range_shards_split_sorted_words(workdir):
+    shards = simulation.make_shards(make_index(), "range", 3)
+    assert [len(shard) for _, shard in shards] == [3, 3, 3]
+    words = [word for _, shard in shards for word in shard]
+    assert words == sorted(words) and len(words) == 9
+    assert shards[0][0] == f"{shards[0][1][0]}..{shards[0][1][-1]}"
+
+
+def test_empty_corpus_has_no_shards(workdir, capsys):
+    for name in os.listdir("word_lists"):
+        os.remove(os.path.join("word_lists", name))
+    index = make_index()
+    assert simulation.make_shards(index, "range") == []
+    assert simulation.make_shards(index, "topic") == []
+    assert simulation.run_simulation(index, shard_by="range") == ([], {"games": 0, "wins": 0, "misses": 0}, 0.0)
+
+    simulation.main(["--shard", "range"])
+    assert "플레이할 단어가 없습니다." in capsys.readouterr().out
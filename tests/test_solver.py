@@ -0,0 +1,45 @@
+# tests/test_solver.py
+import pytest
+
+import solver
+from tests.conftest import TOPICS
+from game_session import GameSession
+from word_manager import WordManager
+
+WORDS = [word for words in TOPICS.values() for word in words]
+
+
+@pytest.fixture(params=["numpy", "list"])
+def backend(request, monkeypatch):
+    """numpy 행렬 구현과, numpy가 없을 때의 목록 구현을 모두 확인합니다."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(solver, "np", None)
+    return request.param
+
+
+def test_solver_wins_every_known_word(backend):
+    player = solver.Solver(WORDS)
+    for word in WORDS:
+        session = player.play(GameSession(word, 6))
+        assert session.won, word
+        assert session.display == list(word)
+
+
+def test_unknown_length_falls_back_to_letter_order(backend):
+    session = solver.Solver(WORDS).play(GameSession("eat", 6))
+    assert session.won
+    # 같은 길이의 후보가 없으므로 FALLBACK_ORDER의 앞 글자(e, t, a)만으로 맞힙니다.
+    assert set(session.guessed()) == set(solver.FALLBACK_ORDER[:3])
+
+
+def test_simulate_reports_every_game(workdir, backend):
+    reports = []
+    result = solver.simulate(WordManager(), batch_size=4, report=lambda *args: reports.append(args[:2]))
+    assert result["games"] == 9 and result["wins"] == 9
+    assert result["win_rate"] == 1.0
+    assert [done for done, _ in reports] == [4, 8, 9]
+
+    by_topic = solver.simulate(WordManager(), topic="car")
+    assert by_topic["games"] == 2
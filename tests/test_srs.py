@@ -0,0 +1,48 @@
+# tests/test_srs.py
+from srs import DAY, ReviewQueue
+from word_manager import WordManager
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_queue_serves_due_words_in_order(workdir):
+    clock = FakeClock()
+    queue = ReviewQueue("data/reviews.db", clock=clock)
+    queue.add_many(["lion", "apple"])
+    assert queue.next_due() == "apple"
+
+    queue.review("lion", 5)
+    queue.review("apple", 1)
+    assert queue.next_due() is None
+    clock.now += DAY
+    assert queue.next_due() == "apple"
+    assert queue.due_count() == 2
+    queue.review("apple", 5)
+    assert queue.next_due() == "lion"
+    queue.close()
+
+    reopened = ReviewQueue("data/reviews.db", clock=clock)
+    assert reopened.next_due() == "lion" and len(reopened) == 2
+    reopened.close()
+
+
+def test_review_steps_do_not_reread_the_wordbook(workdir, monkeypatch):
+    manager = WordManager()
+    manager.add_to_my_wordbook("lion")
+    reads = []
+    read = WordManager._read_wordbook_file
+    monkeypatch.setattr(WordManager, "_read_wordbook_file", lambda self: reads.append(1) or read(self))
+
+    assert manager.next_review_word() == "lion"
+    manager.add_to_my_wordbook("tiger")
+    manager.record_review("lion", 5)
+    assert manager.next_review_word() == "tiger"
+    manager.record_review("tiger", 5)
+    assert manager.next_review_word() is None
+    assert len(reads) == 1
@@ -0,0 +1,60 @@
+# tests/test_word_dealer.py
+import random
+
+from persistence import default_writer
+from tests.conftest import TOPICS
+from word_dealer import WordDealer
+from word_manager import WordManager
+
+
+def test_dealer_deals_every_word_once_per_cycle():
+    dealer = WordDealer(["a", "b", "c"], dealt=["b"], rng=random.Random(3))
+    first = [dealer.draw() for _ in range(2)]
+    assert sorted(word for word, _ in first) == ["a", "c"]
+    word, reset = dealer.draw()
+    assert reset and word in "abc"
+
+
+def test_dealt_words_survive_a_restart(workdir):
+    manager = WordManager()
+    drawn = [manager.get_word_by_topic("animals") for _ in range(2)]
+    default_writer().flush()
+
+    restarted = WordManager()
+    rest = [restarted.get_word_by_topic("animals") for _ in range(2)]
+    assert sorted(drawn + rest) == sorted(TOPICS["animals"])
+
+
+def test_empty_and_unknown_pools_do_not_build_dealers(workdir):
+    manager = WordManager()
+    for i in range(200):
+        assert manager.get_word_by_topic(f"nothing{i}") is None
+        assert manager.get_word_by_length(40 + i, 50 + i) is None
+    assert manager.dealers == {}
+
+
+def test_length_ranges_share_one_pool_and_cache_is_bounded(workdir):
+    manager = WordManager()
+    manager.max_dealers = 2
+    for i in range(100):
+        manager.get_word_by_length(1, 20 + i)
+        manager.get_word_by_length(0, 6 + i)
+    # 단어의 글자 수는 4~6뿐이므로 모든 범위가 한 풀입니다.
+    assert list(manager.dealers) == ["len:4-6"]
+    assert set(manager.dealer_log.load()) == {"len:4-6"}
+
+    for i in range(20):
+        manager.get_word_by_topic("animals" if i % 2 else "foods")
+        manager.get_word_by_length(4, 5)
+    assert len(manager.dealers) <= manager.max_dealers
+
+
+def test_evicted_dealer_continues_its_cycle(workdir):
+    manager = WordManager()
+    manager.max_dealers = 1
+    drawn = []
+    for _ in range(len(TOPICS["animals"])):
+        drawn.append(manager.get_word_by_topic("animals"))
+        manager.get_word_by_topic("foods")
+        manager.get_word_by_topic("car")
+    assert sorted(drawn) == sorted(TOPICS["animals"])
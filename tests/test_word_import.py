@@ -0,0 +1,43 @@
+# tests/test_word_import.py
+import word_import
+from word_manager import WordManager
+
+
+def write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_import_jsonl_counts_non_object_rows_as_invalid(workdir, capsys):
+    write("words.jsonl", "\n".join([
+        '{"word": "Bear", "topic": "animals", "meaning": "곰", "example": "A bear."}',
+        '[1, 2]',
+        '"x"',
+        '{broken',
+        '{"word": "lion", "topic": "animals"}',
+        '{"word": "kiwi", "topic": "fruits"}',
+    ]))
+    word_import.main(["words.jsonl"])
+    out = capsys.readouterr().out
+    assert "6행 중 1개 단어를 가져왔습니다" in out
+    assert "잘못된 행: 3, 중복: 1, 없는 주제: 1" in out
+
+    manager = WordManager()
+    assert manager._corpus().in_topic("animals", "bear")
+    assert manager.meanings.get("bear")["meaning"] == "곰"
+
+
+def test_import_csv_creates_topics(workdir):
+    write("words.csv", "word,topic\nsushi,dishes\nramen,dishes\nsushi,dishes\n")
+    importer = word_import.BulkImporter(WordManager(), create_topics=True)
+    stats = importer.run(word_import.read_rows("words.csv"))
+    assert (stats["rows"], stats["imported"], stats["duplicates"]) == (3, 2, 1)
+    assert WordManager()._corpus().words_of("dishes") == ["sushi", "ramen"]
+
+
+def test_progress_reports_rows_read_even_when_rows_are_rejected(workdir):
+    calls = []
+    importer = word_import.BulkImporter(WordManager())
+    importer.run(({"word": "1"} for _ in range(10)), progress=lambda rows, _: calls.append(rows), progress_every=4)
+    assert calls == [4, 8]
+    assert importer.stats["invalid"] == 10
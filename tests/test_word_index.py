@@ -0,0 +1,140 @@
+# tests/test_word_index.py
+import os
+
+from tests.conftest import run_with_timeout
+from word_index import CorpusIndex
+
+
+def append_word(topic, word):
+    with open(os.path.join("word_lists", f"{topic}.txt"), 'a', encoding='utf-8') as f:
+        f.write(f"\n{word}")
+
+
+def make_index():
+    index = CorpusIndex("word_lists")
+    index.refresh()
+    return index
+
+
+def test_refresh_loads_every_topic(workdir):
+    index = make_index()
+    assert index.topics() == ["animals", "car", "foods"]
+    assert index.in_topic("foods", "apple")
+    assert index.topics_of("lion") == {"animals"}
+
+
+def test_refresh_rereads_only_changed_topics(workdir, monkeypatch):
+    index = make_index()
+    append_word("car", "brake")
+    os.remove(os.path.join("word_lists", "foods.txt"))
+    read = []
+    read_topic = index._read_topic
+    monkeypatch.setattr(index, "_read_topic", lambda topic: read.append(topic) or read_topic(topic))
+
+    index.refresh()
+    assert read == ["car"]
+    assert index.words_of("car") == ["wheel", "engine", "brake"]
+    assert index.topics() == ["animals", "car"]
+    assert "apple" not in index.all_words()
+
+    index.refresh()
+    assert read == ["car"]
+
+
+def test_word_store_interns_each_word_once():
+    from word_index import WordStore
+
+    store = WordStore()
+    ids = [store.intern(word) for word in ["lion", "tiger", "lion", "사자"] + [f"w{i}" for i in range(100)]]
+    assert ids[:4] == [0, 1, 0, 2]
+    assert len(store) == 103
+    assert store.word(2) == "사자" and store.find("tiger") == 1 and store.find("bear") is None
+
+    copy = WordStore()
+    copy.load(store.blob, memoryview(store.offsets))
+    assert [copy.word(i) for i in range(len(copy))] == [store.word(i) for i in range(len(store))]
+    assert copy.find("w99") == store.find("w99")
+
+
+def test_words_shared_by_topics_are_stored_once(workdir):
+    append_word("foods", "lion")
+    index = make_index()
+    assert len(index.store) == 9
+    assert index.topics_of("lion") == {"animals", "foods"}
+    assert index.count() == 9 and index.count(6, 6) == 3
+
+
+def test_delete_hides_word_until_it_is_added_again(workdir):
+    index = make_index()
+    index.tombstones.add("animals", "lion")
+    index.refresh()
+    assert not index.in_topic("animals", "lion")
+    assert "lion" not in index.all_words()
+
+    # 기록 하나는 앞쪽의 한 번만 지우므로, 다시 덧붙인 단어는 살아 있습니다.
+    append_word("animals", "lion")
+    index.refresh()
+    assert index.words_of("animals").count("lion") == 1
+    assert make_index().words_of("animals").count("lion") == 1
+
+
+def test_compact_rewrites_topic_file_and_keeps_words(workdir):
+    index = make_index()
+    index.tombstones.add("animals", "tiger")
+    index.tombstones.add("animals", "zebra")
+    index.refresh()
+    before = sorted(index.words_of("animals"))
+
+    assert index.tombstones.compact("animals")
+    assert not os.path.exists(index.tombstones.path("animals"))
+    with open("word_lists/animals.txt", encoding='utf-8') as f:
+        assert f.read().split() == ["lion", "monkey"]
+
+    index.refresh()
+    assert sorted(index.words_of("animals")) == before == ["lion", "monkey"]
+    assert sorted(make_index().words_of("animals")) == before
+
+
+def test_compact_keeps_tombstones_written_after_it_started(workdir):
+    index = make_index()
+    index.tombstones.add("animals", "tiger")
+    assert index.tombstones.compact("animals")
+    index.tombstones.add("animals", "lion")
+    index.refresh()
+    assert sorted(index.words_of("animals")) == ["monkey", "zebra"]
+
+
+def test_refresh_topic_on_cold_index_under_topic_lock(workdir):
+    index = CorpusIndex("word_lists")
+    # 여러 주제가 새로 읽을 대상이어도 refresh_topic은 스레드 풀을 쓰지 않으므로 잠금 안에서 불러도 됩니다.
+    def refresh_under_lock():
+        with index.tombstones.lock("animals").exclusive():
+            index.refresh_topic("animals")
+
+    run_with_timeout(refresh_under_lock)
+    assert index.topics() == ["animals"]
+    assert index.in_topic("animals", "zebra")
+
+    index.refresh()
+    assert index.topics() == ["animals", "car", "foods"]
+
+
+def test_refresh_topic_reloads_only_when_files_change(workdir):
+    index = make_index()
+    with index.tombstones.lock("foods").exclusive():
+        index.refresh_topic("foods")
+        assert index.words_of("foods") == ["apple", "bread", "cheese"]
+        append_word("foods", "mango")
+        index.tombstones.add("foods", "bread")
+        index.refresh_topic("foods")
+    assert index.words_of("foods") == ["apple", "cheese", "mango"]
+
+
+def test_parallel_topic_reads_return_every_topic(workdir):
+    index = CorpusIndex("word_lists", load_workers=4)
+    topics = dict(index.read_topics(["animals", "car", "foods"]))
+    assert topics == {
+        "animals": ["lion", "tiger", "zebra", "monkey"],
+        "car": ["wheel", "engine"],
+        "foods": ["apple", "bread", "cheese"],
+    }
@@ -0,0 +1,68 @@
+# tests/test_word_manager.py
+from tests.conftest import run_with_timeout
+from word_manager import WordManager
+
+
+def test_add_word_on_cold_index(workdir):
+    manager = WordManager()
+    run_with_timeout(lambda: manager.add_word("animals", "bear", "곰", "A bear."))
+    assert manager.index.in_topic("animals", "bear")
+    assert WordManager()._corpus().in_topic("animals", "bear")
+
+
+def test_delete_word_on_cold_index(workdir):
+    manager = WordManager()
+    run_with_timeout(lambda: manager.delete_word("animals", "lion"))
+    assert not manager.index.in_topic("animals", "lion")
+    assert not WordManager()._corpus().in_topic("animals", "lion")
+
+
+def test_add_sees_change_made_by_another_process(workdir):
+    manager = WordManager()
+    manager._corpus()
+    with open("word_lists/foods.txt", 'a', encoding='utf-8') as f:
+        f.write("\nmango")
+    manager.add_word("foods", "mango", "망고", "A mango.")
+    assert manager.index.words_of("foods").count("mango") == 1
+
+
+def test_wordbook_refresh_and_write_behind_do_not_deadlock(workdir):
+    import threading
+
+    manager = WordManager()
+    manager.add_to_my_wordbook("lion")
+    stop = threading.Event()
+
+    def write_loop():
+        while not stop.is_set():
+            manager._write_wordbook()
+
+    writer = threading.Thread(target=write_loop, daemon=True)
+    writer.start()
+
+    def refresh_loop():
+        for _ in range(300):
+            manager._load_wordbook(refresh=True)
+
+    try:
+        run_with_timeout(refresh_loop)
+    finally:
+        stop.set()
+        writer.join(5)
+    assert manager._load_wordbook(refresh=True) == ["lion"]
+
+
+def test_draws_do_not_rescan_topics_within_refresh_interval(workdir, monkeypatch):
+    import os
+
+    manager = WordManager()
+    manager.get_random_word()
+    scans = []
+    real_listdir = os.listdir
+    monkeypatch.setattr(os, "listdir", lambda path: scans.append(path) or real_listdir(path))
+    for _ in range(20):
+        manager.get_random_word()
+    assert scans == []
+    manager._refreshed_at -= manager.refresh_interval
+    manager.get_random_word()
+    assert scans == ["word_lists"]
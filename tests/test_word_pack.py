@@ -0,0 +1,56 @@
+# tests/test_word_pack.py
+import os
+
+import pytest
+
+from word_index import CorpusIndex
+from word_manager import WordManager
+from word_pack import compile_pack, open_pack
+
+
+def test_pack_round_trip(workdir):
+    assert compile_pack("word_lists", "data/words.pack") == 9
+    pack = open_pack("data/words.pack")
+    index = CorpusIndex("word_lists")
+    index.load_pack(pack)
+    pack.close()
+
+    fresh = CorpusIndex("word_lists")
+    fresh.refresh()
+    assert index.topics() == fresh.topics()
+    for topic in fresh.topics():
+        assert index.words_of(topic) == fresh.words_of(topic)
+    assert index.count(5, 5) == fresh.count(5, 5)
+    assert index._signatures == fresh._signatures
+
+
+def test_stale_topic_is_reread_from_txt(workdir):
+    compile_pack("word_lists", "data/words.pack")
+    with open("word_lists/car.txt", 'a', encoding='utf-8') as f:
+        f.write("\nbrake")
+    manager = WordManager()
+    assert manager._corpus().words_of("car") == ["wheel", "engine", "brake"]
+    assert manager._pack_sources["car"] != manager.index._signatures["car"]
+
+
+@pytest.mark.parametrize("keep", [3, 20, 40, -1])
+def test_truncated_pack_is_ignored(workdir, keep):
+    compile_pack("word_lists", "data/words.pack")
+    with open("data/words.pack", 'rb') as f:
+        data = f.read()
+    with open("data/words.pack", 'wb') as f:
+        f.write(data[:keep])
+    assert open_pack("data/words.pack") is None
+    assert WordManager()._corpus().words_of("car") == ["wheel", "engine"]
+
+
+def test_pack_with_corrupt_meta_is_ignored(workdir):
+    compile_pack("word_lists", "data/words.pack")
+    with open("data/words.pack", 'r+b') as f:
+        data = bytearray(f.read())
+        start = data.index(b'{"topics"')
+        data[start:start + 9] = b'[1,2,3]  '
+        f.seek(0)
+        f.write(data)
+    assert os.path.getsize("data/words.pack") == len(data)
+    assert open_pack("data/words.pack") is None
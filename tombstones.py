@@ -0,0 +1,184 @@
+# tombstones.py
+import os
+import threading
+from collections import Counter
+from file_lock import lock_for
+
+
+class TopicTombstones:
+    """주제 파일에서 지운 단어를 주제별 옆 파일(<주제>.tomb)에 한 줄씩 덧붙여 기록합니다.
+
+    삭제는 '-단어' 한 줄을 덧붙이는 것으로 끝나고, 주제 파일을 읽는 쪽이 apply()로 걸러 냅니다.
+    기록 하나는 주제 파일 앞쪽부터 같은 단어 한 번을 지웁니다. (list.remove와 같은 규칙)
+    기록이 compact_threshold개를 넘으면 백그라운드 스레드가 주제 파일을 다시 쓰고 기록을 비웁니다.
+    주제 파일과 기록은 lock(주제)의 잠금으로 보호합니다. 읽을 때는 공유 잠금을, 덧붙이거나
+    압축 결과로 교체할 때는 배타 잠금을 잡으므로 다른 프로세스와도 겹치지 않습니다.
+    """
+
+    def __init__(self, word_lists_path, compact_threshold=1000):
+        self.word_lists_path = word_lists_path
+        self.compact_threshold = compact_threshold
+        self._counts = {}  # 주제 -> 기록 수
+        self._guard = threading.Lock()
+        self._compacting = set()
+
+    def lock(self, topic):
+        return lock_for(self._topic_path(topic))
+
+    def path(self, topic):
+        return os.path.join(self.word_lists_path, f"{topic}.tomb")
+
+    def _topic_path(self, topic):
+        return os.path.join(self.word_lists_path, f"{topic}.txt")
+
+    def stat(self, topic):
+        """기록 파일의 (mtime_ns, size)입니다. 기록이 없으면 (0, 0)입니다."""
+        try:
+            st = os.stat(self.path(topic))
+        except FileNotFoundError:
+            return (0, 0)
+        return (st.st_mtime_ns, st.st_size)
+
+    def read(self, topic):
+        """단어 -> 지울 횟수를 돌려줍니다."""
+        removed = Counter()
+        try:
+            with open(self.path(topic), 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.startswith('-') and line[1:].strip():
+                        removed[line[1:].strip().lower()] += 1
+        except FileNotFoundError:
+            pass
+        self._counts[topic] = sum(removed.values())
+        return removed
+
+    def apply(self, topic, words, key=str.lower):
+        """words에서 기록된 단어를 앞쪽부터 기록 횟수만큼 걸러 냅니다. (이미 소문자라면 key=None)"""
+        removed = self.read(topic)
+        if not removed:
+            return list(words)
+        kept = []
+        for word in words:
+            name = key(word) if key else word
+            if removed.get(name):
+                removed[name] -= 1
+            else:
+                kept.append(word)
+        return kept
+
+    def count(self, topic):
+        if topic not in self._counts:
+            self.read(topic)
+        return self._counts[topic]
+
+    def add(self, topic, word):
+        """단어 하나의 삭제를 기록하고, 기록이 많이 쌓였으면 백그라운드 압축을 시작합니다."""
+        with self.lock(topic).exclusive():
+            count = self.count(topic)
+            with open(self.path(topic), 'a', encoding='utf-8') as f:
+                f.write(f"-{word.lower()}\n")
+            self._counts[topic] = count + 1
+        if count + 1 >= self.compact_threshold:
+            self.compact_in_background(topic)
+
+    def discard(self, topic):
+        """주제가 삭제될 때 기록 파일도 함께 지웁니다."""
+        with self.lock(topic).exclusive():
+            try:
+                os.remove(self.path(topic))
+            except FileNotFoundError:
+                pass
+            self._counts.pop(topic, None)
+
+    def compact(self, topic):
+        """기록을 반영해 주제 파일을 임시 파일에 다시 쓴 뒤 이름 바꾸기로 교체하고, 반영한 기록을 지웁니다.
+
+        다시 쓰는 동안 주제 파일에 단어가 추가됐다면 교체하지 않고 False를 돌려줍니다.
+        그 사이 새로 쌓인 기록은 남겨 둡니다.
+        """
+        topic_path = self._topic_path(topic)
+        tomb_path = self.path(topic)
+        try:
+            with self.lock(topic).shared():
+                before = os.stat(topic_path)
+                with open(tomb_path, 'rb') as f:
+                    data = f.read()
+            with open(topic_path, 'r', encoding='utf-8') as f:
+                lines = [line.strip() for line in f if line.strip()]
+        except FileNotFoundError:
+            return False
+        consumed = len(data)
+        removed = Counter()
+        for line in data.decode('utf-8').splitlines():
+            if line.startswith('-') and line[1:].strip():
+                removed[line[1:].strip().lower()] += 1
+        kept = []
+        for line in lines:
+            name = line.lower()
+            if removed.get(name):
+                removed[name] -= 1
+            else:
+                kept.append(line)
+
+        tmp_path = topic_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(kept))
+            f.flush()
+            os.fsync(f.fileno())
+        with self.lock(topic).exclusive():
+            try:
+                after = os.stat(topic_path)
+            except FileNotFoundError:
+                after = None
+            if after is None or (after.st_mtime_ns, after.st_size) != (before.st_mtime_ns, before.st_size):
+                os.remove(tmp_path)
+                return False
+            with open(tomb_path, 'rb') as f:
+                f.seek(consumed)
+                rest = f.read()
+            os.replace(tmp_path, topic_path)
+            if rest:
+                tmp_tomb = tomb_path + ".tmp"
+                with open(tmp_tomb, 'wb') as f:
+                    f.write(rest)
+                os.replace(tmp_tomb, tomb_path)
+            else:
+                os.remove(tomb_path)
+            self._counts.pop(topic, None)
+        return True
+
+    def compact_in_background(self, topic):
+        with self._guard:
+            if topic in self._compacting:
+                return None
+            self._compacting.add(topic)
+
+        def run():
+            try:
+                self.compact(topic)
+            finally:
+                with self._guard:
+                    self._compacting.discard(topic)
+
+        thread = threading.Thread(target=run, name=f"compact-{topic}", daemon=True)
+        thread.start()
+        return thread
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="삭제 기록(.tomb)을 반영해 주제 파일을 정리합니다.")
+    parser.add_argument("topics", nargs="*", help="정리할 주제 (기본값: 기록이 있는 모든 주제)")
+    parser.add_argument("--word-lists", default="word_lists", help="주제 파일 폴더 (기본값: word_lists)")
+    args = parser.parse_args(argv)
+    tombstones = TopicTombstones(args.word_lists)
+    topics = args.topics or sorted(
+        name[:-len(".tomb")] for name in os.listdir(args.word_lists) if name.endswith(".tomb")
+    )
+    for topic in topics:
+        count = tombstones.count(topic)
+        if tombstones.compact(topic):
+            print(f"✅ 주제 '{topic}'에서 삭제 기록 {count}개를 반영했습니다.")
+        else:
+            print(f"⚠️ 주제 '{topic}'을(를) 정리하지 못했습니다.")
@@ -17,7 +17,8 @@ class UI:
         print("2. 주제별 게임 (글자 수 기준)")
         print("3. 힌트 모드 (일부 글자 채우고 시작)")
         print("4. 챌린지 모드 (시간 제한)")
-        print("5. 메인 메뉴로 돌아가기")
+        print("5. 복습 모드 (나만의 단어장 간격 반복)")
+        print("6. 메인 메뉴로 돌아가기")
 
     # [수정] 난이도 메뉴 설명을 글자 수 기준으로 변경
     def display_difficulty_menu(self):
@@ -25,6 +26,7 @@ class UI:
         print("1. 초급 (짧은 단어: 3~5글자)")
         print("2. 중급 (중간 단어: 6~8글자)")
         print("3. 고급 (긴 단어: 9글자 이상)")
+        print("4. 사용자 지정 (글자 수 범위 직접 입력)")
 
     def display_topic_menu(self, topics):
         print("\n[🎨 주제 선택]")
@@ -46,7 +48,16 @@ class UI:
         print("2. 단어 관리 (추가/목록 보기)")
         print("3. 게임 기록 보기")
         print("4. 설정")
-        print("5. 메인 메뉴로 돌아가기")
+        print("5. 성능 통계 (계측/프로파일)")
+        print("6. 메인 메뉴로 돌아가기")
+
+    def display_stats_menu(self, enabled):
+        print(f"\n[📈 성능 통계] 계측: {'켜짐' if enabled else '꺼짐'}")
+        print("1. 통계 보기")
+        print(f"2. 계측 {'끄기' if enabled else '켜기'}")
+        print("3. 통계 초기화")
+        print("4. 통계를 JSON으로 저장 (data/instrumentation.json)")
+        print("5. 돌아가기")
 
     def display_how_to_play(self):
         print("\n[📜 게임 방법]")
@@ -0,0 +1,152 @@
+# word_dealer.py
+import json
+import random
+import threading
+from file_lock import lock_for
+from persistence import append_bytes, atomic_write, default_writer
+
+
+class WordDealer:
+    """단어 풀 하나에서 모든 단어가 한 번씩 나올 때까지 겹치지 않게 단어를 나눠 줍니다.
+
+    items[:pos]는 이번 순환에서 이미 나간 단어, items[pos:]는 아직 나가지 않은 단어입니다.
+    뽑을 때마다 남은 구간에서 하나를 골라 pos 자리와 바꾸는 지연 Fisher-Yates 방식이라
+    미리 섞어 둘 필요가 없고, 한 번 뽑는 비용은 O(1)입니다.
+    """
+
+    def __init__(self, words, dealt=(), rng=random):
+        self.rng = rng
+        pool = dict.fromkeys(words)
+        dealt = [word for word in dict.fromkeys(dealt) if word in pool]
+        dealt_set = set(dealt)
+        self.items = dealt + [word for word in pool if word not in dealt_set]
+        self.slots = {word: i for i, word in enumerate(self.items)}
+        self.pos = len(dealt)
+
+    def __len__(self):
+        return len(self.items)
+
+    def _swap(self, i, j):
+        items = self.items
+        items[i], items[j] = items[j], items[i]
+        self.slots[items[i]] = i
+        self.slots[items[j]] = j
+
+    def draw(self):
+        """아직 나가지 않은 단어 하나를 뽑습니다. 모두 나갔다면 새 순환을 시작합니다.
+
+        (단어, 새 순환 시작 여부)를 돌려주며, 풀이 비어 있으면 (None, False)입니다.
+        """
+        if not self.items:
+            return None, False
+        reset = self.pos >= len(self.items)
+        if reset:
+            self.pos = 0
+        self._swap(self.pos, self.rng.randrange(self.pos, len(self.items)))
+        word = self.items[self.pos]
+        self.pos += 1
+        return word, reset
+
+    def add(self, word):
+        """새 단어를 아직 나가지 않은 구간에 넣습니다."""
+        if word in self.slots:
+            return
+        self.slots[word] = len(self.items)
+        self.items.append(word)
+
+    def remove(self, word):
+        i = self.slots.get(word)
+        if i is None:
+            return
+        if i < self.pos:
+            # 이미 나간 구간의 마지막 자리로 옮겨 두 구간의 경계를 유지합니다.
+            self._swap(i, self.pos - 1)
+            i = self.pos - 1
+            self.pos -= 1
+        self._swap(i, len(self.items) - 1)
+        self.items.pop()
+        del self.slots[word]
+
+    def dealt(self):
+        return self.items[:self.pos]
+
+
+class DealerLog:
+    """딜러별로 나간 단어를 추가 전용 로그(.jsonl)로 남겨 재시작 뒤에도 순서를 이어 갑니다.
+
+    한 줄은 {"pool": 풀 이름, "word": 단어} 또는 순환이 새로 시작됐음을 뜻하는 {"pool": 풀 이름, "reset": true}입니다.
+    로그가 너무 길어지면 불러올 때 풀별 현재 상태만 남기도록 다시 씁니다.
+    새 줄은 메모리에 모았다가 WriteBehind가 한 번에 덧붙입니다.
+    """
+
+    def __init__(self, path, compact_threshold=10000, writer=None):
+        self.path = path
+        self.compact_threshold = compact_threshold
+        self.writer = writer or default_writer()
+        self._dealt = None
+        self._pending = []
+        self._lock = threading.Lock()
+        self.file_lock = lock_for(path)
+
+    def load(self):
+        """풀 이름 -> 이번 순환에 나간 단어 목록을 돌려줍니다."""
+        if self._dealt is not None:
+            return self._dealt
+        dealt = {}
+        lines = 0
+        try:
+            with self.file_lock.shared(), open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    lines += 1
+                    pool = entry.get("pool")
+                    if entry.get("reset"):
+                        dealt[pool] = []
+                    elif "word" in entry:
+                        dealt.setdefault(pool, []).append(entry["word"])
+        except FileNotFoundError:
+            pass
+        self._dealt = dealt
+        if lines > self.compact_threshold:
+            self.compact()
+        return dealt
+
+    def dealt_for(self, pool):
+        return self.load().get(pool, [])
+
+    def record(self, pool, word, reset=False):
+        entries = []
+        if reset:
+            entries.append({"pool": pool, "reset": True})
+        entries.append({"pool": pool, "word": word})
+        with self._lock:
+            self._pending.extend(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+            if self._dealt is not None:
+                # 캐시에서 밀려난 딜러를 다시 만들 때도 지금까지 나간 단어를 이어 가도록 메모리 상태도 고칩니다.
+                if reset:
+                    self._dealt[pool] = []
+                self._dealt.setdefault(pool, []).append(word)
+        self.writer.mark(self.path, self.flush)
+
+    def flush(self, fsync=False):
+        with self._lock:
+            if not self._pending:
+                return
+            data = ''.join(self._pending).encode('utf-8')
+            with self.file_lock.exclusive():
+                append_bytes(self.path, data, fsync)
+            self._pending = []
+
+    def compact(self):
+        """풀별로 현재 순환에 나간 단어만 남기도록 로그를 다시 씁니다."""
+        dealt = dict(self.load())
+        self.flush()
+        lines = [
+            json.dumps({"pool": pool, "word": word}, ensure_ascii=False) + "\n"
+            for pool, words in dealt.items() for word in words
+        ]
+        with self.file_lock.exclusive():
+            atomic_write(self.path, ''.join(lines), self.writer.fsync)
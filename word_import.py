@@ -0,0 +1,165 @@
+# word_import.py
+import argparse
+import csv
+import json
+import os
+import time
+
+FIELDS = ("word", "topic", "meaning", "example")
+
+
+def read_rows(path, fmt=None):
+    """CSV/TSV/JSONL 파일을 한 행씩 읽어 {word, topic, meaning, example} 딕셔너리로 내보냅니다.
+
+    CSV/TSV의 첫 줄에 'word' 열이 있으면 머리글로 보고, 없으면 단어, 주제, 뜻, 예문 순서의 열로 읽습니다.
+    """
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower()
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if fmt == "jsonl":
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        yield {}
+            return
+        reader = csv.reader(f, delimiter='\t' if fmt == "tsv" else ',')
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = [name.strip().lower() for name in header]
+        if "word" not in columns:
+            columns = list(FIELDS)
+            yield dict(zip(columns, header))
+        for row in reader:
+            yield dict(zip(columns, row))
+
+
+def normalize(rows, default_topic=None):
+    for row in rows:
+        if not isinstance(row, dict):
+            # JSONL의 [1, 2]나 "x"처럼 객체가 아닌 행은 빈 행으로 바꿔 validate에서 잘못된 행으로 셉니다.
+            row = {}
+        yield (
+            str(row.get("topic") or default_topic or "").strip().lower(),
+            str(row.get("word") or "").strip().lower(),
+            str(row.get("meaning") or "").strip(),
+            str(row.get("example") or "").strip(),
+        )
+
+
+def validate(rows, stats):
+    """add_word와 같은 규칙(알파벳으로만 된 단어와 주제)을 통과한 행만 내보냅니다."""
+    for row in rows:
+        topic, word = row[0], row[1]
+        if word.isalpha() and topic.isalpha():
+            yield row
+        else:
+            stats["invalid"] += 1
+
+
+def deduplicate(rows, index, stats):
+    """이미 색인에 있거나 같은 파일 안에서 반복된 (주제, 단어)를 걸러냅니다."""
+    seen = set()
+    for row in rows:
+        key = (row[0], row[1])
+        if key in seen or index.in_topic(row[0], row[1]):
+            stats["duplicates"] += 1
+            continue
+        seen.add(key)
+        yield row
+
+
+class BulkImporter:
+    """정제된 행을 주제별로 모아 큰 단위로 파일 끝에 덧붙이고, 뜻과 예문은 한 번에 저장합니다."""
+
+    def __init__(self, word_manager, create_topics=False, buffer_size=65536):
+        self.word_manager = word_manager
+        self.index = word_manager._corpus()
+        self.create_topics = create_topics
+        self.buffer_size = buffer_size
+        self.buffers = {}
+        self.buffered = 0
+        self.meanings = []
+        self.stats = {"rows": 0, "imported": 0, "invalid": 0, "duplicates": 0, "missing_topic": 0}
+
+    def _topic_path(self, topic):
+        return os.path.join(self.word_manager.word_lists_path, f"{topic}.txt")
+
+    def _topic_exists(self, topic):
+        if self.index.has_topic(topic) or topic in self.buffers:
+            return True
+        if self.create_topics:
+            open(self._topic_path(topic), 'a', encoding='utf-8').close()
+            self.index.add_topic(topic)
+            return True
+        return False
+
+    def _counted(self, rows, progress=None, progress_every=50000, started=None):
+        """읽은 행 수를 세고, 진행 상황은 걸러진 행과 관계없이 읽은 행 기준으로 알립니다."""
+        for row in rows:
+            self.stats["rows"] += 1
+            if progress and self.stats["rows"] % progress_every == 0:
+                progress(self.stats["rows"], time.perf_counter() - started)
+            yield row
+
+    def run(self, rows, default_topic=None, progress=None, progress_every=50000):
+        started = time.perf_counter()
+        rows = self._counted(rows, progress, progress_every, started)
+        pipeline = deduplicate(validate(normalize(rows, default_topic), self.stats), self.index, self.stats)
+        for topic, word, meaning, example in pipeline:
+            if not self._topic_exists(topic):
+                self.stats["missing_topic"] += 1
+                continue
+            self.buffers.setdefault(topic, []).append(word)
+            self.buffered += 1
+            if meaning:
+                self.meanings.append((word, meaning, example))
+            if self.buffered >= self.buffer_size:
+                self.flush()
+        self.flush()
+        self.word_manager.meanings.upsert_many(self.meanings)
+        self.word_manager.index_meanings(word for word, _, _ in self.meanings)
+        self.meanings = []
+        self.stats["elapsed"] = time.perf_counter() - started
+        return self.stats
+
+    def flush(self):
+        """주제별 버퍼를 파일마다 한 번의 쓰기로 덧붙이고 색인에 반영합니다."""
+        for topic, words in self.buffers.items():
+            with self.index.tombstones.lock(topic).exclusive(), open(self._topic_path(topic), 'a', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(''.join(f"\n{word}" for word in words))
+            for word in words:
+                self.index.add(topic, word)
+            self.index.touch(topic)
+            self.stats["imported"] += len(words)
+        self.buffers = {}
+        self.buffered = 0
+
+
+def main(argv=None):
+    from word_manager import WordManager
+
+    parser = argparse.ArgumentParser(description="CSV/TSV/JSONL 파일에서 단어와 뜻을 한꺼번에 가져옵니다.")
+    parser.add_argument("path", help="가져올 파일 경로 (열: word, topic, meaning, example)")
+    parser.add_argument("--format", choices=["csv", "tsv", "jsonl"], help="파일 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--topic", help="topic 열이 비어 있을 때 사용할 주제")
+    parser.add_argument("--create-topics", action="store_true", help="없는 주제는 새로 만듭니다")
+    args = parser.parse_args(argv)
+
+    def progress(rows, elapsed):
+        print(f"  {rows}행 처리 중... ({rows / elapsed:.0f}행/초)")
+
+    importer = BulkImporter(WordManager(), create_topics=args.create_topics)
+    try:
+        stats = importer.run(read_rows(args.path, args.format), args.topic, progress)
+    except FileNotFoundError:
+        print(f"⚠️ '{args.path}' 파일을 찾을 수 없습니다.")
+        return
+    rate = stats["rows"] / stats["elapsed"] if stats["elapsed"] > 0 else 0.0
+    print(f"\n✅ {stats['rows']}행 중 {stats['imported']}개 단어를 가져왔습니다. ({rate:.0f}행/초)")
+    print(f"   잘못된 행: {stats['invalid']}, 중복: {stats['duplicates']}, 없는 주제: {stats['missing_topic']}")
+
+
+if __name__ == "__main__":
+    main()
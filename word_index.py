@@ -0,0 +1,652 @@
+# word_index.py
+import os
+import random
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from zlib import crc32
+from instrumentation import count, timed, timer
+from tombstones import TopicTombstones
+
+
+def _uint_array(view):
+    """uint32 memoryview 조각을 원소 단위 변환 없이 array('I')로 복사합니다."""
+    result = array('I')
+    result.frombytes(view.cast('B'))
+    return result
+
+
+def _positions(ids, word_id, limit=None):
+    """array('I')에서 word_id가 나오는 위치를 앞에서부터 limit개까지 찾습니다.
+
+    원소를 하나씩 비교하지 않고 바이트열 검색으로 찾은 뒤 4바이트 경계에 맞는 것만 남깁니다.
+    """
+    data = ids.tobytes()
+    pattern = array('I', [word_id]).tobytes()
+    positions = []
+    start = data.find(pattern)
+    while start != -1 and (limit is None or len(positions) < limit):
+        if start % 4 == 0:
+            positions.append(start // 4)
+            start = data.find(pattern, start + 4)
+        else:
+            start = data.find(pattern, start + 1)
+    return positions
+
+
+class WordStore:
+    """모든 단어를 하나의 bytearray와 array('I') 오프셋으로 보관합니다.
+
+    단어는 '\\n'으로 이어 붙여 한 번만 저장하고, 이후로는 단어 번호(id)로만 가리킵니다.
+    단어 -> 번호 조회용 해시 색인(개방 주소법, array('I'))은 처음 필요할 때 만듭니다.
+    """
+
+    def __init__(self):
+        self.blob = bytearray()
+        self.offsets = array('I', [0])
+        self._table = None  # 단어 번호 + 1 (0은 빈 칸)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def load(self, blob, offsets):
+        """이미 같은 형식으로 만들어진 버퍼(단어 팩 등)를 통째로 복사해 옵니다."""
+        self.blob = bytearray(blob)
+        self.offsets = _uint_array(offsets)
+        self._table = None
+
+    def raw(self, word_id):
+        return self.blob[self.offsets[word_id]:self.offsets[word_id + 1] - 1]
+
+    def word(self, word_id):
+        return self.raw(word_id).decode('utf-8')
+
+    def _index(self):
+        if self._table is None:
+            self._rebuild(len(self))
+        return self._table
+
+    def _rebuild(self, count):
+        size = 16
+        while size < count * 2:
+            size *= 2
+        table = array('I', bytes(4 * size))
+        mask = size - 1
+        for word_id in range(len(self)):
+            slot = crc32(self.raw(word_id)) & mask
+            while table[slot]:
+                slot = (slot + 1) & mask
+            table[slot] = word_id + 1
+        self._table = table
+
+    def _probe(self, data):
+        """data가 있는 칸, 또는 data를 넣을 빈 칸의 위치를 돌려줍니다."""
+        table = self._index()
+        mask = len(table) - 1
+        slot = crc32(data) & mask
+        blob, offsets = self.blob, self.offsets
+        while True:
+            value = table[slot]
+            if not value or blob[offsets[value - 1]:offsets[value] - 1] == data:
+                return slot
+            slot = (slot + 1) & mask
+
+    def find(self, word):
+        """단어의 번호를 돌려줍니다. 저장된 적이 없으면 None입니다."""
+        value = self._index()[self._probe(word.encode('utf-8'))]
+        return value - 1 if value else None
+
+    def intern(self, word):
+        """단어의 번호를 돌려주되, 처음 보는 단어면 버퍼 끝에 추가합니다."""
+        data = word.encode('utf-8')
+        slot = self._probe(data)
+        if self._table[slot]:
+            return self._table[slot] - 1
+        word_id = len(self)
+        self.blob += data
+        self.blob.append(10)
+        self.offsets.append(len(self.blob))
+        if (word_id + 1) * 2 > len(self._table):
+            self._rebuild(2 * (word_id + 1))
+        else:
+            self._table[slot] = word_id + 1
+        return word_id
+
+    def nbytes(self):
+        table = sys.getsizeof(self._table) if self._table is not None else 0
+        return sys.getsizeof(self.blob) + sys.getsizeof(self.offsets) + table
+
+
+class TopicView:
+    """주제 하나의 단어 번호 목록 (파일 순서, 중복 포함)입니다."""
+
+    __slots__ = ('name', 'bit', 'ids')
+
+    def __init__(self, name, bit, ids=None):
+        self.name = name
+        self.bit = bit
+        self.ids = ids if ids is not None else array('I')
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class LengthBucket:
+    """같은 글자 수를 가진 단어 번호 배열입니다."""
+
+    __slots__ = ('length', 'ids')
+
+    def __init__(self, length, ids=None):
+        self.length = length
+        self.ids = ids if ids is not None else array('I')
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class LengthBuckets:
+    """글자 수별 단어 배열과 누적 오프셋으로 길이 범위 추첨을 상수 시간에 처리합니다.
+
+    단어는 길이별 배열에 담기고, 배열 안 위치를 따로 기억해 삭제는 맨 끝 원소와 자리를 바꿔 처리합니다.
+    누적 오프셋은 단어가 바뀐 뒤 첫 조회 때 길이 종류 수만큼만 다시 계산합니다.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._buckets = {}    # 글자 수 -> LengthBucket
+        self._lengths = []    # 정렬된 글자 수 목록
+        self._offsets = None  # 누적 오프셋 (글자 수 목록보다 1개 많음)
+        self._slots = None    # 단어 번호 -> 배열 안 위치 (삭제할 때 처음 만듦)
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def load(self, buckets):
+        self._buckets = {bucket.length: bucket for bucket in buckets if len(bucket)}
+        self._lengths = sorted(self._buckets)
+        self._offsets = None
+        self._slots = None
+
+    def _slot_table(self):
+        if self._slots is None:
+            self._slots = array('I', bytes(4 * len(self.store)))
+            for bucket in self._buckets.values():
+                for position, word_id in enumerate(bucket.ids):
+                    self._slots[word_id] = position
+        elif len(self._slots) < len(self.store):
+            self._slots.frombytes(bytes(4 * (len(self.store) - len(self._slots))))
+        return self._slots
+
+    def add(self, word_id, length=None):
+        if length is None:
+            length = len(self.store.word(word_id))
+        bucket = self._buckets.get(length)
+        if bucket is None:
+            bucket = self._buckets[length] = LengthBucket(length)
+            insort(self._lengths, length)
+        if self._slots is not None:
+            self._slot_table()[word_id] = len(bucket.ids)
+        bucket.ids.append(word_id)
+        self._offsets = None
+
+    def remove(self, word_id):
+        length = len(self.store.word(word_id))
+        bucket = self._buckets[length]
+        slots = self._slot_table()
+        slot = slots[word_id]
+        last = bucket.ids.pop()
+        if last != word_id:
+            bucket.ids[slot] = last
+            slots[last] = slot
+        if not bucket.ids:
+            del self._buckets[length]
+            self._lengths.remove(length)
+        self._offsets = None
+
+    def _prefix(self):
+        if self._offsets is None:
+            offsets = [0]
+            for length in self._lengths:
+                offsets.append(offsets[-1] + len(self._buckets[length]))
+            self._offsets = offsets
+        return self._offsets
+
+    def _span(self, min_len, max_len):
+        lo = bisect_left(self._lengths, min_len)
+        hi = bisect_right(self._lengths, max_len) if max_len is not None else len(self._lengths)
+        return lo, hi
+
+    def count(self, min_len=0, max_len=None):
+        lo, hi = self._span(min_len, max_len)
+        offsets = self._prefix()
+        return offsets[hi] - offsets[lo]
+
+    def clamp(self, min_len=0, max_len=None):
+        """범위 안에 실제로 있는 가장 짧은 글자 수와 가장 긴 글자 수입니다. 범위 안에 단어가 없으면 None입니다."""
+        lo, hi = self._span(min_len, max_len)
+        if lo >= hi:
+            return None
+        return self._lengths[lo], self._lengths[hi - 1]
+
+    def sample(self, min_len=0, max_len=None):
+        """글자 수가 범위 안에 있는 단어 번호 하나를 균등한 확률로 뽑습니다."""
+        lo, hi = self._span(min_len, max_len)
+        offsets = self._prefix()
+        if offsets[hi] == offsets[lo]:
+            return None
+        r = random.randrange(offsets[lo], offsets[hi])
+        i = bisect_right(offsets, r, lo, hi) - 1
+        return self._buckets[self._lengths[i]].ids[r - offsets[i]]
+
+    def ids(self, min_len=0, max_len=None):
+        lo, hi = self._span(min_len, max_len)
+        for length in self._lengths[lo:hi]:
+            yield from self._buckets[length].ids
+
+    def nbytes(self):
+        slots = sys.getsizeof(self._slots) if self._slots is not None else 0
+        return slots + sum(sys.getsizeof(bucket.ids) for bucket in self._buckets.values())
+
+
+class CorpusIndex:
+    """word_lists 폴더의 단어들을 메모리에 상주시키는 색인입니다.
+
+    단어 문자열은 WordStore에 한 번만 저장하고, 주제와 길이 버킷은 단어 번호 배열만 가집니다.
+    단어가 속한 주제는 단어 번호마다 64비트 마스크(array('Q'))로 표시하고,
+    64번째 이후 주제만 따로 사전에 둡니다.
+
+    주제 파일마다 (mtime, size) 서명을 기억해 두고, 서명이 바뀐 주제만 다시 읽습니다.
+    삭제한 단어는 주제 옆 .tomb 파일에 기록되므로, 그 파일의 (mtime, size)도 서명에 포함합니다.
+    다시 읽을 주제가 여럿이면 파일 읽기는 최대 load_workers개의 스레드에 나누고,
+    읽은 결과를 색인에 넣는 일은 호출한 스레드 하나가 합니다.
+    listeners에 등록한 함수는 색인이 바뀔 때마다 (사건, 주제, 단어)로 호출됩니다.
+    사건은 주제에 단어가 들어오고 나갈 때의 'topic_add'/'topic_remove'와,
+    단어가 전체 단어 목록에 처음 들어오거나 완전히 빠질 때의 'word_add'/'word_remove'입니다.
+    """
+
+    def __init__(self, word_lists_path, load_workers=8):
+        self.word_lists_path = word_lists_path
+        self.load_workers = load_workers
+        self.store = WordStore()
+        self.topic_views = {}     # 주제 -> TopicView
+        self.length_buckets = LengthBuckets(self.store)
+        self._bits = None         # 단어 번호 -> 주제 비트 마스크 (처음 필요할 때 만듦)
+        self._extra_bits = {}     # 단어 번호 -> 64번째 이후 주제 비트 집합
+        self._free_bits = []
+        self._next_bit = 0
+        self._signatures = {}     # 주제 -> 주제 파일과 삭제 기록의 (mtime_ns, size)
+        self.tombstones = TopicTombstones(word_lists_path)
+        self.listeners = []
+
+    def _emit(self, event, topic, word):
+        for listener in self.listeners:
+            listener(event, topic, word)
+
+    def _topic_path(self, topic):
+        return os.path.join(self.word_lists_path, f"{topic}.txt")
+
+    def _stat(self, topic):
+        """주제 파일과 삭제 기록 파일의 (mtime_ns, size)를 이어 붙인 서명입니다."""
+        try:
+            st = os.stat(self._topic_path(topic))
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size) + self.tombstones.stat(topic)
+
+    def _read_topic(self, topic):
+        """주제 파일을 읽고 삭제 기록에 있는 단어를 걸러 냅니다."""
+        with self.tombstones.lock(topic).shared(), timer("corpus.read_topic"):
+            try:
+                # 파일 전체를 한 번에 읽어 디코딩하므로 줄마다 읽기를 부르지 않습니다.
+                with open(self._topic_path(topic), 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                return []
+            count("disk.reads")
+            count("disk.bytes_read", len(data))
+            words = [line.strip().lower() for line in data.decode('utf-8').split('\n') if line.strip()]
+            return self.tombstones.apply(topic, words, key=None)
+
+    def read_topics(self, topics):
+        """주제 파일들을 읽어 (주제, 단어 목록)을 읽기가 끝나는 순서대로 내보냅니다.
+
+        주제가 둘 이상이면 스레드 풀에서 나눠 읽습니다. 파일 읽기는 GIL을 놓으므로
+        네트워크 드라이브나 캐시가 비어 있는 디스크에서는 I/O 대기가 겹칩니다.
+        """
+        topics = list(topics)
+        if len(topics) < 2 or self.load_workers < 2:
+            for topic in topics:
+                yield topic, self._read_topic(topic)
+            return
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        workers = min(self.load_workers, len(topics))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="topic-load") as pool:
+            futures = {pool.submit(self._read_topic, topic): topic for topic in topics}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def _scan(self):
+        """(지금 있는 주제 집합, 다시 읽어야 하는 주제 -> 서명)을 돌려줍니다."""
+        try:
+            names = os.listdir(self.word_lists_path)
+        except FileNotFoundError:
+            names = []
+        current = set()
+        stale = {}
+        for name in names:
+            if not name.endswith('.txt'):
+                continue
+            topic = name.split('.')[0]
+            current.add(topic)
+            signature = self._stat(topic)
+            if signature is not None and self._signatures.get(topic) != signature:
+                stale[topic] = signature
+        return current, stale
+
+    def refresh_iter(self):
+        """refresh()와 같은 일을 하면서, 준비된 주제 이름을 하나씩 내보냅니다.
+
+        바뀌지 않은 주제가 먼저 이름순으로 나오고, 다시 읽는 주제는 읽기가 끝나는 대로 색인에 넣은 뒤 나옵니다.
+        중간에 그만두면 아직 넣지 않은 주제는 서명을 갱신하지 않으므로 다음 refresh()에서 다시 읽힙니다.
+        """
+        current, stale = self._scan()
+        for topic in list(self.topic_views):
+            if topic not in current:
+                self.remove_topic(topic)
+        for topic in sorted(self.topic_views):
+            if topic not in stale:
+                yield topic
+        for topic, words in self.read_topics(sorted(stale)):
+            count("corpus.topics_reloaded")
+            self._set_topic(topic, words)
+            self._signatures[topic] = stale[topic]
+            yield topic
+
+    def refresh_topic(self, topic):
+        """주제 하나만 서명을 확인해, 바뀌었으면 호출한 스레드에서 바로 다시 읽습니다.
+
+        스레드 풀을 쓰지 않으므로 그 주제의 잠금을 잡은 채로 불러도 됩니다. (FileLock의 스레드 잠금은
+        잡은 스레드만 다시 들어갈 수 있어서, 잠금 안에서 refresh()를 부르면 작업 스레드가 영영 기다립니다.)
+        """
+        signature = self._stat(topic)
+        if signature is not None and self._signatures.get(topic) != signature:
+            count("corpus.topics_reloaded")
+            self._set_topic(topic, self._read_topic(topic))
+            self._signatures[topic] = signature
+
+    @timed("corpus.refresh")
+    def refresh(self):
+        """파일이 바뀐 주제만 다시 읽고, 사라진 주제는 색인에서 제거합니다."""
+        for _ in self.refresh_iter():
+            pass
+
+    def load_pack(self, pack):
+        """단어 팩에서 주제들을 불러오고, 팩을 만들 때의 원본 서명을 그대로 기억합니다.
+
+        색인이 비어 있으면 팩의 버퍼와 배열을 그대로 복사하므로 단어를 하나씩 파싱하지 않습니다.
+        원본 txt가 그 뒤에 바뀐 주제는 서명이 달라지므로 다음 refresh()에서 txt로 다시 읽힙니다.
+        """
+        if self.topic_views:
+            words = pack.words()
+            for topic in pack.topics():
+                self._set_topic(topic, [words[i] for i in pack.topic_ids(topic).tolist()])
+                self._signatures[topic] = pack.sources[topic]
+            return
+        self.store.load(pack.blob, pack.offsets)
+        for topic in pack.topics():
+            self.topic_views[topic] = TopicView(topic, self._take_bit(), _uint_array(pack.topic_ids(topic)))
+            self._signatures[topic] = pack.sources[topic]
+        buckets = []
+        for i, length in enumerate(pack.lengths):
+            lo, hi = pack.length_starts[i], pack.length_starts[i + 1]
+            buckets.append(LengthBucket(length, _uint_array(pack.by_length[lo:hi])))
+        self.length_buckets.load(buckets)
+        self._bits = None
+
+    def touch(self, topic):
+        """직접 수정한 주제 파일의 서명을 갱신해 불필요한 재로딩을 막습니다."""
+        signature = self._stat(topic)
+        if signature is None:
+            self._signatures.pop(topic, None)
+        else:
+            self._signatures[topic] = signature
+
+    def _take_bit(self):
+        if self._free_bits:
+            return self._free_bits.pop()
+        self._next_bit += 1
+        return self._next_bit - 1
+
+    def _membership(self):
+        """단어 번호별 주제 비트 마스크를 돌려줍니다. 처음 호출될 때 주제 배열에서 만듭니다."""
+        if self._bits is None:
+            self._bits = array('Q', bytes(8 * len(self.store)))
+            self._extra_bits = {}
+            for view in self.topic_views.values():
+                for word_id in set(view.ids):
+                    self._set_bit(word_id, view.bit)
+        elif len(self._bits) < len(self.store):
+            self._bits.frombytes(bytes(8 * (len(self.store) - len(self._bits))))
+        return self._bits
+
+    def _has_bit(self, word_id, bit):
+        if bit < 64:
+            return bool(self._bits[word_id] >> bit & 1)
+        return bit in self._extra_bits.get(word_id, ())
+
+    def _set_bit(self, word_id, bit):
+        if bit < 64:
+            self._bits[word_id] |= 1 << bit
+        else:
+            self._extra_bits.setdefault(word_id, set()).add(bit)
+
+    def _clear_bit(self, word_id, bit):
+        if bit < 64:
+            self._bits[word_id] &= ~(1 << bit) & 0xFFFFFFFFFFFFFFFF
+        else:
+            extra = self._extra_bits.get(word_id)
+            if extra is not None:
+                extra.discard(bit)
+                if not extra:
+                    del self._extra_bits[word_id]
+
+    def _is_live(self, word_id):
+        return bool(self._bits[word_id]) or word_id in self._extra_bits
+
+    def _set_topic(self, topic, words):
+        view = self.topic_views.get(topic)
+        if view is None:
+            view = self.topic_views[topic] = TopicView(topic, self._take_bit())
+        self._membership()
+        old_ids = set(view.ids)
+        intern = self.store.intern
+        ids = array('I')
+        new_words = {}  # 단어 번호 -> 단어 (처음 나온 순서)
+        for word in words:
+            word_id = intern(word)
+            ids.append(word_id)
+            new_words.setdefault(word_id, word)
+        self._membership()
+        view.ids = ids
+        for word_id in old_ids.difference(new_words):
+            self._unlink(view, word_id)
+        for word_id, word in new_words.items():
+            if word_id not in old_ids:
+                self._link(view, word_id, word)
+
+    def _link(self, view, word_id, word=None):
+        self._membership()
+        if self._has_bit(word_id, view.bit):
+            return
+        was_live = self._is_live(word_id)
+        self._set_bit(word_id, view.bit)
+        if word is None:
+            word = self.store.word(word_id)
+        if not was_live:
+            self.length_buckets.add(word_id, len(word))
+            self._emit('word_add', view.name, word)
+        self._emit('topic_add', view.name, word)
+
+    def _unlink(self, view, word_id):
+        self._membership()
+        if not self._has_bit(word_id, view.bit):
+            return
+        self._clear_bit(word_id, view.bit)
+        word = self.store.word(word_id)
+        self._emit('topic_remove', view.name, word)
+        if not self._is_live(word_id):
+            self.length_buckets.remove(word_id)
+            self._emit('word_remove', view.name, word)
+
+    def add_topic(self, topic):
+        if topic not in self.topic_views:
+            self.topic_views[topic] = TopicView(topic, self._take_bit())
+        self.touch(topic)
+
+    def remove_topic(self, topic):
+        view = self.topic_views.get(topic)
+        if view is not None:
+            for word_id in set(view.ids):
+                self._unlink(view, word_id)
+            del self.topic_views[topic]
+            self._free_bits.append(view.bit)
+        self._signatures.pop(topic, None)
+
+    def add(self, topic, word):
+        view = self.topic_views.get(topic)
+        if view is None:
+            view = self.topic_views[topic] = TopicView(topic, self._take_bit())
+        word_id = self.store.intern(word)
+        self._membership()
+        view.ids.append(word_id)
+        self._link(view, word_id, word)
+
+    def remove(self, topic, word):
+        view = self.topic_views.get(topic)
+        word_id = self.store.find(word)
+        if view is None or word_id is None or not self.in_topic(topic, word):
+            return
+        positions = _positions(view.ids, word_id, limit=2)
+        del view.ids[positions[0]]
+        if len(positions) == 1:
+            self._unlink(view, word_id)
+
+    def __len__(self):
+        return self.length_buckets.count()
+
+    def topics(self):
+        return sorted(self.topic_views)
+
+    def has_topic(self, topic):
+        return topic in self.topic_views
+
+    def words_of(self, topic):
+        view = self.topic_views.get(topic)
+        if view is None:
+            return []
+        word = self.store.word
+        return [word(word_id) for word_id in view.ids]
+
+    def in_topic(self, topic, word):
+        view = self.topic_views.get(topic)
+        word_id = self.store.find(word)
+        if view is None or word_id is None:
+            return False
+        self._membership()
+        return self._has_bit(word_id, view.bit)
+
+    def topics_of(self, word):
+        word_id = self.store.find(word)
+        if word_id is None:
+            return set()
+        self._membership()
+        return {view.name for view in self.topic_views.values() if self._has_bit(word_id, view.bit)}
+
+    def all_words(self):
+        return self.words_in_lengths()
+
+    def words_in_lengths(self, min_len=0, max_len=None):
+        word = self.store.word
+        return [word(word_id) for word_id in self.length_buckets.ids(min_len, max_len)]
+
+    def count(self, min_len=0, max_len=None):
+        """글자 수가 범위 안에 있는 (서로 다른) 단어 수입니다."""
+        return self.length_buckets.count(min_len, max_len)
+
+    def length_range(self, min_len=0, max_len=None):
+        """범위를 색인에 실제로 있는 글자 수로 좁힙니다. 범위 안에 단어가 없으면 None입니다."""
+        return self.length_buckets.clamp(min_len, max_len)
+
+    def sample(self, min_len=0, max_len=None):
+        word_id = self.length_buckets.sample(min_len, max_len)
+        return None if word_id is None else self.store.word(word_id)
+
+    def topic_size(self, topic):
+        view = self.topic_views.get(topic)
+        return len(view.ids) if view is not None else 0
+
+    def sample_topic(self, topic):
+        """주제의 단어 하나를 무작위로 뽑습니다. 단어 목록을 만들지 않으므로 주제가 커도 O(1)입니다."""
+        view = self.topic_views.get(topic)
+        if view is None or not len(view.ids):
+            return None
+        return self.store.word(view.ids[random.randrange(len(view.ids))])
+
+    def nbytes(self):
+        """색인이 차지하는 대략적인 메모리(바이트)입니다."""
+        total = self.store.nbytes() + self.length_buckets.nbytes()
+        total += sum(sys.getsizeof(view) + sys.getsizeof(view.ids) for view in self.topic_views.values())
+        if self._bits is not None:
+            total += sys.getsizeof(self._bits)
+        total += sum(sys.getsizeof(bits) for bits in self._extra_bits.values())
+        return total
+
+
+def naive_nbytes(index):
+    """같은 단어들을 str 목록과 집합으로 들고 있을 때(이전 방식)의 대략적인 메모리(바이트)입니다."""
+    total = 0
+    word_topics = {}
+    for topic in index.topics():
+        words = index.words_of(topic)
+        total += sys.getsizeof(words) + sum(sys.getsizeof(word) for word in words)
+        for word in words:
+            word_topics.setdefault(word, set()).add(topic)
+    total += sys.getsizeof(word_topics) + sum(sys.getsizeof(topics) for topics in word_topics.values())
+    buckets = {}
+    for word in word_topics:
+        buckets.setdefault(len(word), set()).add(word)
+    total += sum(sys.getsizeof(bucket) for bucket in buckets.values())
+    return total
+
+
+def memory_report(index):
+    words = max(len(index), 1)
+    naive = naive_nbytes(index)
+    index._membership()
+    index.store._index()
+    index.length_buckets._slot_table()
+    compact = index.nbytes()
+    return {
+        "words": len(index),
+        "naive_bytes": naive,
+        "compact_bytes": compact,
+        "naive_bytes_per_word": naive / words,
+        "compact_bytes_per_word": compact / words,
+    }
+
+
+def main(argv=None):
+    import argparse
+    from word_manager import WordManager
+
+    parser = argparse.ArgumentParser(description="단어 색인의 메모리 사용량을 이전 방식과 비교합니다.")
+    parser.parse_args(argv)
+    report = memory_report(WordManager()._corpus())
+    print(f"\n[🧮 단어 색인 메모리 보고서] 단어 {report['words']}개")
+    print(f"이전 방식 (str 목록/집합): {report['naive_bytes'] / 1024:.1f} KB ({report['naive_bytes_per_word']:.1f} 바이트/단어)")
+    print(f"현재 방식 (버퍼 + 배열): {report['compact_bytes'] / 1024:.1f} KB ({report['compact_bytes_per_word']:.1f} 바이트/단어)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,23 +2,211 @@
 import os
 import random
 import json
+import threading
+import time
+from file_lock import lock_for
+from instrumentation import count, timed, timer
+from persistence import atomic_write, default_writer
+from players import player_path
+from word_index import CorpusIndex
+from word_dealer import DealerLog, WordDealer
+from word_pack import open_pack, write_pack
+
+DEFAULT_WORDS = ['apple', 'banana', 'python', 'game', 'student', 'teacher']
+LEVEL_LENGTHS = {'초급': (3, 5), '중급': (6, 8), '고급': (9, 99)}
 
 class WordManager:
-    def __init__(self):
+    """단어 목록, 뜻 사전, 단어장을 관리합니다.
+
+    시작을 빠르게 하려고 무거운 부분은 처음 쓸 때 준비합니다. 단어 목록은 첫 _corpus() 때
+    스냅샷(단어 팩)에서 불러오고 원본 txt와 서명이 다른 주제만 다시 읽으며, 뜻 사전(sqlite)과
+    검색 색인, 복습 일정도 처음 필요할 때 엽니다. 바뀐 단어 목록과 검색 색인은 save_snapshots()로
+    다음 시작을 위해 저장합니다.
+    """
+
+    def __init__(self, player_id=None):
+        self.player_id = player_id
         self.word_lists_path = "word_lists"
-        self.my_wordbook_path = "data/my_wordbook.json"
+        # 플레이어를 정하면 단어장과 출제 순서는 그 플레이어의 폴더에 따로 저장됩니다.
+        self.my_wordbook_path = player_path(player_id, "my_wordbook.json") if player_id else "data/my_wordbook.json"
+        self.dealer_state_path = player_path(player_id, "dealer_state.jsonl") if player_id else "data/dealer_state.jsonl"
+        self.reviews_path = player_path(player_id, "reviews.db") if player_id else "data/reviews.db"
         self.word_meaning_path = "data/word_meanings.json"
+        self.word_meaning_db_path = "data/word_meanings.db"
+        self.lookup_snapshot_path = "data/word_meanings.lookup"
+        self.word_pack_path = "data/words.pack"
         self._ensure_files_exist()
+        self._meanings = None
+        self.index = CorpusIndex(self.word_lists_path)
+        self.index.listeners.append(self._on_index_change)
+        self._pack_sources = None   # 불러온 단어 팩의 주제별 서명 (None이면 아직 불러오지 않음)
+        self.refresh_interval = 2.0  # 다른 프로세스가 고친 주제 파일을 확인하는 최소 간격(초)
+        self._refreshed_at = None
+        self.dealers = {}           # 풀 -> WordDealer. 최근에 쓴 순서로 max_dealers개까지만 둡니다.
+        self.max_dealers = 16
+        self._sampled = {}          # 풀 -> (이번 순환에 나간 단어 목록, 집합). 딜러를 만들기 전에 씁니다.
+        self.writer = default_writer()
+        self.dealer_log = DealerLog(self.dealer_state_path, writer=self.writer)
+        self._wordbook = None
+        self._lookup = None
+        self._lookup_source = None  # 검색 색인이 반영한 뜻 사전 파일의 서명
+        self._lookup_dirty = False
+        self._lookup_build = None   # 스냅샷이 없을 때 검색 색인을 만드는 백그라운드 스레드
+        self._lookup_built = None
+        self._lookup_pending = []   # 색인을 만드는 동안 생긴 ('add'|'remove', 단어)
+        self._reviews = None
+        self._hints = None
+        self._wordbook_guard = threading.RLock()
+        self.wordbook_lock = lock_for(self.my_wordbook_path)
+
+    @property
+    def meanings(self):
+        """뜻 사전입니다. sqlite 연결은 처음 쓸 때 엽니다."""
+        if self._meanings is None:
+            from meaning_store import MeaningStore
+
+            self._ensure_sample_meanings()
+            self._meanings = MeaningStore(self.word_meaning_db_path, self.word_meaning_path)
+        return self._meanings
+
+    def _corpus(self, force=False):
+        """상주 색인을 돌려줍니다. 처음에는 단어 팩부터 불러옵니다.
+
+        주제 폴더를 훑는 refresh()는 주제마다 stat을 두 번 하므로 단어를 뽑을 때마다 하지 않고
+        refresh_interval초에 한 번만 합니다. 이 프로세스의 추가·삭제는 색인에 바로 반영되고,
+        추가·삭제 직전에는 해당 주제를 따로 확인하므로 간격은 다른 프로세스의 변경이 보이기까지의 지연일 뿐입니다.
+        """
+        if self._pack_sources is None:
+            self._load_pack()
+        now = time.monotonic()
+        if force or self._refreshed_at is None or now - self._refreshed_at >= self.refresh_interval:
+            self.index.refresh()
+            self._refreshed_at = now
+        else:
+            count("corpus.refresh_skipped")
+        return self.index
+
+    def _load_pack(self):
+        self._pack_sources = {}
+        pack = open_pack(self.word_pack_path)
+        if pack is None:
+            return
+        with timer("corpus.load_pack"):
+            self.index.load_pack(pack)
+        self._pack_sources = dict(pack.sources)
+        pack.close()
+
+    def save_snapshots(self):
+        """다음 시작을 위해 단어 목록 스냅샷(단어 팩)과 뜻 검색 색인을 저장합니다.
+
+        단어 팩은 팩과 서명이 다른 주제의 단어가 전체의 10%를 넘거나 사라진 주제가 있을 때만 다시 씁니다.
+        그보다 적게 바뀌었다면 다음 시작 때 그 주제들만 txt에서 다시 읽는 편이 더 쌉니다.
+        """
+        if self._pack_sources is not None:
+            signatures = self.index._signatures
+            stale_words = sum(self.index.topic_size(topic) for topic, signature in signatures.items()
+                              if self._pack_sources.get(topic) != signature)
+            removed = set(self._pack_sources) - set(signatures)
+            if stale_words * 10 > len(self.index) or removed:
+                topics = {topic: self.index.words_of(topic) for topic in self.index.topics() if topic in signatures}
+                write_pack(self.word_pack_path, topics, {topic: signatures[topic] for topic in topics})
+                self._pack_sources = dict(signatures)
+        # 이 프로세스가 직접 고친 뒤로 다른 프로세스가 뜻 사전을 바꾸지 않았을 때만 색인을 다시 저장합니다.
+        if self._lookup_dirty and self._lookup_source is not None and self._lookup_source == self._meanings_signature():
+            try:
+                self._lookup.save(self.lookup_snapshot_path, self._lookup_source)
+            except OSError as e:
+                print(f"⚠️ 검색 색인 스냅샷을 저장하지 못했습니다: {e}")
+                return
+            self._lookup_dirty = False
+
+    def _on_index_change(self, event, topic, word):
+        """색인 변경을 해당 단어 풀의 딜러들과 힌트 엔진에 전달합니다."""
+        if self._hints is not None and event in ('word_add', 'word_remove'):
+            self._hints.invalidate(len(word))
+        if event in ('topic_add', 'topic_remove'):
+            dealer = self.dealers.get(f"topic:{topic}")
+            if dealer is None:
+                return
+            dealer.add(word) if event == 'topic_add' else dealer.remove(word)
+            return
+        for pool, dealer in self.dealers.items():
+            if pool == "all":
+                matches = True
+            elif pool.startswith("len:"):
+                min_len, max_len = map(int, pool[4:].split('-'))
+                matches = min_len <= len(word) <= max_len
+            else:
+                continue
+            if matches:
+                dealer.add(word) if event == 'word_add' else dealer.remove(word)
+
+    def _deal(self, pool, words, sample=None, size=None):
+        """풀 이름에 해당하는 딜러에서 겹치지 않는 단어 하나를 뽑습니다.
+
+        sample(무작위 단어 하나)과 size(풀의 단어 수)를 주면 딜러를 만들기 전까지는 색인에서 바로 뽑습니다.
+        빈 풀에는 딜러를 만들지 않고, 딜러는 가장 오래 쓰지 않은 것부터 버립니다. 버린 풀의 나간 단어는
+        DealerLog에 남아 있으므로 다시 만들어도 순서가 이어집니다.
+        """
+        dealer = self.dealers.pop(pool, None)
+        if dealer is not None:
+            self.dealers[pool] = dealer  # 최근에 쓴 딜러를 맨 뒤로 옮깁니다.
+        elif size == 0:
+            return None
+        if dealer is None and sample is not None:
+            word = self._sample_undealt(pool, sample, size)
+            if word is not None:
+                count("dealer.sampled")
+                return word
+        if dealer is None:
+            count("dealer.cache_miss")
+            sampled = self._sampled.pop(pool, None)
+            dealt = sampled[0] if sampled else self.dealer_log.dealt_for(pool)
+            with timer("dealer.build"):
+                dealer = self.dealers[pool] = WordDealer(words(), dealt)
+            if len(self.dealers) > self.max_dealers:
+                evicted = next(iter(self.dealers))
+                del self.dealers[evicted]
+                count("dealer.evicted")
+        else:
+            count("dealer.cache_hit")
+        word, reset = dealer.draw()
+        if word is not None:
+            self.dealer_log.record(pool, word, reset)
+        return word
+
+    def _sample_undealt(self, pool, sample, size, tries=8):
+        """이번 순환에 아직 나가지 않은 단어를 색인에서 무작위로 뽑습니다.
+
+        풀 전체 목록으로 딜러를 만들지 않으므로 단어 목록이 아주 커도 첫 단어는 바로 나옵니다.
+        나간 단어가 풀의 절반에 이르면 겹치지 않는 단어를 찾기 어려워지므로 None을 돌려 딜러를 만들게 합니다.
+        """
+        entry = self._sampled.get(pool)
+        if entry is None:
+            dealt = list(self.dealer_log.dealt_for(pool))
+            entry = self._sampled[pool] = (dealt, set(dealt))
+        dealt, seen = entry
+        if len(seen) * 2 >= size:
+            return None
+        for _ in range(tries):
+            word = sample()
+            if word is None:
+                return None
+            if word not in seen:
+                dealt.append(word)
+                seen.add(word)
+                self.dealer_log.record(pool, word)
+                return word
+        return None
 
     def _ensure_files_exist(self):
         if not os.path.exists(self.word_lists_path):
             os.makedirs(self.word_lists_path)
         if not os.path.exists("data"):
             os.makedirs("data")
-        if not os.path.exists(self.my_wordbook_path):
-            with open(self.my_wordbook_path, 'w', encoding='utf-8') as f:
-                json.dump([], f)
-        if not os.path.exists(self.word_meaning_path):
+
+    def _ensure_sample_meanings(self):
+        if not os.path.exists(self.word_meaning_path) and not os.path.exists(self.word_meaning_db_path):
             sample_meanings = {
                 "apple": {"meaning": "사과", "example": "An apple a day keeps the doctor away."},
                 "banana": {"meaning": "바나나", "example": "Monkeys love to eat bananas."}
@@ -27,19 +215,13 @@ class WordManager:
                 json.dump(sample_meanings, f, ensure_ascii=False, indent=4)
 
     def get_word_list(self, filename):
-        try:
-            with open(os.path.join(self.word_lists_path, filename), 'r', encoding='utf-8') as f:
-                words = [line.strip().lower() for line in f if line.strip()]
-            return words
-        except FileNotFoundError:
-            return []
+        return self.index._read_topic(filename.split('.')[0])
 
     def get_available_topics(self):
-        try:
-            files = [f.split('.')[0] for f in os.listdir(self.word_lists_path) if f.endswith('.txt')]
-            return sorted(files)
-        except FileNotFoundError:
-            return []
+        return self._corpus().topics()
+
+    def has_topic(self, topic):
+        return self._corpus().has_topic(topic)
 
     def create_topic(self, topic_name):
         """새로운 주제(.txt 파일)를 생성합니다."""
@@ -50,8 +232,10 @@ class WordManager:
         if os.path.exists(filepath):
             print(f"⚠️ '{topic_name}' 주제는 이미 존재합니다.")
             return
+        index = self._corpus()
         with open(filepath, 'w', encoding='utf-8') as f:
             pass
+        index.add_topic(topic_name)
         print(f"✅ 새로운 주제 '{topic_name}'이(가) 성공적으로 추가되었습니다.")
         print("   이제 '단어 추가하기' 메뉴에서 새 주제에 단어를 추가할 수 있습니다.")
 
@@ -64,43 +248,74 @@ class WordManager:
         if not os.path.exists(filepath):
             print(f"⚠️ '{topic_name}' 주제를 찾을 수 없습니다.")
             return
+        index = self._corpus()
         try:
             os.remove(filepath)
+            index.tombstones.discard(topic_name)
+            index.remove_topic(topic_name)
+            self.dealers.pop(f"topic:{topic_name}", None)
+            self._sampled.pop(f"topic:{topic_name}", None)
             print(f"✅ 주제 '{topic_name}'이(가) 성공적으로 삭제되었습니다.")
         except OSError as e:
             print(f"⚠️ 파일을 삭제하는 중 오류가 발생했습니다: {e}")
 
+    @timed("words.get_by_topic")
     def get_word_by_topic(self, topic):
-        words = self.get_word_list(f"{topic}.txt")
-        return random.choice(words) if words else None
+        index = self._corpus()
+        return self._deal(f"topic:{topic}", lambda: index.words_of(topic),
+                          lambda: index.sample_topic(topic), index.topic_size(topic))
 
     def get_word_by_level(self, level):
-        level_lengths = {'초급': (3, 5), '중급': (6, 8), '고급': (9, 99)}
-        if level not in level_lengths:
+        if level not in LEVEL_LENGTHS:
             return None
-        min_len, max_len = level_lengths[level]
-        all_words = self._get_all_words()
-        if not all_words:
+        min_len, max_len = LEVEL_LENGTHS[level]
+        return self.get_word_by_length(min_len, max_len)
+
+    @timed("words.get_by_length")
+    def get_word_by_length(self, min_len, max_len):
+        """글자 수가 min_len 이상 max_len 이하인 단어를 무작위로 고릅니다."""
+        index = self._corpus()
+        if not len(index):
+            eligible_words = [word for word in self._get_all_words() if min_len <= len(word) <= max_len]
+            return random.choice(eligible_words) if eligible_words else None
+        # 같은 단어들을 고르는 범위는 한 풀을 쓰도록 실제로 있는 글자 수로 좁힙니다. (1-100과 3-12가 같은 풀)
+        span = index.length_range(min_len, max_len)
+        if span is None:
             return None
-        eligible_words = [word for word in all_words if min_len <= len(word) <= max_len]
-        return random.choice(eligible_words) if eligible_words else None
+        min_len, max_len = span
+        return self._deal(f"len:{min_len}-{max_len}", lambda: index.words_in_lengths(min_len, max_len),
+                          lambda: index.sample(min_len, max_len), index.count(min_len, max_len))
+
+    def hint_engine(self):
+        """힌트로 공개할 칸을 고르는 엔진입니다. 처음 힌트를 고를 때 만듭니다."""
+        if self._hints is None:
+            from hint_engine import HintEngine
+
+            self._hints = HintEngine(self._corpus())
+        return self._hints
+
+    def topic_of(self, word):
+        """단어가 속한 주제 하나를 돌려줍니다. 여러 주제에 있으면 이름순으로 첫 번째, 없으면 None입니다."""
+        topics = self.index.topics_of(word)
+        return min(topics) if topics else None
 
     def _get_all_words(self):
-        all_words = []
-        topics = self.get_available_topics()
-        for topic in topics:
-            all_words.extend(self.get_word_list(f"{topic}.txt"))
+        all_words = self._corpus().all_words()
         if not all_words:
             print("\n🔔 사용자 단어 목록이 없어, 기본 단어 목록으로 게임을 시작합니다.")
-            all_words = ['apple', 'banana', 'python', 'game', 'student', 'teacher']
-        return list(set(all_words))
+            all_words = list(DEFAULT_WORDS)
+        return all_words
 
+    @timed("words.get_random")
     def get_random_word(self):
-        all_words = self._get_all_words()
-        return random.choice(all_words) if all_words else None
+        index = self._corpus()
+        if not len(index):
+            return random.choice(self._get_all_words())
+        return self._deal("all", index.all_words, index.sample, index.count())
 
     def manage_words(self):
         # [수정] 주제 추가/삭제 및 뒤로가기 기능이 통합된 메뉴
+        self._corpus(force=True)  # 관리 메뉴에 들어올 때는 간격과 관계없이 주제 파일을 다시 확인합니다.
         while True:
             print("\n[📖 단어/주제 관리]")
             print("1. 단어 추가하기")
@@ -108,7 +323,8 @@ class WordManager:
             print("3. 전체 단어 목록 보기")
             print("4. 새로운 주제 추가하기 ✨")
             print("5. 주제 삭제하기 🗑️")
-            print("6. 돌아가기")
+            print("6. 단어 뜻/예문 JSON으로 내보내기")
+            print("7. 돌아가기")
             choice = input(">> 선택: ")
 
             if choice == '1':
@@ -145,10 +361,13 @@ class WordManager:
                 if not topic_to_delete: continue
                 self.delete_topic(topic_to_delete)
             elif choice == '6':
+                self.export_meanings()
+            elif choice == '7':
                 break
             else:
                 print("⚠️ 잘못된 입력입니다.")
 
+    @timed("words.add")
     def add_word(self, topic, word, meaning, example):
         if not word.isalpha():
             print("⚠️ 알파벳으로만 구성된 단어를 입력해주세요.")
@@ -157,112 +376,294 @@ class WordManager:
         if not os.path.exists(filepath):
             print(f"⚠️ '{topic}' 주제를 찾을 수 없습니다. '주제 추가하기' 메뉴로 먼저 주제를 만들어주세요.")
             return
-        existing_words = self.get_word_list(f"{topic}.txt")
-        if word in existing_words:
-            print(f"⚠️ 단어 '{word}'은(는) 이미 주제 '{topic}'에 존재합니다.")
-            return
-        with open(filepath, 'a', encoding='utf-8') as f:
-            f.write(f"\n{word}")
+        # 전체 새로 고침은 잠금 밖에서 하고, 잠금 안에서는 이 주제만 다시 확인합니다.
+        # 중복 확인부터 덧붙이기까지 배타 잠금 안에서 처리해 다른 프로세스와 겹치지 않게 합니다.
+        index = self._corpus()
+        with index.tombstones.lock(topic).exclusive():
+            index.refresh_topic(topic)
+            if topic in index.topics_of(word):
+                print(f"⚠️ 단어 '{word}'은(는) 이미 주제 '{topic}'에 존재합니다.")
+                return
+            with open(filepath, 'a', encoding='utf-8') as f:
+                f.write(f"\n{word}")
+            self.index.add(topic, word)
+            self.index.touch(topic)
         print(f"✅ 주제 '{topic}'에 단어 '{word}'이(가) 추가되었습니다.")
-        try:
-            with open(self.word_meaning_path, 'r', encoding='utf-8') as f:
-                meanings_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            meanings_data = {}
-        meanings_data[word] = {"meaning": meaning, "example": example}
-        with open(self.word_meaning_path, 'w', encoding='utf-8') as f:
-            json.dump(meanings_data, f, ensure_ascii=False, indent=4)
+        self.meanings.upsert(word, meaning, example)
+        self.index_meanings([word])
         print(f"✅ '{word}'의 뜻과 예문 정보가 저장되었습니다.")
 
+    @timed("words.delete")
     def delete_word(self, topic, word_to_delete):
+        """주제 파일은 그대로 두고 삭제 기록(.tomb)에 한 줄을 덧붙입니다. 파일 정리는 기록이 쌓이면 따로 합니다."""
         filepath = os.path.join(self.word_lists_path, f"{topic}.txt")
-        deleted_from_txt = False
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                words = [line.strip() for line in f if line.strip()]
-            if word_to_delete in words:
-                words.remove(word_to_delete)
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    for word in words:
-                        f.write(f"{word}\n")
-                print(f"✅ 주제 '{topic}'에서 단어 '{word_to_delete}'을(를) 삭제했습니다.")
-                deleted_from_txt = True
-            else:
-                print(f"⚠️ 주제 '{topic}'에 '{word_to_delete}' 단어가 존재하지 않습니다.")
-        except FileNotFoundError:
+        if not os.path.exists(filepath):
             print(f"⚠️ '{topic}'이라는 주제(파일)를 찾을 수 없습니다.")
-        if deleted_from_txt:
-            try:
-                with open(self.word_meaning_path, 'r', encoding='utf-8') as f:
-                    meanings_data = json.load(f)
-                if word_to_delete in meanings_data:
-                    del meanings_data[word_to_delete]
-                    with open(self.word_meaning_path, 'w', encoding='utf-8') as f:
-                        json.dump(meanings_data, f, ensure_ascii=False, indent=4)
-                    print(f"✅ '{word_to_delete}'의 뜻과 예문 정보가 삭제되었습니다.")
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass
+            return
+        word = word_to_delete.lower()
+        index = self._corpus()
+        with index.tombstones.lock(topic).exclusive():
+            index.refresh_topic(topic)
+            if not index.in_topic(topic, word):
+                print(f"⚠️ 주제 '{topic}'에 '{word_to_delete}' 단어가 존재하지 않습니다.")
+                return
+            self.index.tombstones.add(topic, word)
+            self.index.remove(topic, word)
+            self.index.touch(topic)
+        print(f"✅ 주제 '{topic}'에서 단어 '{word_to_delete}'을(를) 삭제했습니다.")
+        if self.meanings.delete(word_to_delete):
+            if self._lookup is not None:
+                self._lookup.remove(word_to_delete)
+                self._lookup_changed()
+            elif self._lookup_build is not None:
+                self._lookup_pending.append(('remove', word_to_delete))
+            print(f"✅ '{word_to_delete}'의 뜻과 예문 정보가 삭제되었습니다.")
 
     def view_all_words(self):
-        topics = self.get_available_topics()
-        if not topics:
-            print("⚠️ 추가된 단어가 없습니다.")
-            return
-        for topic in topics:
-            words = self.get_word_list(f"{topic}.txt")
+        """주제별 단어를 출력합니다. 다시 읽어야 하는 주제는 전부 기다리지 않고 읽히는 대로 바로 출력합니다."""
+        if self._pack_sources is None:
+            self._load_pack()
+        found = False
+        self._refreshed_at = time.monotonic()
+        for topic in self.index.refresh_iter():
+            found = True
+            words = self.index.words_of(topic)
             if words:
                 print(f"\n--- 주제: {topic} ---")
                 print(', '.join(words))
+        if not found:
+            print("⚠️ 추가된 단어가 없습니다.")
 
-    def show_word_meaning(self, word):
+    def lookup_index(self, wait=True):
+        """뜻 사전의 접두어/오타 검색 색인입니다. 처음 필요할 때 스냅샷에서 불러오고 이후로는 증분으로 고칩니다.
+
+        스냅샷이 없거나 뜻 사전과 맞지 않으면 백그라운드 스레드에서 새로 만들어 스냅샷으로 저장합니다.
+        wait이 False이면 다 만들어질 때까지 기다리지 않고 None을 돌려줍니다.
+        """
+        if self._lookup is not None:
+            count("lookup.cache_hit")
+            return self._lookup
+        count("lookup.cache_miss")
+        if self._lookup_build is None:
+            from lookup_index import LookupIndex
+
+            self.meanings  # 뜻 사전 파일이 있어야 서명을 잴 수 있습니다.
+            source = self._meanings_signature()
+            with timer("lookup.load_snapshot"):
+                lookup = LookupIndex.load(self.lookup_snapshot_path, source)
+            if lookup is not None:
+                self._lookup, self._lookup_source = lookup, source
+                return lookup
+            self._lookup_build = threading.Thread(target=self._build_lookup, args=(source,),
+                                                  name="lookup-build", daemon=True)
+            self._lookup_build.start()
+        if wait:
+            self._lookup_build.join()
+        if self._lookup_build.is_alive():
+            return None
+        if self._lookup_built is None:
+            # 만들다 실패했으면 색인 없이 진행하고, 다음에 필요할 때 다시 만들어 봅니다.
+            self._lookup_build = None
+            self._lookup_pending = []
+            return None
+        return self._adopt_lookup()
+
+    def _build_lookup(self, source):
+        """백그라운드 스레드에서 뜻 사전의 단어로 색인을 만들고 스냅샷으로 저장합니다.
+
+        sqlite 연결은 만든 스레드에서만 쓸 수 있으므로 이 스레드에서 따로 엽니다.
+        """
+        from lookup_index import LookupIndex
+        from meaning_store import MeaningStore
+
+        try:
+            store = MeaningStore(self.word_meaning_db_path, self.word_meaning_path)
+            try:
+                words = store.words()
+            finally:
+                store.close()
+            with timer("lookup.build"):
+                lookup = LookupIndex(words)
+        except Exception as e:
+            count("lookup.build_errors")
+            print(f"⚠️ 검색 색인을 만들지 못했습니다: {type(e).__name__}: {e}")
+            return
+        # 스냅샷 저장이 실패해도 만든 색인은 씁니다. 저장은 종료 때 save_snapshots()가 다시 해 봅니다.
+        self._lookup_built = (lookup, source, False)
         try:
-            with open(self.word_meaning_path, 'r', encoding='utf-8') as f:
-                meanings = json.load(f)
-            info = meanings.get(word.lower())
-            if info:
-                print(f"\n--- '{word}' 단어 정보 ---")
-                print(f"뜻: {info['meaning']}")
-                print(f"예문: {info['example']}")
+            lookup.save(self.lookup_snapshot_path, source)
+        except OSError as e:
+            count("lookup.save_errors")
+            print(f"⚠️ 검색 색인 스냅샷을 저장하지 못했습니다: {e}")
+            return
+        self._lookup_built = (lookup, source, True)
+
+    def _adopt_lookup(self):
+        """다 만든 색인을 쓰기 시작합니다. 만드는 동안 추가·삭제된 단어를 이어서 반영합니다."""
+        lookup, source, saved = self._lookup_built
+        self._lookup, self._lookup_source = lookup, source
+        self._lookup_dirty = not saved
+        self._lookup_build = self._lookup_built = None
+        pending, self._lookup_pending = self._lookup_pending, []
+        for action, word in pending:
+            lookup.add(word) if action == 'add' else lookup.remove(word)
+        if pending:
+            self._lookup_changed()
+        return lookup
+
+    def index_meanings(self, words):
+        """새로 뜻이 저장된 단어들을 검색 색인에 반영합니다. (색인을 아직 만들지 않았다면 할 일이 없습니다)"""
+        if self._lookup is not None:
+            for word in words:
+                self._lookup.add(word)
+            self._lookup_changed()
+        elif self._lookup_build is not None:
+            self._lookup_pending.extend(('add', word) for word in words)
+
+    def _lookup_changed(self):
+        # 방금 쓴 뜻 사전의 서명을 기억해 두면, 종료 때 그 사이 다른 프로세스가 고쳤는지 알 수 있습니다.
+        self._lookup_dirty = True
+        self._lookup_source = self._meanings_signature()
+
+    def _meanings_signature(self):
+        """뜻 사전 파일의 (mtime_ns, size)입니다. 검색 색인 스냅샷이 어느 시점의 사전을 반영했는지 나타냅니다."""
+        try:
+            stat = os.stat(self.word_meaning_db_path)
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    @timed("words.show_meaning")
+    def show_word_meaning(self, word):
+        word = word.strip()
+        if word.endswith('*'):
+            # 검색 색인을 아직 만드는 중이면 sqlite의 기본 키 색인으로 찾습니다.
+            lookup = self.lookup_index(wait=False)
+            completions = lookup.complete(word[:-1]) if lookup is not None else self.meanings.complete(word[:-1].lower())
+            if completions:
+                print(f"\n'{word[:-1]}'(으)로 시작하는 단어: {', '.join(completions)}")
             else:
-                print(f"⚠️ '{word}' 단어의 정보를 찾을 수 없습니다.")
+                print(f"⚠️ '{word[:-1]}'(으)로 시작하는 단어가 없습니다.")
+            return
+        with timer("meanings.get"):
+            info = self.meanings.get(word)
+        count("meanings.hit" if info else "meanings.miss")
+        if info:
+            print(f"\n--- '{word}' 단어 정보 ---")
+            print(f"뜻: {info['meaning']}")
+            print(f"예문: {info['example']}")
+            return
+        print(f"⚠️ '{word}' 단어의 정보를 찾을 수 없습니다.")
+        lookup = self.lookup_index(wait=False)
+        if lookup is None:
+            print("   (비슷한 단어를 찾는 색인을 준비하고 있습니다. 잠시 뒤에 다시 찾아보세요.)")
+            suggestions = []
+            completions = self.meanings.complete(word.lower(), 5)
+        else:
+            suggestions = lookup.suggest(word)
+            completions = [item for item in lookup.complete(word, 5) if item not in suggestions]
+        if suggestions:
+            print(f"   혹시 이 단어를 찾으셨나요? {', '.join(suggestions)}")
+        if completions:
+            print(f"   '{word}'(으)로 시작하는 단어: {', '.join(completions)}")
+
+    def export_meanings(self):
+        count = self.meanings.export_json(self.word_meaning_path)
+        print(f"✅ 단어 {count}개의 뜻과 예문을 '{self.word_meaning_path}'(으)로 내보냈습니다.")
+
+    def _read_wordbook_file(self):
+        try:
+            with self.wordbook_lock.shared(), open(self.my_wordbook_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
-            print("⚠️ 단어 정보 파일이 없거나 손상되었습니다.")
+            return []
+
+    def _load_wordbook(self, refresh=False):
+        """단어장을 돌려줍니다. refresh면 다른 프로세스가 추가한 단어도 합쳐 옵니다."""
+        with self._wordbook_guard:
+            if self._wordbook is not None and not refresh:
+                return self._wordbook
+        # 잠금 순서는 어디서나 wordbook_lock -> _wordbook_guard이므로 파일은 _wordbook_guard 밖에서 읽습니다.
+        on_disk = self._read_wordbook_file()
+        with self._wordbook_guard:
+            seen = set(on_disk)
+            mine = [word for word in self._wordbook or () if word not in seen]
+            if self._wordbook is None:
+                self._wordbook = on_disk + mine
+            else:
+                # 다른 스레드가 들고 있는 목록에 덧붙인 단어를 잃지 않도록 같은 목록을 고칩니다.
+                self._wordbook[:] = on_disk + mine
+            return self._wordbook
+
+    def _write_wordbook(self, fsync=False):
+        """파일의 단어장과 메모리의 단어장을 합쳐 배타 잠금 안에서 한 번에 바꿔 씁니다."""
+        with self.wordbook_lock.exclusive():
+            wordbook = self._load_wordbook(refresh=True)
+            with self._wordbook_guard:
+                data = json.dumps(list(wordbook), ensure_ascii=False, indent=4)
+            atomic_write(self.my_wordbook_path, data, fsync)
 
     def add_to_my_wordbook(self, word):
-        with open(self.my_wordbook_path, 'r+', encoding='utf-8') as f:
-            try:
-                wordbook = json.load(f)
-            except json.JSONDecodeError:
-                wordbook = []
-            if word not in wordbook:
-                wordbook.append(word)
-                f.seek(0)
-                f.truncate()
-                json.dump(wordbook, f, ensure_ascii=False, indent=4)
-                print(f"✔️ '{word}'을(를) 나만의 단어장에 추가했습니다.")
+        """단어장은 메모리에서 바로 고치고, 파일 쓰기는 WriteBehind에 맡깁니다."""
+        wordbook = self._load_wordbook()
+        with self._wordbook_guard:
+            if word in wordbook:
+                return
+            wordbook.append(word)
+        self.writer.mark(self.my_wordbook_path, self._write_wordbook)
+        if self._reviews is not None:
+            self._reviews.add(word)
+        print(f"✔️ '{word}'을(를) 나만의 단어장에 추가했습니다.")
+
+    def review_queue(self, refresh=False):
+        """단어장의 복습 일정입니다. 처음 열 때 단어장에만 있고 일정이 없는 단어를 바로 복습할 카드로 넣습니다.
+
+        그 뒤로는 add_to_my_wordbook()이 한 단어씩 넣으므로 복습 한 번은 힙 연산만 합니다.
+        refresh면 다른 프로세스가 단어장에 추가한 단어도 다시 합칩니다.
+        """
+        if self._reviews is None:
+            from srs import ReviewQueue
+
+            self._reviews = ReviewQueue(self.reviews_path)
+            refresh = True
+        if refresh:
+            self._reviews.add_many(self._load_wordbook(refresh=True))
+        return self._reviews
+
+    def next_review_word(self):
+        """지금 복습할 차례인 단어를 돌려줍니다. 없으면 None입니다."""
+        return self.review_queue().next_due()
+
+    def record_review(self, word, quality):
+        return self.review_queue().review(word, quality)
 
     def manage_my_wordbook(self):
         try:
-            with open(self.my_wordbook_path, 'r', encoding='utf-8') as f:
-                wordbook = json.load(f)
-            if not wordbook:
+            # 어차피 모든 카드를 나열하므로 다른 프로세스가 추가한 단어도 여기서 합칩니다.
+            reviews = self.review_queue(refresh=True)
+            if not len(reviews):
                 print("\n텅 비어있습니다. 게임에서 단어를 틀리면 자동으로 추가됩니다.")
                 return
-            print("\n[📚 나만의 단어장]")
-            sorted_wordbook = sorted(wordbook)
-            for i, word in enumerate(sorted_wordbook, 1):
-                print(f"{i}. {word}")
+            from srs import describe_due
+
+            now = time.time()
+            print(f"\n[📚 나만의 단어장] 지금 복습할 단어 {reviews.due_count(now)}개")
+            # 복습 시각 색인을 따라 읽으므로 열 때마다 다시 정렬하지 않습니다.
+            words = []
+            for i, (word, due) in enumerate(reviews.upcoming(), 1):
+                words.append(word)
+                print(f"{i}. {word} (복습: {describe_due(due, now)})")
             while True:
                 choice = input("\n단어의 뜻을 보려면 번호를, 돌아가려면 'q'를 입력하세요: ")
                 if choice.lower() == 'q':
                     break
                 try:
                     index = int(choice) - 1
-                    if 0 <= index < len(sorted_wordbook):
-                        self.show_word_meaning(sorted_wordbook[index])
+                    if 0 <= index < len(words):
+                        self.show_word_meaning(words[index])
                     else:
                         print("⚠️ 잘못된 번호입니다.")
                 except ValueError:
                     print("⚠️ 숫자 또는 'q'를 입력해주세요.")
         except (FileNotFoundError, json.JSONDecodeError):
-            print("⚠️ 단어장 파일을 찾을 수 없거나 파일이 비어있습니다.")
\ No newline at end of file
+            print("⚠️ 단어장 파일을 찾을 수 없거나 파일이 비어있습니다.")
@@ -0,0 +1,157 @@
+# word_pack.py
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"HWPK"
+VERSION = 1
+# magic, version, byteorder(0=little, 1=big), word_count, length_count, member_count, meta_size, blob_size
+HEADER = struct.Struct("<4sHHIIIII")
+NATIVE_ORDER = 0 if sys.byteorder == "little" else 1
+
+
+def _pad(size):
+    return (-size) % 4
+
+
+def compile_pack(word_lists_path, pack_path):
+    """word_lists의 txt 주제 파일들을 하나의 단어 팩 파일로 컴파일하고, 단어 수를 돌려줍니다."""
+    from word_index import CorpusIndex
+
+    index = CorpusIndex(word_lists_path)
+    _, sources = index._scan()
+    words = dict(index.read_topics(sources))
+    topics = {topic: words[topic] for topic in sorted(sources)}
+    return write_pack(pack_path, topics, sources)
+
+
+def write_pack(pack_path, topics, sources):
+    """주제 -> 단어 목록과 주제 -> 원본 서명으로 단어 팩 파일을 쓰고, 단어 수를 돌려줍니다.
+
+    파일 구성 (헤더 뒤 모든 구간은 4바이트 정렬):
+      meta JSON    주제 이름, 주제별 members 구간, 원본 txt 파일의 (mtime_ns, size)
+      offsets      uint32 × (단어 수 + 1)  각 단어가 blob에서 시작하는 위치
+      by_length    uint32 × 단어 수        글자 수 순으로 정렬한 단어 번호
+      lengths      uint32 × 2 × 글자 수 종류  (글자 수, by_length 안 시작 위치)
+      members      uint32 × 주제 단어 수   주제별 단어 번호 (파일 순서)
+      blob         '\\n'으로 이어 붙인 UTF-8 단어들 (단어는 한 번만 저장)
+    """
+    sources = {topic: list(signature) for topic, signature in sources.items()}
+    words = sorted({word for topic_words in topics.values() for word in topic_words})
+    ids = {word: i for i, word in enumerate(words)}
+    encoded = [word.encode('utf-8') for word in words]
+
+    offsets = array('I', [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data) + 1)
+    blob = b"\n".join(encoded) + b"\n" if encoded else b""
+
+    by_length = array('I', sorted(range(len(words)), key=lambda i: (len(words[i]), i)))
+    lengths = array('I')
+    for position, word_id in enumerate(by_length):
+        length = len(words[word_id])
+        if not lengths or lengths[-2] != length:
+            lengths.extend((length, position))
+
+    members = array('I')
+    topic_table = []
+    for topic, topic_words in topics.items():
+        topic_table.append([topic, len(members), len(topic_words)])
+        members.extend(ids[word] for word in topic_words)
+
+    meta = json.dumps({"topics": topic_table, "sources": sources}, ensure_ascii=False).encode('utf-8')
+    header = HEADER.pack(MAGIC, VERSION, NATIVE_ORDER, len(words), len(lengths) // 2, len(members), len(meta), len(blob))
+
+    tmp_path = f"{pack_path}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(pack_path) or ".", exist_ok=True)
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(meta + b"\0" * _pad(len(meta)))
+        for section in (offsets, by_length, lengths, members):
+            f.write(section.tobytes())
+        f.write(blob)
+    os.replace(tmp_path, pack_path)
+    return len(words)
+
+
+class WordPack:
+    """컴파일된 단어 팩을 mmap으로 열어 구간별 memoryview로 보여 줍니다.
+
+    CorpusIndex.load_pack()이 이 구간들을 한 번에 복사해 가므로 단어를 하나씩 파싱하지 않습니다.
+    """
+
+    def __init__(self, pack_path):
+        self.path = pack_path
+        with open(pack_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = self._view = memoryview(self._mmap)
+        magic, version, order, word_count, length_count, member_count, meta_size, blob_size = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION or order != NATIVE_ORDER:
+            raise ValueError("지원하지 않는 단어 팩 형식입니다.")
+        position = HEADER.size
+        # 잘린 파일은 구간을 자르다 TypeError나 IndexError가 나기 전에 크기만 보고 거릅니다.
+        size = position + meta_size + _pad(meta_size) + (2 * word_count + 1 + 2 * length_count + member_count) * 4
+        if size + blob_size != len(view):
+            raise ValueError("단어 팩 파일의 크기가 헤더와 맞지 않습니다.")
+        meta = json.loads(bytes(view[position:position + meta_size]))
+        position += meta_size + _pad(meta_size)
+
+        def section(count):
+            nonlocal position
+            part = view[position:position + count * 4].cast('I')
+            position += count * 4
+            return part
+
+        self.offsets = section(word_count + 1)
+        self.by_length = section(word_count)
+        lengths = section(length_count * 2)
+        self.lengths = [lengths[i] for i in range(0, len(lengths), 2)]
+        self.length_starts = [lengths[i] for i in range(1, len(lengths), 2)] + [word_count]
+        self.members = section(member_count)
+        self.blob = view[position:position + blob_size]
+        self.topic_table = {topic: (start, count) for topic, start, count in meta["topics"]}
+        self.sources = {topic: tuple(signature) for topic, signature in meta["sources"].items()}
+
+    def __len__(self):
+        return len(self.by_length)
+
+    def words(self):
+        """모든 단어를 번호 순서대로 한 번에 디코딩합니다."""
+        return bytes(self.blob).decode('utf-8').split("\n")[:len(self)]
+
+    def topics(self):
+        return sorted(self.topic_table)
+
+    def topic_ids(self, topic):
+        start, count = self.topic_table.get(topic, (0, 0))
+        return self.members[start:start + count]
+
+    def close(self):
+        for part in (self.offsets, self.by_length, self.members, self.blob, self._view):
+            part.release()
+        self._mmap.close()
+
+
+def open_pack(pack_path):
+    """단어 팩이 있으면 열고, 없거나 형식이 맞지 않으면 None을 돌려줍니다. (그러면 txt에서 다시 만듭니다)"""
+    try:
+        return WordPack(pack_path)
+    except (FileNotFoundError, ValueError, struct.error, TypeError, IndexError, KeyError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="word_lists의 txt 주제 파일들을 단어 팩으로 컴파일합니다.")
+    parser.add_argument("--word-lists", default="word_lists", help="주제 파일 폴더 (기본값: word_lists)")
+    parser.add_argument("--output", default="data/words.pack", help="만들 단어 팩 경로 (기본값: data/words.pack)")
+    args = parser.parse_args(argv)
+    count = compile_pack(args.word_lists, args.output)
+    print(f"✅ 단어 {count}개를 '{args.output}'(으)로 컴파일했습니다.")
+
+
+if __name__ == "__main__":
+    main()